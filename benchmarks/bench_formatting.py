@@ -0,0 +1,47 @@
+"""Text rendering of many phasors with formatPhasors/formatSequences against str() of every object.
+
+Run from the repository root with ``python benchmarks/bench_formatting.py``.
+"""
+
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import numpy as np
+from Phasor.formatting import formatPhasors, formatSequences
+from Phasor.phasor import PhasorPD, PhasorPR, PhasorRe
+from Phasor.sc import UtoSC, batchUtoSC
+
+
+def timed(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    rows = 10**6
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=rows) + 1j * rng.normal(size=rows)
+    scalars = values.tolist()
+
+    print(f"{rows} phasors{'str() loop':>16}{'formatPhasors':>16}{'speedup':>10}")
+    for form, scalar in (("PD", PhasorPD), ("PR", PhasorPR), ("Re", PhasorRe)):
+        loop = timed(lambda: "\n".join([str(scalar._fromComplex(i)) for i in scalars]))
+        batch = timed(lambda: formatPhasors(values, form))
+        print(f"  {form:<14}{loop:>14.3f} s{batch:>14.3f} s{loop / batch:>9.1f}x")
+
+    sets = 10**4
+    phases = values[:3 * sets].reshape(sets, 3)
+    results = [UtoSC(*(PhasorRe(i) for i in sample)) for sample in phases.tolist()]
+    loop = timed(lambda: "".join([str(i) for i in results]))
+    batch = timed(lambda: formatSequences(batchUtoSC(phases), phases=True))
+    print(f"\n{sets} UtoSC results, nine phasors each")
+    print(f"  str() loop {loop:.3f} s, formatSequences {batch:.3f} s, {loop / batch:.1f}x")
+
+    file = io.StringIO()
+    written = timed(lambda: formatPhasors(values.reshape(-1, 4), separator=",", file=file, chunkSize=1 << 14))
+    print(f"\nCSV of {rows} phasors written in chunks: {written:.3f} s, {len(file.getvalue()) / 1e6:.1f} MB")
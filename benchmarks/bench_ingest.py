@@ -0,0 +1,68 @@
+"""Ingestion of many live 60 frames per second PMU streams over local TCP in one process.
+
+Run from the repository root with ``python benchmarks/bench_ingest.py [streams] [seconds]``.
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import numpy as np
+from Phasor.c37118 import PHASOR_FLOAT, checksums, frameType
+from Phasor.ingest import openTCPStream
+
+RATE = 60
+
+
+def dataFrames(count):
+    """Return count data frames of a rotating balanced three phase system."""
+    index = np.arange(count)
+    data = np.zeros(count, dtype=frameType(3, PHASOR_FLOAT))
+    data["sync"], data["framesize"], data["soc"] = 0xAA01, data.dtype.itemsize, 1700000000 + index // RATE
+    data["fracsec"] = index % RATE * 1000000 // RATE
+    phasors = np.exp(1j * (np.array([0, -2, 2]) * np.pi / 3 + index[:, None] * 0.01))
+    data["phasors"]["real"], data["phasors"]["imag"] = phasors.real, phasors.imag
+    data["chk"] = checksums(data)
+    return [i.tobytes() for i in data]
+
+
+async def pmu(reader, writer, data):
+    """Send the frames at RATE per second."""
+    start = time.perf_counter()
+    for index, frame in enumerate(data):
+        await asyncio.sleep(max(0.0, start + index / RATE - time.perf_counter()))
+        writer.write(frame)
+    await writer.drain()
+    writer.close()
+
+
+async def main(streams=48, seconds=3.0):
+    data = dataFrames(int(seconds * RATE))
+    servers = [await asyncio.start_server(lambda r, w: pmu(r, w, data), "127.0.0.1", 0) for _ in range(streams)]
+    ports = [server.sockets[0].getsockname()[1] for server in servers]
+    connections = [await openTCPStream("127.0.0.1", port, format=PHASOR_FLOAT, batchSize=8, maxDelay=0.002) for port in ports]
+
+    async def consume(stream):
+        async for times, components in stream:
+            pass
+
+    cpu = time.process_time()
+    await asyncio.gather(*map(consume, connections))
+    cpu = time.process_time() - cpu
+    for server in servers:
+        server.close()
+
+    frames = sum(stream.frames for stream in connections)
+    latency = np.mean([stream.latency for stream in connections])
+    worst = max(stream.maxLatency for stream in connections)
+    busy = sum(stream.busyTime for stream in connections)
+    print(f"{streams} streams at {RATE} fps for {seconds} s: {frames} frames, {sum(stream.dropped for stream in connections)} dropped")
+    print(f"mean latency {latency * 1e3:.2f} ms, worst {worst * 1e3:.2f} ms")
+    print(f"transform time {busy * 1e3:.1f} ms, process CPU {cpu:.2f} s (including the fake PMUs)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(*(float(i) if "." in i else int(i) for i in sys.argv[1:])))
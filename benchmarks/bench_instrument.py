@@ -0,0 +1,56 @@
+"""Overhead of the instrumentation: latency of hot operations never instrumented, enabled, and disabled again.
+
+Run from the repository root with ``python benchmarks/bench_instrument.py``. The "disabled" column should
+match the "baseline" column since disabling puts the original functions back.
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import numpy as np
+from Phasor import conversions, instrument, sc
+from Phasor.phasor import PhasorArray, PhasorPD, PhasorRe
+
+STATEMENTS = {
+    "PhasorPD a + b": "a + b",
+    "PhasorRe c * d": "c * d",
+    "PhasorArray x * y": "x * y",
+    "PolarDegreeToRectangle": "conversions.PolarDegreeToRectangle(100, 45)",
+    "UtoSC": "sc.UtoSC(a, a, b)",
+    "batchUtoSC[n=1000]": "sc.batchUtoSC(phases)",
+}
+
+
+def latency(statement, namespace, number=5000):
+    """Return the best per-call latency of a statement in microseconds."""
+    timer = timeit.Timer(statement, globals=namespace)
+    return min(timer.repeat(5, number)) / number * 1e6
+
+
+def measureAll(namespace):
+    return {name: latency(statement, namespace) for name, statement in STATEMENTS.items()}
+
+
+def main():
+    namespace = {
+        "conversions": conversions, "sc": sc,
+        "a": PhasorPD(100, 45), "b": PhasorPD(90, -120), "c": PhasorRe(3+4j), "d": PhasorRe(1-2j),
+        "x": PhasorArray(np.ones(100) + 1j), "y": PhasorArray(np.ones(100) - 1j),
+        "phases": np.ones((1000, 3), dtype=complex),
+    }
+    baseline = measureAll(namespace)
+    with instrument.instrument():
+        enabled = measureAll(namespace)
+    disabled = measureAll(namespace)
+
+    width = max(len(name) for name in STATEMENTS)
+    print(f"{'operation':<{width}}  {'baseline':>10}  {'enabled':>10}  {'disabled':>10}")
+    for name in STATEMENTS:
+        print(f"{name:<{width}}  {baseline[name]:10.2f}  {enabled[name]:10.2f}  {disabled[name]:10.2f}  us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Eager versus lazy evaluation of chained PhasorArray arithmetic: time and peak memory.
+
+Run from the repository root with ``python benchmarks/bench_lazy.py``.
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import numpy as np
+from Phasor.lazy import lazy
+from Phasor.memory import profile
+from Phasor.phasor import PhasorArray
+
+
+def main(size=10**6):
+    rng = np.random.default_rng(0)
+    a, b, c, d = (PhasorArray(rng.normal(size=size) + 1j * rng.normal(size=size)) for _ in range(4))
+    x, y, z, w = lazy(a, b, c, d)
+    out = np.empty(size, dtype=complex)
+    cases = {
+        "eager (a + b) * c / d ** 2": lambda: (a + b) * c / d ** 2,
+        "lazy": lambda: ((x + y) * z / w ** 2).evaluate(),
+        "lazy, out=": lambda: ((x + y) * z / w ** 2).evaluate(out=out),
+    }
+    print(f"n = {size}")
+    for name, function in cases.items():
+        seconds = min(timeit.repeat(function, number=3, repeat=5)) / 3
+        peak = profile(function).peak
+        print(f"{name:<28}  {seconds * 1e3:8.2f} ms  peak {peak / 2**20:8.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
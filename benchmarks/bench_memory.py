@@ -0,0 +1,15 @@
+"""Memory footprint of every phasor representation and symmetrical component result.
+
+Run from the repository root with ``python benchmarks/bench_memory.py``.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from Phasor.memory import footprint, formatFootprint
+
+
+if __name__ == "__main__":
+    print(formatFootprint(footprint()))
@@ -0,0 +1,38 @@
+"""Nodal analysis of a radial feeder: factorization once, then many injection scenarios.
+
+Run from the repository root with ``python benchmarks/bench_network.py``.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import numpy as np
+from Phasor.network import Network
+
+
+def main(nodes=10000, scenarios=1000):
+    rng = np.random.default_rng(0)
+    network = Network(nodes)
+    parents = np.concatenate(([-1], rng.integers(0, np.arange(1, nodes))))
+    network.addBranches(np.arange(nodes), parents, rng.uniform(0.01, 0.1, nodes) * (1+2j))
+    network.addBranches(np.arange(nodes), np.full(nodes, -1), rng.uniform(50, 500, nodes) * (1+0.3j))
+    currents = rng.normal(size=(scenarios, nodes)) + 1j * rng.normal(size=(scenarios, nodes))
+
+    start = time.perf_counter()
+    network.factorize()
+    factorized = time.perf_counter()
+    network.solve(currents[0])
+    single = time.perf_counter()
+    network.solve(currents)
+    batch = time.perf_counter()
+    print(f"{nodes} nodes, {scenarios} scenarios")
+    print(f"factorization         {(factorized - start) * 1e3:10.2f} ms")
+    print(f"one scenario          {(single - factorized) * 1e3:10.2f} ms")
+    print(f"batch, per scenario   {(batch - single) / scenarios * 1e3:10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
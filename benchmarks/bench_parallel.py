@@ -0,0 +1,51 @@
+"""Scaling of SharedExecutor with the number of worker processes.
+
+Run from the repository root with ``python benchmarks/bench_parallel.py [rows]``. Inputs and outputs are
+allocated with SharedExecutor.array(), so the timings include no copies between processes.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import numpy as np
+from Phasor.conversions import PolarDegreeToRectangle
+from Phasor.parallel import SharedExecutor
+from Phasor.sc import batchUtoSC
+
+
+def timeMap(executor, function, *arrays, out, repeat=3):
+    """Return the best time of executor.map in seconds, after a warm-up call that starts the workers."""
+    executor.map(function, *arrays, out=out)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        executor.map(function, *arrays, out=out)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(rows=4 * 10**6):
+    counts = sorted({1, 2, 4, 8, 16, 32, 64} & set(range(1, (os.cpu_count() or 1) + 1)) | {1, 2})
+    print(f"{rows} rows, {os.cpu_count()} CPUs")
+    print(f"{'workers':>7}  {'batchUtoSC':>12}  {'speedup':>7}  {'PolarDegreeToRectangle':>22}  {'speedup':>7}")
+    reference = None
+    for workers in counts:
+        with SharedExecutor(workers, chunkSize=1 << 18) as executor:
+            phases = executor.array((rows, 3))
+            phases[...] = 1+1j
+            components = executor.array((rows, 3))
+            modulus, angle = executor.array(rows, float), executor.array(rows, float)
+            modulus[...], angle[...] = 2.0, 30.0
+            rectangular = executor.array(rows)
+            times = (timeMap(executor, batchUtoSC, phases, out=components),
+                     timeMap(executor, PolarDegreeToRectangle, modulus, angle, out=rectangular))
+            del phases, components, modulus, angle, rectangular
+        reference = reference or times
+        print(f"{workers:>7}  {times[0] * 1e3:9.1f} ms  {reference[0] / times[0]:6.2f}x  {times[1] * 1e3:19.1f} ms  {reference[1] / times[1]:6.2f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(i) for i in sys.argv[1:]))
@@ -0,0 +1,53 @@
+"""Newton-Raphson power flow of a synthetic meshed 2000 bus case: one solve, warm starts and snapshot batches.
+
+Run from the repository root with ``python benchmarks/bench_powerflow.py``.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import numpy as np
+from Phasor.network import Network
+from Phasor.powerflow import PowerFlow, PQ, PV, SLACK
+
+
+def case(buses, seed=0):
+    """Return a meshed network, the bus types and the bus power injections."""
+    rng = np.random.default_rng(seed)
+    network = Network(buses)
+    network.addBranches(np.arange(1, buses), rng.integers(0, np.arange(1, buses)), rng.uniform(0.002, 0.01, buses - 1) * (1+5j))
+    loops = buses // 5
+    network.addBranches(rng.integers(0, buses, loops), rng.integers(0, buses, loops), rng.uniform(0.01, 0.05, loops) * (1+5j))
+    network.addBranches(np.arange(buses), np.full(buses, -1), np.full(buses, -50j))
+    types = np.full(buses, PQ)
+    types[0] = SLACK
+    types[rng.choice(np.arange(1, buses), buses // 20, replace=False)] = PV
+    power = -(rng.uniform(0.0, 0.02, buses) + 1j * rng.uniform(0.0, 0.01, buses))
+    power[types == PV] += 0.05
+    return network, types, power
+
+
+def main(buses=2000, snapshots=64):
+    network, types, power = case(buses)
+    solver = PowerFlow(network, types, voltage=np.where(types == PQ, 1, 1.02))
+
+    start = time.perf_counter()
+    voltages = solver.solve(power)
+    print(f"{buses} buses, flat start      {(time.perf_counter() - start) * 1e3:8.1f} ms  {solver.iterations} iterations")
+    start = time.perf_counter()
+    solver.solve(power * 1.01, start=voltages)
+    print(f"{buses} buses, warm start      {(time.perf_counter() - start) * 1e3:8.1f} ms  {solver.iterations} iterations")
+
+    powers = power * np.linspace(0.9, 1.1, snapshots)[:, None]
+    for workers in sorted({1, 2, os.cpu_count() or 1}):
+        start = time.perf_counter()
+        solver.solveBatch(powers, workers=workers)
+        elapsed = time.perf_counter() - start
+        print(f"{snapshots} snapshots, {workers} worker(s)  {elapsed * 1e3:8.1f} ms  {elapsed / snapshots * 1e3:6.1f} ms/snapshot")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Micro-benchmark of the scalar Phasor classes: per-operation latency and per-object memory.
+
+Run from the repository root with ``python benchmarks/bench_scalar.py``.
+"""
+
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from Phasor.phasor import PhasorPD, PhasorPR, PhasorRe
+
+
+def latency(statement, namespace, number=20000):
+    """Return the best per-call latency of a statement in microseconds."""
+    timer = timeit.Timer(statement, globals=namespace)
+    return min(timer.repeat(5, number)) / number * 1e6
+
+
+def objectSize(factory, count=20000):
+    """Return the bytes allocated per object created by the factory."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    keep = [factory(i) for i in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    # Exclude the list holding the objects
+    allocated -= sys.getsizeof(keep)
+    return allocated / count
+
+
+def main():
+    results = {}
+    for cls, args in ((PhasorPD, "(100, 45)"), (PhasorPR, "(100, 0.7)"), (PhasorRe, "(70+70j)")):
+        name = cls.__name__
+        namespace = {"cls": cls, "a": eval(f"cls{args}"), "b": eval(f"cls{args}")}
+        results[f"{name} construct"] = latency(f"cls{args}", namespace)
+        for symbol in ("+", "-", "*", "/"):
+            results[f"{name} a {symbol} b"] = latency(f"a {symbol} b", namespace)
+        results[f"{name} a ** 2"] = latency("a ** 2", namespace)
+        results[f"{name} chain"] = latency("(a + b) * a / b ** 2", namespace)
+        results[f"{name} bytes/object"] = objectSize(lambda i: eval(f"cls{args}", namespace))
+
+    width = max(len(key) for key in results)
+    for key, value in results.items():
+        unit = "B" if key.endswith("object") else "us"
+        print(f"{key:<{width}}  {value:10.2f} {unit}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Size and speed of the compact pickles and of Parquet files against the default pickle of every attribute.
+
+Run from the repository root with ``python benchmarks/bench_serialize.py``.
+"""
+
+import copyreg
+import io
+import os
+import pickle
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import numpy as np
+from Phasor.phasor import Phasor, PhasorArray, PhasorPD, PhasorRe
+from Phasor.sc import SCtoU, UtoSC, batchUtoSC
+
+
+class AttributePickler(pickle.Pickler):
+    """Pickler ignoring the compact __reduce__ methods, storing every attribute as plain pickle does."""
+    def reducer_override(self, value):
+        # The reduction object.__reduce_ex__ gives classes without __reduce__: instance dictionary or slot values
+        if isinstance(value, Phasor):
+            return copyreg.__newobj__, (type(value),), (None, {i: getattr(value, i) for i in Phasor.__slots__})
+        if isinstance(value, (UtoSC, SCtoU)):
+            return copyreg.__newobj__, (type(value),), value.__dict__
+        return NotImplemented
+
+
+def attributeDumps(value):
+    buffer = io.BytesIO()
+    AttributePickler(buffer, pickle.HIGHEST_PROTOCOL).dump(value)
+    return buffer.getvalue()
+
+
+def timed(function, repeat = 5):
+    """Return the result and the best wall-clock time in seconds of function()."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def comparePickles(name, value):
+    plain, plainDump = timed(lambda: attributeDumps(value))
+    compact, compactDump = timed(lambda: pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+    _, plainLoad = timed(lambda: pickle.loads(plain))
+    _, compactLoad = timed(lambda: pickle.loads(compact))
+    print(f"{name:<24}{len(plain) / 1e3:>10.1f} kB{len(compact) / 1e3:>10.1f} kB"
+          f"{plainDump * 1e3:>10.2f} ms{compactDump * 1e3:>10.2f} ms{plainLoad * 1e3:>10.2f} ms{compactLoad * 1e3:>10.2f} ms")
+
+
+def compareParquet(rows):
+    from Phasor.arrow import readParquet, writeParquet
+
+    rng = np.random.default_rng(0)
+    phases = PhasorArray(rng.normal(size=(rows, 3)) + 1j * rng.normal(size=(rows, 3)))
+    components = batchUtoSC(phases)
+    times = np.arange(rows) / 60
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "components.parquet")
+        _, write = timed(lambda: writeParquet(path, components, times, names=("zero", "positive", "negative")))
+        _, read = timed(lambda: readParquet(path))
+        size = os.path.getsize(path)
+    record = (times, PhasorArray(components))
+    plain, dump = timed(lambda: pickle.dumps(record, pickle.HIGHEST_PROTOCOL))
+    _, load = timed(lambda: pickle.loads(plain))
+    print(f"\n{rows} rows of sequence components with timestamps")
+    print(f"  Parquet  {size / 1e6:>8.2f} MB  write {write * 1e3:8.1f} ms  read {read * 1e3:8.1f} ms")
+    print(f"  pickle   {len(plain) / 1e6:>8.2f} MB  dump  {dump * 1e3:8.1f} ms  load {load * 1e3:8.1f} ms")
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=10000) + 1j * rng.normal(size=10000)
+    phasors = [PhasorPD(abs(i), np.angle(i, deg=True)) for i in values]
+    for phasor in phasors:
+        phasor.radian
+    results = [UtoSC(*(PhasorRe(complex(i)) for i in sample)) for sample in values[:9999].reshape(-1, 3)]
+
+    print(f"{'':<24}{'plain':>13}{'compact':>13}{'plain dump':>13}{'compact dump':>13}{'plain load':>13}{'compact load':>13}")
+    comparePickles("10000 PhasorPD", phasors)
+    comparePickles("3333 UtoSC", results)
+    comparePickles("PhasorArray (10000,)", PhasorArray(values))
+    try:
+        compareParquet(1000000)
+    except ImportError as error:
+        print(f"\nParquet skipped: {error}")
@@ -0,0 +1,199 @@
+"""Benchmark suite covering phasor arithmetic, conversions, symmetrical components and plotting.
+
+Run from the repository root with ``python benchmarks/run.py``. Results are written as JSON and compared
+against ``benchmarks/baseline.json``; the run exits with status 1 when any case is slower than the
+baseline by more than the tolerance. Use ``--update-baseline`` to record a new baseline.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import numpy as np
+from Phasor.conversions import *
+from Phasor.phasor import *
+from Phasor.sc import *
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+BASELINE = os.path.join(DIRECTORY, "baseline.json")
+PLOT_LIMIT = 10**5
+
+
+def measure(function, minTime = 0.05, repeat = 5):
+    """Return the best time of one call in seconds."""
+    timer = timeit.Timer(function)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= minTime:
+            break
+        number *= 10 if elapsed < minTime / 10 else 2
+    return min([elapsed] + timer.repeat(repeat - 1, number)) / number
+
+
+def calibrate():
+    """Return the time of a fixed reference workload, used to cancel out the overall speed of the machine."""
+    values = np.arange(10**5, dtype=float)
+    return measure(lambda: (sum(range(1000)), np.sqrt(values)), repeat=7)
+
+
+def scalarCases():
+    """Yield (name, function) of the scalar Phasor operators."""
+    for cls, args in ((PhasorPD, (100, 45)), (PhasorPR, (100, 0.7)), (PhasorRe, (70+70j,))):
+        a, b = cls(*args), cls(*args)
+        name = cls.__name__
+        yield f"{name}.construct", lambda cls=cls, args=args: cls(*args)
+        yield f"{name}.add", lambda a=a, b=b: a + b
+        yield f"{name}.sub", lambda a=a, b=b: a - b
+        yield f"{name}.mul", lambda a=a, b=b: a * b
+        yield f"{name}.truediv", lambda a=a, b=b: a / b
+        yield f"{name}.pow", lambda a=a: a ** 2
+        yield f"{name}.invert", lambda a=a: ~a
+        yield f"{name}.str", lambda a=a: str(a)
+
+
+def conversionCases(size):
+    """Yield (name, function) of every conversion function for inputs of the given size."""
+    rng = np.random.default_rng(size)
+    if size == 1:
+        z, modulus, angle, degree = 1.5-0.5j, 2.0, 0.7, 40.0
+    else:
+        z = rng.normal(size=size) + 1j * rng.normal(size=size)
+        modulus, angle, degree = np.abs(z), np.angle(z), np.angle(z, deg=True)
+    yield "RectangularToPolarRadians", lambda: RectangularToPolarRadians(z)
+    yield "RectangularToPolarDegree", lambda: RectangularToPolarDegree(z)
+    yield "PolarDegreeToPolarRadians", lambda: PolarDegreeToPolarRadians(degree)
+    yield "PolarRadiansToPolarDegree", lambda: PolarRadiansToPolarDegree(angle)
+    yield "PolarRadiansToRectangular", lambda: PolarRadiansToRectangular(modulus, angle)
+    yield "PolarDegreeToRectangle", lambda: PolarDegreeToRectangle(modulus, degree)
+    yield "RoundOff", lambda: RoundOff(modulus, 2)
+
+
+def arrayCases(size):
+    """Yield (name, function) of PhasorArray arithmetic and the batch transforms for inputs of the given size."""
+    rng = np.random.default_rng(size)
+    a = PhasorArray(rng.normal(size=size) + 1j * rng.normal(size=size))
+    b = PhasorArray(rng.normal(size=size) + 1j * rng.normal(size=size))
+    yield "PhasorArray.add", lambda: a + b
+    yield "PhasorArray.mul", lambda: a * b
+    yield "PhasorArray.truediv", lambda: a / b
+    phases = rng.normal(size=(size, 3)) + 1j * rng.normal(size=(size, 3))
+    out = np.empty_like(phases)
+    yield "batchUtoSC", lambda: batchUtoSC(phases, out=out)
+    yield "batchSCtoU", lambda: batchSCtoU(phases, out=out)
+
+
+def scCases():
+    """Yield (name, function) of the single sample UtoSC and SCtoU constructions."""
+    a, b, c = PhasorPD(100, 0), PhasorPD(90, -115), PhasorPD(110, 125)
+    yield "UtoSC.construct", lambda: UtoSC(a, b, c)
+    yield "SCtoU.construct", lambda: SCtoU(a, b, c)
+
+
+def plotCases(sizes):
+    """Yield (name, function) of Plot figure building."""
+    from Phasor.plot import Plot
+    a, b, c = PhasorPD(100, 0), PhasorPD(90, -115), PhasorPD(110, 125)
+    yield "Plot.phasors", lambda: Plot(a, b, c, show=False)
+    yield "Plot.UtoSC", lambda: Plot(UtoSC(a, b, c), show=False)
+    for size in sizes:
+        if size <= PLOT_LIMIT:
+            array = PhasorArray(np.exp(1j * np.linspace(0, 6, size)))
+            yield f"Plot.PhasorArray[n={size}]", lambda array=array: Plot(array, show=False)
+
+
+def collect(maxSize):
+    """Return (name, function) of every case with inputs up to maxSize elements."""
+    sizes = [10**i for i in range(int(np.log10(maxSize)) + 1)]
+    cases = list(scalarCases()) + list(scCases())
+    for size in sizes:
+        cases += [(f"conversions.{name}[n={size}]", function) for name, function in conversionCases(size)]
+        cases += [(f"{name}[n={size}]", function) for name, function in arrayCases(size)]
+    cases += list(plotCases(sizes))
+    return cases
+
+
+def run(cases, repeat = 5):
+    """Run the cases and return a dict of case name to seconds per call."""
+    results = {}
+    width = max(len(name) for name, _ in cases)
+    for name, function in cases:
+        results[name] = measure(function, repeat=repeat)
+        print(f"{name:<{width}}  {results[name] * 1e6:14.3f} us", flush=True)
+    return results
+
+
+def compare(results, baseline, tolerance, speed = 1.0):
+    """Return the cases slower than the baseline by more than the tolerance.
+
+    speed is the ratio of the calibration time of this run to the calibration time of the baseline run.
+    """
+    regressions = []
+    for name, seconds in results.items():
+        reference = baseline.get(name)
+        if reference is not None and seconds > reference * speed * (1 + tolerance):
+            regressions.append((name, reference, seconds))
+    return regressions
+
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-size", type=int, default=10**7, help="largest input size, a power of ten (default 10^7)")
+    parser.add_argument("--output", default=os.path.join(DIRECTORY, "results.json"), help="path of the JSON results")
+    parser.add_argument("--baseline", default=BASELINE, help="path of the JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=1.0, help="allowed slowdown relative to the baseline (default 1.0, i.e. 2x)")
+    parser.add_argument("--update-baseline", action="store_true", help="store the results as the new baseline")
+    args = parser.parse_args(argv)
+
+    calibration = calibrate()
+    cases = collect(args.max_size)
+    results = run(cases)
+    calibration = min(calibration, calibrate())
+    report = {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "calibration": calibration,
+        "results": results,
+    }
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=2)
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(report, file, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}, run with --update-baseline to create one.")
+        return 0
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    speed = calibration / baseline.get("calibration", calibration)
+    baseline = baseline["results"]
+    print(f"Machine speed relative to the baseline run: {1 / speed:.2f}x")
+    regressions = compare(results, baseline, args.tolerance, speed)
+    if regressions:
+        # Timings are noisy on shared machines, so suspected regressions are measured again before failing
+        print("Measuring suspected regressions again...")
+        suspects = [case for case in cases if case[0] in {i[0] for i in regressions}]
+        for name, seconds in run(suspects, repeat=15).items():
+            results[name] = min(results[name], seconds)
+        regressions = compare(results, baseline, args.tolerance, speed)
+    for name, reference, seconds in regressions:
+        print(f"REGRESSION {name}: {reference * 1e6:.3f} us -> {seconds * 1e6:.3f} us ({seconds / reference / speed:.2f}x after calibration)")
+    if regressions:
+        print(f"{len(regressions)} case(s) regressed by more than {args.tolerance:.0%}.")
+        return 1
+    print(f"No regressions against {args.baseline}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
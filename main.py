@@ -1,7 +1,5 @@
 
-from src.Phasor.phasor import *
-from src.Phasor.plot import Plot
-from src.Phasor.sc import *
+from src.Phasor import PhasorPD, PhasorPR, Plot, SCtoU, UtoSC, toRec
 
 a = PhasorPD(100, 45)
 
@@ -12,8 +10,8 @@ print(b)
 
 print(toRec(b+a))
 
-c = unbalancedToSC(a,b,a+b)
-d = SCToUnbalanced(a,b,a-b)
+c = UtoSC(a,b,a+b)
+d = SCtoU(a,b,a-b)
 Plot(a)
 Plot(c)
 Plot(d)
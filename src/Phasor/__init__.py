@@ -0,0 +1,58 @@
+"""Phasor calculations, symmetrical components, visualization and power system analysis.
+
+The public API is available from the package, e.g. ``from Phasor import PhasorPD, UtoSC``. Submodules are only
+imported when one of their names is first used, so ``import Phasor`` is fast and plotly, SciPy or asyncio are
+loaded only by the features that need them.
+"""
+
+import importlib
+import os
+
+# Public names of the package and the submodule defining each of them
+_API = {
+    "phasor": ("Phasor", "PhasorPD", "PhasorPR", "PhasorRe", "PhasorArray", "toRec", "toRad", "toDeg"),
+    "conversions": ("RectangularToPolarRadians", "RectangularToPolarDegree", "PolarDegreeToPolarRadians",
+                    "PolarRadiansToPolarDegree", "PolarRadiansToRectangular", "PolarDegreeToRectangle", "RoundOff"),
+    "sc": ("UtoSC", "SCtoU", "batchUtoSC", "batchSCtoU", "rotatedComponents"),
+    "plot": ("Plot", "LivePlot", "animationFrames", "exportHTML"),
+    "lazy": ("Lazy",),
+    "formatting": ("formatPhasors", "formatSequences"),
+    "arrow": ("toTable", "fromTable", "sequenceTable", "writeParquet", "readParquet"),
+    "store": ("PhasorStore",),
+    "stream": ("SCStream",),
+    "ingest": ("PhasorStream", "openTCPStream", "openUDPStream"),
+    "c37118": ("decodeDataFrames", "readDataFrames"),
+    "estimation": ("SlidingDFT", "estimatePhasors"),
+    "network": ("Network",),
+    "powerflow": ("PowerFlow",),
+    "fault": ("Fault", "faultSequenceCurrents"),
+    "parallel": ("SharedExecutor",),
+}
+_LOCATIONS = {name: module for module, names in _API.items() for name in names}
+# Submodules whose names are also functions inside them are reached as modules only
+_SUBMODULES = tuple(_API) + ("instrument", "memory")
+
+# Star imports export nothing, as with the former empty package module, so they never import the submodules
+__all__ = []
+
+
+def __getattr__(name):
+    """Import the submodule defining a public name on first access."""
+    if name in _LOCATIONS:
+        value = getattr(importlib.import_module(f".{_LOCATIONS[name]}", __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Later accesses find the name directly, without calling __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LOCATIONS) | set(_SUBMODULES))
+
+
+if os.environ.get("PHASOR_INSTRUMENT"):
+    from .instrument import enable as _enableInstrumentation
+    _enableInstrumentation()
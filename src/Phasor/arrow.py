@@ -0,0 +1,176 @@
+"""Export phasor arrays and symmetrical component results to Arrow tables and Parquet files, and import them back.
+
+Every complex channel is stored as two float64 columns, ``<name>_re`` and ``<name>_im``, next to an optional
+``time`` column, so the files can be read by any Arrow or Parquet tool. The shape of the channels, their
+names, roundOff and the display form are kept in the schema metadata and restored on import.
+
+pyarrow is an optional dependency, imported on first use.
+"""
+
+import json
+import numpy as np
+from .phasor import PhasorArray
+from .sc import UtoSC
+
+_METADATA_KEY = b"phasor"
+_SEQUENCES = ("zero", "positive", "negative")
+
+
+def _pyarrow():
+    """Import pyarrow and pyarrow.parquet when they are first needed."""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("Unsupported export: pyarrow is needed for Arrow and Parquet files, install it with 'pip install pyarrow'.") from None
+    return pyarrow
+
+
+def _channelNames(shape, names):
+    """Return one column name per channel of a row of the given shape, numbering names along the leading axes."""
+    count = int(np.prod(shape))
+    if names is None:
+        if not shape:
+            return ["phasor"]
+        return ["phasor" + "_".join(str(i) for i in index) for index in np.ndindex(*shape)]
+    names = list(names)
+    if len(names) == count:
+        return names
+    if shape and len(names) == shape[-1]:
+        # Names of the last axis are repeated for every set along the other axes
+        return [f"{names[index[-1]]}{'_'.join(str(i) for i in index[:-1])}" for index in np.ndindex(*shape)]
+    raise ValueError(f"Unsupported names: {len(names)} names for rows of shape {shape}. Names should be given per channel or per column of the last axis.")
+
+
+def toTable(phasors, times = None, names = None):
+    """Convert phasors to an Arrow table with a pair of float columns per complex channel.
+
+    Args:
+        phasors (PhasorArray/array_like): (N, ...) phasors, one row per record.
+        times (array_like, optional): (N,) timestamps stored in a time column. Defaults to None.
+        names (list of str, optional): Name of every channel, or of every column of the last axis.
+            Defaults to phasor0, phasor1, ... numbered along the axes of a row.
+
+    Raises:
+        ValueError: If the phasors are a single value, or the times or names do not match them.
+        ImportError: If pyarrow is not installed.
+
+    Returns:
+        pyarrow.Table: Table with the time column, if any, followed by the <name>_re and <name>_im columns.
+    """
+    pa = _pyarrow()
+    roundOff = getattr(phasors, "roundOff", 2)
+    form = getattr(phasors, "form", "PD")
+    values = np.asarray(getattr(phasors, "complex", phasors), dtype=np.complex128)
+    if values.ndim == 0:
+        raise ValueError("Unsupported phasors: a table needs an (N, ...) array with one row per record.")
+    shape = values.shape[1:]
+    names = _channelNames(shape, names)
+    # Viewing the complex values as float pairs gives strided real and imaginary columns without a complex copy
+    pairs = np.ascontiguousarray(values).reshape(len(values), -1).view(np.float64)
+
+    columns = {}
+    if times is not None:
+        times = np.asarray(times, dtype=np.float64)
+        if times.shape != (len(values),):
+            raise ValueError(f"Unsupported times shape: {times.shape}. Times should be ({len(values)},).")
+        columns["time"] = times
+    for index, name in enumerate(names):
+        columns[f"{name}_re"] = pairs[:, 2 * index]
+        columns[f"{name}_im"] = pairs[:, 2 * index + 1]
+    metadata = {"shape": list(shape), "names": names, "roundOff": roundOff, "form": form}
+    return pa.table(columns, metadata={_METADATA_KEY: json.dumps(metadata)})
+
+
+def sequenceTable(components, times = None):
+    """Convert symmetrical component results to an Arrow table with zero, positive and negative columns.
+
+    Args:
+        components (ndarray/PhasorArray/list of UtoSC): (N, 3) or (N, k, 3) components from batchUtoSC
+            or a Fault, or a list of UtoSC objects.
+        times (array_like, optional): (N,) timestamps stored in a time column. Defaults to None.
+
+    Raises:
+        ValueError: If the last axis does not hold the three sequences.
+        ImportError: If pyarrow is not installed.
+
+    Returns:
+        pyarrow.Table: Table with zero_re, zero_im, positive_re, ... columns, numbered per set for (N, k, 3) input.
+    """
+    roundOff = 2
+    if isinstance(components, (list, tuple)) and components and isinstance(components[0], UtoSC):
+        roundOff = components[0].roundOff
+        components = [[i.complex for i in result.components] for result in components]
+    elif isinstance(components, PhasorArray):
+        roundOff = components.roundOff
+    values = np.asarray(getattr(components, "complex", components), dtype=np.complex128)
+    if values.ndim < 2 or values.shape[-1] != 3:
+        raise ValueError(f"Unsupported components shape: {values.shape}. Components should be (N, 3) or (N, k, 3).")
+    return toTable(PhasorArray(values, roundOff), times, _SEQUENCES)
+
+
+def fromTable(table):
+    """Convert an Arrow table written by toTable() or sequenceTable() back to phasors.
+
+    Tables from other sources are read as one channel per pair of <name>_re and <name>_im columns.
+
+    Args:
+        table (pyarrow.Table): Table to convert.
+
+    Raises:
+        ValueError: If the table has no pair of real and imaginary columns.
+
+    Returns:
+        ndarray,PhasorArray: (N,) timestamps, None without a time column, and (N, ...) phasors.
+    """
+    metadata = (table.schema.metadata or {}).get(_METADATA_KEY)
+    if metadata is None:
+        columns = table.column_names
+        names = [i[:-3] for i in columns if i.endswith("_re") and i[:-3] + "_im" in columns]
+        metadata = {"shape": [len(names)], "names": names, "roundOff": 2, "form": "PD"}
+    else:
+        metadata = json.loads(metadata)
+    names = metadata["names"]
+    if not names:
+        raise ValueError("Unsupported table: it has no pair of <name>_re and <name>_im columns.")
+
+    values = np.empty((table.num_rows, len(names)), dtype=np.complex128)
+    for index, name in enumerate(names):
+        values.real[:, index] = table.column(f"{name}_re").to_numpy()
+        values.imag[:, index] = table.column(f"{name}_im").to_numpy()
+    times = table.column("time").to_numpy() if "time" in table.column_names else None
+    phasors = PhasorArray(values.reshape((table.num_rows,) + tuple(metadata["shape"])), metadata["roundOff"], metadata["form"])
+    return times, phasors
+
+
+def writeParquet(path, phasors, times = None, names = None, **options):
+    """Write phasors to a Parquet file.
+
+    Args:
+        path (str): Path of the file.
+        phasors (PhasorArray/array_like/pyarrow.Table): (N, ...) phasors, or a table from toTable() or sequenceTable().
+        times (array_like, optional): (N,) timestamps. Defaults to None.
+        names (list of str, optional): Channel names as in toTable(). Defaults to None.
+        **options: Other arguments of pyarrow.parquet.write_table, e.g. compression.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    pa = _pyarrow()
+    table = phasors if isinstance(phasors, pa.Table) else toTable(phasors, times, names)
+    pa.parquet.write_table(table, path, **options)
+
+
+def readParquet(path):
+    """Read phasors from a Parquet file.
+
+    Args:
+        path (str): Path of the file.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+
+    Returns:
+        ndarray,PhasorArray: (N,) timestamps, None without a time column, and (N, ...) phasors.
+    """
+    return fromTable(_pyarrow().parquet.read_table(path))
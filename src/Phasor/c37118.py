@@ -0,0 +1,135 @@
+"""Decode IEEE C37.118 data frames into timestamps and phasor arrays without per-frame Python objects.
+
+Frames are viewed in place through a NumPy structured dtype built from the PMU configuration,
+so decoding a buffer of many frames costs a handful of whole-array operations.
+"""
+
+import numpy as np
+from .conversions import PolarRadiansToRectangular
+
+POLAR = 0x1
+PHASOR_FLOAT = 0x2
+ANALOG_FLOAT = 0x4
+FREQ_FLOAT = 0x8
+
+
+def _crcTable():
+    """Return the CRC-CCITT lookup table."""
+    table = np.zeros(256, dtype=np.uint16)
+    for byte in range(256):
+        crc = byte << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x1021) if crc & 0x8000 else (crc << 1)
+        table[byte] = crc & 0xFFFF
+    return table
+
+_CRC_TABLE = _crcTable()
+
+
+def frameType(phasors, format = 0, analogs = 0, digitals = 0):
+    """Return the structured dtype of a single PMU data frame.
+
+    Args:
+        phasors (int): Number of phasors (PHNMR).
+        format (int, optional): FORMAT field of the configuration frame. Defaults to 0.
+        analogs (int, optional): Number of analog values (ANNMR). Defaults to 0.
+        digitals (int, optional): Number of digital status words (DGNMR). Defaults to 0.
+
+    Returns:
+        np.dtype: Big-endian structured dtype of one frame.
+    """
+    if format & PHASOR_FLOAT:
+        value = ">f4"
+        phasor = [("magnitude", value), ("angle", value)] if format & POLAR else [("real", value), ("imag", value)]
+    else:
+        phasor = [("magnitude", ">u2"), ("angle", ">i2")] if format & POLAR else [("real", ">i2"), ("imag", ">i2")]
+    frequency = ">f4" if format & FREQ_FLOAT else ">i2"
+
+    fields = [
+        ("sync", ">u2"), ("framesize", ">u2"), ("idcode", ">u2"), ("soc", ">u4"), ("fracsec", ">u4"), ("stat", ">u2"),
+        ("phasors", np.dtype(phasor), (phasors,)), ("freq", frequency), ("dfreq", frequency),
+    ]
+    if analogs:
+        fields.append(("analog", ">f4" if format & ANALOG_FLOAT else ">i2", (analogs,)))
+    if digitals:
+        fields.append(("digital", ">u2", (digitals,)))
+    fields.append(("chk", ">u2"))
+    return np.dtype(fields)
+
+
+def checksums(frames):
+    """Compute the CRC-CCITT of every frame, vectorized across frames.
+
+    Args:
+        frames (ndarray): Structured array of frames.
+
+    Returns:
+        ndarray: uint16 checksum of each frame excluding its CHK field.
+    """
+    data = frames.view(np.uint8).reshape(len(frames), frames.dtype.itemsize)
+    crc = np.full(len(frames), 0xFFFF, dtype=np.uint16)
+    for column in range(frames.dtype.itemsize - 2):
+        crc = (crc << 8) ^ _CRC_TABLE[(crc >> 8) ^ data[:, column]]
+    return crc
+
+
+def decodeDataFrames(buffer, phasors, format = 0, analogs = 0, digitals = 0, timeBase = 1000000, scale = 1.0, checksum = False):
+    """Decode a buffer of consecutive data frames of one PMU.
+
+    Args:
+        buffer (bytes/bytearray/memoryview/ndarray): Concatenated data frames.
+        phasors (int): Number of phasors (PHNMR).
+        format (int, optional): FORMAT field of the configuration frame. Defaults to 0.
+        analogs (int, optional): Number of analog values (ANNMR). Defaults to 0.
+        digitals (int, optional): Number of digital status words (DGNMR). Defaults to 0.
+        timeBase (int, optional): TIME_BASE of the configuration frame. Defaults to 1000000.
+        scale (float/array_like, optional): Conversion factor per phasor for integer formats, i.e. PHUNIT * 1e-5. Defaults to 1.0.
+        checksum (bool, optional): Verify the CHK field of every frame. Defaults to False.
+
+    Raises:
+        ValueError: If the buffer does not hold whole frames of the expected size, or a frame is not a data frame,
+            or a checksum does not match.
+
+    Returns:
+        ndarray,ndarray: (N,) timestamps in seconds and (N, phasors) complex128 phasors.
+    """
+    dtype = frameType(phasors, format, analogs, digitals)
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    if data.size % dtype.itemsize:
+        raise ValueError(f"Unsupported buffer size: {data.size}. The buffer should hold whole frames of {dtype.itemsize} bytes.")
+    frames = data.view(dtype)
+
+    if np.any((frames["sync"] & 0xFFF0) != 0xAA00):
+        raise ValueError("Unsupported frame: SYNC does not mark a data frame.")
+    if np.any(frames["framesize"] != dtype.itemsize):
+        raise ValueError(f"Unsupported frame: FRAMESIZE does not match the configured {dtype.itemsize} bytes.")
+    if checksum and np.any(checksums(frames) != frames["chk"]):
+        raise ValueError("Unsupported frame: CHK does not match the frame contents.")
+
+    times = frames["soc"] + (frames["fracsec"] & 0x00FFFFFF) / timeBase
+
+    values = frames["phasors"]
+    result = np.empty((len(frames), phasors), dtype=np.complex128)
+    if format & POLAR:
+        angle = values["angle"] if format & PHASOR_FLOAT else values["angle"] * 1e-4
+        PolarRadiansToRectangular(values["magnitude"], angle, out=result)
+    else:
+        result.real = values["real"]
+        result.imag = values["imag"]
+    if not format & PHASOR_FLOAT:
+        result *= np.asarray(scale, dtype=float)
+    return times, result
+
+
+def readDataFrames(path, phasors, format = 0, analogs = 0, digitals = 0, timeBase = 1000000, scale = 1.0, checksum = False):
+    """Decode a capture file of consecutive data frames of one PMU through a memory map.
+
+    Args:
+        path (str): Path of the capture file.
+        Other arguments are the same as decodeDataFrames.
+
+    Returns:
+        ndarray,ndarray: (N,) timestamps in seconds and (N, phasors) complex128 phasors.
+    """
+    buffer = np.memmap(path, dtype=np.uint8, mode="r")
+    return decodeDataFrames(buffer, phasors, format, analogs, digitals, timeBase, scale, checksum)
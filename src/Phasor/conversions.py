@@ -1,112 +1,169 @@
 """Provides functionalities to convert complex numbers to differnt complex notaions.
+
+Every function accepts scalars, lists and ndarrays. Scalars are converted with ``cmath``/``math``,
+while lists and arrays are converted with NumPy ufuncs that can write into caller supplied ``out`` buffers.
 """
 
 from abc import abstractmethod
+import cmath
+import math
 import numpy as np
 
+_SCALARS = (int, float, complex)
+
+
+def _result(out, shape, dtype):
+    """Return the output buffer to write into, allocating one when no buffer is supplied."""
+    if out is None:
+        return np.empty(shape, dtype=dtype)
+    return out
+
+
+def _unwrap(value, out):
+    """Return 0-d results as NumPy scalars when no output buffer was supplied."""
+    if out is None and value.ndim == 0:
+        return value[()]
+    return value
 
 
 @abstractmethod
-def RectangularToPolarRadians(complex):
-    """Return the corresponding modulus and radian angle for given complex number 
+def RectangularToPolarRadians(complex, out=None):
+    """Return the corresponding modulus and radian angle for given complex number
 
     Args:
-        complex (complex): Complex form of the phasor
+        complex (complex/array_like): Complex form of the phasor
+        out (tuple of ndarray, optional): Float buffers to write the modulus and the angle into. Defaults to None.
 
     Returns:
         modulus,angle: Modulus value and angle value in radians
-    """    
-    modulus = np.absolute(complex)
-    angle = np.angle(complex)
+    """
+    if out is None and isinstance(complex, _SCALARS):
+        return abs(complex), cmath.phase(complex)
+    complex = np.asarray(complex)
+    modulus, angle = (None, None) if out is None else out
+    modulus = np.absolute(complex, out=modulus)
+    angle = np.arctan2(complex.imag, complex.real, out=angle)
     return modulus,angle
 
 
 @abstractmethod
-def RectangularToPolarDegree(complex):
-    """Return the corresponding modulus and degree angle for given complex number 
+def RectangularToPolarDegree(complex, out=None):
+    """Return the corresponding modulus and degree angle for given complex number
 
     Args:
-        complex (complex): Complex form of the phasor
+        complex (complex/array_like): Complex form of the phasor
+        out (tuple of ndarray, optional): Float buffers to write the modulus and the angle into. Defaults to None.
 
     Returns:
         float,float: Modulus value and angle value in degrees
     """
-    modulus = np.absolute(complex)
-    angle = np.angle(complex, deg=True)
+    if out is None and isinstance(complex, _SCALARS):
+        return abs(complex), math.degrees(cmath.phase(complex))
+    modulus, angle = RectangularToPolarRadians(complex, out)
+    angle = np.rad2deg(angle, out=angle if isinstance(angle, np.ndarray) else None)
     return modulus,angle
 
 
 @abstractmethod
-def PolarDegreeToPolarRadians(angle):
+def PolarDegreeToPolarRadians(angle, out=None):
     """Convert degree angle to radians
 
     Args:
-        angle (float): Angle in degree
+        angle (float/array_like): Angle in degree
+        out (ndarray, optional): Float buffer to write the result into. Defaults to None.
 
     Returns:
-        float: 
-    """    
-    angle = np.deg2rad(angle)
-    return angle
+        float: Angle in radians
+    """
+    if out is None and isinstance(angle, _SCALARS):
+        return math.radians(angle)
+    return np.deg2rad(angle, out=out)
 
 
 @abstractmethod
-def PolarRadiansToPolarDegree(angle):
+def PolarRadiansToPolarDegree(angle, out=None):
     """Convert radian angle to degrees.
 
     Args:
-        angle (float): Angle size in radians
+        angle (float/array_like): Angle size in radians
+        out (ndarray, optional): Float buffer to write the result into. Defaults to None.
 
     Returns:
         float: Angle in degrees
     """
-    angle = np.rad2deg(angle)
-    return angle
+    if out is None and isinstance(angle, _SCALARS):
+        return math.degrees(angle)
+    return np.rad2deg(angle, out=out)
 
 
 @abstractmethod
-def PolarRadiansToRectangular(modulus, angle):
+def PolarRadiansToRectangular(modulus, angle, out=None):
     """Convert polar coordinates to rectangular coordinates when angle is in radians.
 
+    Array inputs are written straight into the real and imaginary parts of the complex result,
+    so no temporary arrays are allocated.
+
     Args:
-        modulus (float): Modulus of the complex notation.
-        angle (float): Angle in radians.
+        modulus (float/array_like): Modulus of the complex notation.
+        angle (float/array_like): Angle in radians.
+        out (ndarray, optional): complex128 buffer to write the result into. Defaults to None.
 
     Returns:
         complex: Rectangular coordinates.
     """
-    real = modulus* np.cos(angle)
-    imag = modulus* np.sin(angle)
-    return complex(real, imag)
+    if out is None and isinstance(modulus, _SCALARS) and isinstance(angle, _SCALARS):
+        return cmath.rect(modulus, angle)
+    modulus = np.asarray(modulus)
+    angle = np.asarray(angle)
+    result = _result(out, np.broadcast_shapes(modulus.shape, angle.shape), np.complex128)
+    np.cos(angle, out=result.real)
+    np.sin(angle, out=result.imag)
+    np.multiply(result.real, modulus, out=result.real)
+    np.multiply(result.imag, modulus, out=result.imag)
+    return _unwrap(result, out)
 
 
 @abstractmethod
-def PolarDegreeToRectangle(modulus, angle):
+def PolarDegreeToRectangle(modulus, angle, out=None):
     """Convert polar coordinates to rectangular coordinates when angle is in degrees
 
     Args:
-        modulus (float): Modulus of the complex notation
-        angle (float): Angle in degrees
+        modulus (float/array_like): Modulus of the complex notation
+        angle (float/array_like): Angle in degrees
+        out (ndarray, optional): complex128 buffer to write the result into. Defaults to None.
 
     Returns:
         complex: Rectangular coordinates
     """
-    angle = np.deg2rad(angle)
-    return PolarRadiansToRectangular(modulus, angle)
+    if out is None and isinstance(modulus, _SCALARS) and isinstance(angle, _SCALARS):
+        return cmath.rect(modulus, math.radians(angle))
+    modulus = np.asarray(modulus)
+    angle = np.asarray(angle)
+    result = _result(out, np.broadcast_shapes(modulus.shape, angle.shape), np.complex128)
+    # The imaginary part holds the angle in radians until the sine overwrites it
+    np.deg2rad(angle, out=result.imag)
+    np.cos(result.imag, out=result.real)
+    np.sin(result.imag, out=result.imag)
+    np.multiply(result.real, modulus, out=result.real)
+    np.multiply(result.imag, modulus, out=result.imag)
+    return _unwrap(result, out)
 
 
 @abstractmethod
-def RoundOff(value, roundOffPoints):
+def RoundOff(value, roundOffPoints, out=None):
     """Roundoff the given value to its given decimal points.
 
     Args:
-        value (float): Value to be rounded off. 
+        value (float/complex/array_like): Value to be rounded off.
         roundOffPoints (int): Decimal points to be rounded off.
+        out (ndarray, optional): Buffer to write the result into. Defaults to None.
 
     Returns:
         float: Rounded off value
     """
-    return round(value,roundOffPoints)
-
-
-    
\ No newline at end of file
+    if out is None:
+        if isinstance(value, complex):
+            return complex(round(value.real,roundOffPoints), round(value.imag,roundOffPoints))
+        if isinstance(value, _SCALARS):
+            return round(value,roundOffPoints)
+    return np.round(value, roundOffPoints, out=out)
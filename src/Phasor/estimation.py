@@ -0,0 +1,129 @@
+"""Estimate phasors from raw sampled waveforms with a recursive sliding-window DFT."""
+
+import numpy as np
+from .phasor import PhasorArray
+
+
+class SlidingDFT:
+    """Estimate the fundamental frequency phasor of one or more sampled channels.
+
+    Each new sample updates the DFT bin of the fundamental frequency in O(1) by adding the sample
+    entering the window and removing the one leaving it. The bin is referenced to the absolute sample
+    index, so a steady signal at nominal frequency gives a stationary phasor. Magnitudes are RMS values,
+    so x = sqrt(2)*A*cos(wt + phi) is estimated as A at angle phi.
+    """
+    def __init__(self, sampleRate, frequency = 50.0, cycles = 1, channels = 1, roundOff = 2, refresh = 1000):
+        """Initialize SlidingDFT objects
+
+        Args:
+            sampleRate (float): Sampling rate of the waveforms in Hz.
+            frequency (float, optional): Nominal frequency in Hz. Defaults to 50.0.
+            cycles (int, optional): Number of nominal cycles in the window. Defaults to 1.
+            channels (int, optional): Number of channels sampled together. Defaults to 1.
+            roundOff (int, optional): Decimalpoints to be roundoff in the returned phasors. Defaults to 2.
+            refresh (int, optional): Number of windows after which the running sum is recomputed from the
+                window contents to remove accumulated rounding errors. Defaults to 1000.
+
+        Raises:
+            ValueError: If the window does not hold a whole number of samples.
+        """
+        window = sampleRate * cycles / frequency
+        if window < 1 or abs(window - round(window)) > 1e-9 * window:
+            raise ValueError(f"Unsupported sampleRate: {sampleRate}. {cycles} cycles at {frequency} Hz should span a whole number of samples.")
+        self.sampleRate = sampleRate
+        self.frequency = frequency
+        self.cycles = cycles
+        self.channels = channels
+        self.roundOff = roundOff
+        self.window = int(round(window))
+        self.refresh = refresh * self.window
+
+        positions = np.arange(self.window)
+        self._twiddle = np.exp(-2j * np.pi * cycles * positions / self.window)
+        self._scale = np.sqrt(2) / self.window
+        # _history[n % window] holds sample n of the current window
+        self._history = np.zeros((self.window, channels))
+        self._sum = np.zeros(channels, dtype=np.complex128)
+        self._index = 0
+        self._lastRefresh = 0
+
+
+    @property
+    def phasor(self):
+        """PhasorArray: Latest estimate of every channel, NaN until the first window is full."""
+        value = self._sum * self._scale if self._index >= self.window else np.full(self.channels, np.nan + 0j)
+        return PhasorArray(value, self.roundOff)
+
+
+    def update(self, samples):
+        """Push new samples and return the estimate after each of them.
+
+        Args:
+            samples (array_like): (M, channels) samples, or M samples when there is a single channel.
+
+        Raises:
+            ValueError: If the samples do not have one column per channel.
+
+        Returns:
+            PhasorArray: (M, channels) phasor estimates, NaN while the first window is filling up.
+        """
+        samples = np.asarray(samples, dtype=float)
+        if samples.ndim == 1 and self.channels == 1:
+            samples = samples[:, None]
+        if samples.ndim != 2 or samples.shape[1] != self.channels:
+            raise ValueError(f"Unsupported samples shape: {samples.shape}. Samples should be (M, {self.channels}).")
+
+        count = len(samples)
+        index = self._index + np.arange(count)
+        positions = index % self.window
+
+        # Samples leaving the window come from the history first, then from the new samples themselves
+        leaving = np.empty_like(samples)
+        head = min(count, self.window)
+        leaving[:head] = self._history[positions[:head]]
+        leaving[head:] = samples[:count - head]
+
+        delta = (samples - leaving) * self._twiddle[positions][:, None]
+        sums = np.cumsum(delta, axis=0)
+        sums += self._sum
+
+        tail = samples[-self.window:]
+        self._history[positions[-len(tail):]] = tail
+        self._sum = sums[-1].copy() if count else self._sum
+        self._index += count
+
+        if self._index - self._lastRefresh >= self.refresh:
+            self._sum = self._twiddle @ self._history
+            self._lastRefresh = self._index
+
+        sums *= self._scale
+        sums[index < self.window - 1] = np.nan
+        return PhasorArray(sums, self.roundOff)
+
+
+    def reset(self):
+        """Clear the window so the next sample starts a new estimate."""
+        self._history[:] = 0
+        self._sum[:] = 0
+        self._index = 0
+        self._lastRefresh = 0
+
+
+def estimatePhasors(samples, sampleRate, frequency = 50.0, cycles = 1, roundOff = 2):
+    """Estimate the phasors of a whole recording at every sample.
+
+    Args:
+        samples (array_like): (M, channels) samples, or M samples of a single channel.
+        sampleRate (float): Sampling rate of the waveforms in Hz.
+        frequency (float, optional): Nominal frequency in Hz. Defaults to 50.0.
+        cycles (int, optional): Number of nominal cycles in the window. Defaults to 1.
+        roundOff (int, optional): Decimalpoints to be roundoff in the returned phasors. Defaults to 2.
+
+    Returns:
+        PhasorArray: Phasor estimates with the same leading shape as samples.
+    """
+    samples = np.asarray(samples, dtype=float)
+    channels = 1 if samples.ndim == 1 else samples.shape[1]
+    estimator = SlidingDFT(sampleRate, frequency, cycles, channels, roundOff)
+    result = estimator.update(samples)
+    return result[:, 0] if samples.ndim == 1 else result
@@ -0,0 +1,138 @@
+"""Calculate short circuit faults with sequence networks, vectorized over many fault cases.
+
+Every case is described by the zero, positive and negative sequence Thevenin impedances seen from the
+faulted bus, the prefault voltage and the fault impedance. The sequence networks are connected as the
+fault type requires, and the sequence currents and voltages are converted back to phase quantities with
+the Fortescue transform, for all cases at once. Phase A is the faulted phase of SLG faults and the
+healthy phase of LL and DLG faults.
+"""
+
+import numpy as np
+from .phasor import Phasor, PhasorArray
+from .sc import SCtoU, batchSCtoU
+
+THREE_PHASE = "3P"
+SLG = "SLG"
+LL = "LL"
+DLG = "DLG"
+
+_KINDS = (THREE_PHASE, SLG, LL, DLG)
+
+
+def _complexArray(values):
+    """Return a Phasor, PhasorArray, number or array as a complex128 ndarray."""
+    if isinstance(values, (Phasor, PhasorArray)):
+        values = values.complex
+    return np.asarray(values, dtype=np.complex128)
+
+
+def _kindCodes(kind):
+    """Return the fault types as indices into _KINDS."""
+    if isinstance(kind, str):
+        if kind not in _KINDS:
+            raise ValueError(f"Unsupported fault type: {kind}. Fault type should be one of {_KINDS}.")
+        return np.asarray(_KINDS.index(kind))
+    kinds, codes = np.unique(np.asarray(kind, dtype=str), return_inverse=True)
+    unknown = [i for i in kinds if i not in _KINDS]
+    if unknown:
+        raise ValueError(f"Unsupported fault type: {unknown[0]}. Fault type should be one of {_KINDS}.")
+    return np.array([_KINDS.index(i) for i in kinds])[codes].reshape(np.shape(kind))
+
+
+def faultSequenceCurrents(kind, Z0, Z1, Z2, prefault = 1.0, impedance = 0.0, out = None):
+    """Compute the sequence currents flowing into the fault for many fault cases.
+
+    Args:
+        kind (str/array_like of str): THREE_PHASE, SLG, LL or DLG, for all cases or per case.
+        Z0 (Phasor/PhasorArray/array_like): Zero sequence Thevenin impedance.
+        Z1 (Phasor/PhasorArray/array_like): Positive sequence Thevenin impedance.
+        Z2 (Phasor/PhasorArray/array_like): Negative sequence Thevenin impedance.
+        prefault (Phasor/PhasorArray/array_like, optional): Prefault voltage of phase A. Defaults to 1.0.
+        impedance (Phasor/PhasorArray/array_like, optional): Fault impedance, per phase for THREE_PHASE faults
+            and between the faulted phases and ground for SLG and DLG faults. Defaults to 0.0.
+        out (ndarray, optional): (..., 3) complex128 buffer to write the result into. Defaults to None.
+
+    Raises:
+        ValueError: If a fault type is not supported.
+
+    Returns:
+        ndarray: (..., 3) zero, positive and negative sequence currents of phase A, with the broadcast shape of the inputs.
+    """
+    codes = _kindCodes(kind)
+    Z0, Z1, Z2, prefault, impedance, codes = np.broadcast_arrays(
+        _complexArray(Z0), _complexArray(Z1), _complexArray(Z2), _complexArray(prefault), _complexArray(impedance), codes)
+    if out is None:
+        out = np.zeros(codes.shape + (3,), dtype=np.complex128)
+    else:
+        out[...] = 0
+
+    for code in np.unique(codes):
+        cases = codes == code
+        z0, z1, z2, v, zf = Z0[cases], Z1[cases], Z2[cases], prefault[cases], impedance[cases]
+        currents = np.zeros((len(v), 3), dtype=np.complex128)
+        if _KINDS[code] == THREE_PHASE:
+            currents[:, 1] = v / (z1 + zf)
+        elif _KINDS[code] == SLG:
+            currents[:] = (v / (z0 + z1 + z2 + 3 * zf))[:, None]
+        elif _KINDS[code] == LL:
+            currents[:, 1] = v / (z1 + z2 + zf)
+            currents[:, 2] = -currents[:, 1]
+        else:
+            # The negative and the zero sequence networks (with 3Zf) are in parallel
+            ground = z0 + 3 * zf
+            currents[:, 1] = v / (z1 + z2 * ground / (z2 + ground))
+            currents[:, 2] = -currents[:, 1] * ground / (z2 + ground)
+            currents[:, 0] = -currents[:, 1] * z2 / (z2 + ground)
+        out[cases] = currents
+    return out
+
+
+class Fault:
+    """Sequence and phase currents and voltages of many short circuit fault cases, computed together.
+    """
+    def __init__(self, kind, Z0, Z1, Z2, prefault = 1.0, impedance = 0.0, roundOff = 2):
+        """Initialize Fault objects
+
+        Args:
+            kind (str/array_like of str): THREE_PHASE, SLG, LL or DLG, for all cases or per case.
+            Z0 (Phasor/PhasorArray/array_like): Zero sequence Thevenin impedance.
+            Z1 (Phasor/PhasorArray/array_like): Positive sequence Thevenin impedance.
+            Z2 (Phasor/PhasorArray/array_like): Negative sequence Thevenin impedance.
+            prefault (Phasor/PhasorArray/array_like, optional): Prefault voltage of phase A. Defaults to 1.0.
+            impedance (Phasor/PhasorArray/array_like, optional): Fault impedance. Defaults to 0.0.
+            roundOff (int, optional): Decimalpoints to be roundoff. Defaults to 2.
+
+        Raises:
+            ValueError: If a fault type is not supported.
+        """
+        currents = faultSequenceCurrents(kind, Z0, Z1, Z2, prefault, impedance)
+        shape = currents.shape[:-1]
+        impedances = np.stack([np.broadcast_to(_complexArray(i), shape) for i in (Z0, Z1, Z2)], axis=-1)
+        # Each sequence network is its Thevenin source (positive sequence only) behind its impedance
+        voltages = -impedances * currents
+        voltages[..., 1] += _complexArray(prefault)
+
+        self.roundOff = roundOff
+        self.sequenceCurrents = PhasorArray(currents, roundOff)
+        self.sequenceVoltages = PhasorArray(voltages, roundOff)
+        self.phaseCurrents = PhasorArray(batchSCtoU(currents), roundOff)
+        self.phaseVoltages = PhasorArray(batchSCtoU(voltages), roundOff)
+
+
+    def toSCtoU(self, index = (), quantity = "current"):
+        """Return one fault case as an SCtoU object.
+
+        Args:
+            index (int/tuple, optional): Index of the fault case. Defaults to (), the only case of a single fault.
+            quantity (str, optional): "current" or "voltage". Defaults to "current".
+
+        Raises:
+            ValueError: If the quantity is not "current" or "voltage".
+
+        Returns:
+            SCtoU: Sequence components and phase values of the fault case.
+        """
+        if quantity not in ("current", "voltage"):
+            raise ValueError(f"Unsupported quantity: {quantity}. Quantity should be 'current' or 'voltage'.")
+        components = self.sequenceCurrents if quantity == "current" else self.sequenceVoltages
+        return SCtoU(*components[index], roundOff=self.roundOff)
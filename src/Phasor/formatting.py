@@ -0,0 +1,235 @@
+"""Render many phasors or symmetrical component results as text at once, matching the scalar __str__ output.
+
+Numbers are rounded with one vectorized operation and their digits are computed with integer arithmetic
+into a matrix of UTF-8 bytes, one row per phasor and zero bytes as padding. Dropping the padding of the whole
+matrix joins every phasor, separator and line break into the text in a single pass. Values whose rounding
+is a near tie, that are not finite or that repr writes in scientific notation are rare and formatted by the
+scalar Phasor classes instead, so the text is always identical to str() of each phasor.
+"""
+
+import itertools
+import numpy as np
+from .phasor import _SCALAR_CLASSES
+from .sc import UtoSC, rotatedComponents
+
+_DEGREE = " \u2220 ".encode()
+_DEGREE_END = "\u00b0".encode()
+_RADIAN_END = " \u33AD".encode()
+
+
+def _constant(text, rows):
+    """Return a byte string repeated as a (rows, len(text)) column block."""
+    return np.broadcast_to(np.frombuffer(text, dtype=np.uint8), (rows, len(text)))
+
+
+def _digitText(numbers, count, trailing = False):
+    """Return the count lowest decimal digits of non-negative integers as (N, count) ASCII codes.
+
+    Args:
+        numbers (ndarray): (N,) int64 numbers.
+        count (int): Number of digits, the most significant first.
+        trailing (bool, optional): Leave the zeros after the last nonzero digit out as padding. Defaults to False.
+
+    Returns:
+        ndarray,ndarray: (N, count) uint8 digits and (N,) bool numbers without any nonzero digit.
+    """
+    text = np.empty((len(numbers), count), dtype=np.uint8)
+    zero = np.ones(len(numbers), dtype=bool)
+    for column in range(count - 1, -1, -1):
+        # Dividing by a scalar is several times faster than by an array of powers of ten
+        higher = numbers // 10
+        digit = numbers - higher * 10
+        text[:, column] = digit + ord("0")
+        zero &= digit == 0
+        if trailing:
+            text[zero, column] = 0
+        numbers = higher
+    return text, zero
+
+
+def _numberText(values, roundOff, pointZero = True):
+    """Return the text of round(value, roundOff) of every value as padded UTF-8 rows.
+
+    Args:
+        values (ndarray): (N,) float64 values.
+        roundOff (int): Decimal points, within [0, 15].
+        pointZero (bool, optional): Write ".0" after whole numbers like repr(float), or nothing like the parts
+            of repr(complex). Defaults to True.
+
+    Returns:
+        ndarray,ndarray,ndarray: (N, width) uint8 text, (N,) bool values to format in Python instead and
+            (N,) bool values rounded to +0.0.
+    """
+    scale = 10.0 ** roundOff
+    scaled = values * scale
+    rounded = np.rint(scaled)
+    magnitude = np.abs(rounded)
+    negative = np.signbit(rounded)
+    with np.errstate(invalid="ignore"):
+        # Up to 15 significant digits the shortest repr of the rounded value is its decimal digits,
+        # and repr switches to scientific notation below 1e-4
+        fallback = ~(magnitude < 1e15) | ((magnitude > 0) & (magnitude < 1e-4 * scale))
+        # Halfway cases depend on the exact binary value, which only Python's round resolves
+        fallback |= np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) <= 64 * np.spacing(np.abs(scaled))
+    digits = np.where(fallback, 0, magnitude).astype(np.int64)
+    integer = digits // 10 ** roundOff
+    fraction = digits - integer * 10 ** roundOff
+
+    columns = [np.where(negative, ord("-"), 0).astype(np.uint8)[:, None]]
+    count = len(str(integer.max())) if len(values) else 1
+    integerText, _ = _digitText(integer, count)
+    # Leading zeros become padding, the units digit is always written
+    for column in range(count - 1):
+        integerText[integer < 10 ** (count - 1 - column), column] = 0
+    columns.append(integerText)
+    if roundOff:
+        fractionText, whole = _digitText(fraction, roundOff, True)
+        point = np.full(len(values), ord("."), dtype=np.uint8) if pointZero else np.where(whole, 0, ord(".")).astype(np.uint8)
+        columns.append(point[:, None])
+        if pointZero:
+            # Whole numbers keep the first digit after the point, as in 2.0
+            fractionText[:, 0] = fraction // 10 ** (roundOff - 1) + ord("0")
+        columns.append(fractionText)
+    elif pointZero:
+        columns.append(_constant(b".0", len(values)))
+    return np.concatenate(columns, axis=1), fallback, (magnitude == 0) & ~negative
+
+
+def _phasorText(values, form, roundOff):
+    """Return the str() of the phasor of every complex value as padded UTF-8 rows."""
+    rows = len(values)
+    if form == "Re":
+        real, realFallback, bare = _numberText(values.real, roundOff, False)
+        imag, fallback, _ = _numberText(values.imag, roundOff, False)
+        fallback |= realFallback
+        # repr(complex) leaves out a +0.0 real part with the parentheses, and otherwise signs the imaginary part
+        opening = np.where(bare, 0, ord("(")).astype(np.uint8)[:, None]
+        closing = np.where(bare, 0, ord(")")).astype(np.uint8)[:, None]
+        real[bare] = 0
+        plus = (~bare & (imag[:, 0] == 0)).astype(np.uint8)[:, None] * ord("+")
+        parts = [opening, real, plus, imag, _constant(b"j", rows), closing]
+    else:
+        modulus, fallback, _ = _numberText(np.abs(values), roundOff)
+        angle = np.angle(values, deg=form == "PD")
+        angle, angleFallback, _ = _numberText(angle, roundOff)
+        fallback |= angleFallback
+        parts = [modulus, _constant(_DEGREE, rows), angle, _constant(_DEGREE_END if form == "PD" else _RADIAN_END, rows)]
+    text = np.concatenate(parts, axis=1)
+
+    fallback = np.flatnonzero(fallback)
+    if len(fallback):
+        scalar = _SCALAR_CLASSES[form]
+        strings = [str(scalar._fromComplex(complex(values[i]), roundOff)).encode() for i in fallback]
+        width = max(len(i) for i in strings)
+        if width > text.shape[1]:
+            text = np.pad(text, ((0, 0), (0, width - text.shape[1])))
+        text[fallback] = 0
+        for index, string in zip(fallback, strings):
+            text[index, :len(string)] = np.frombuffer(string, dtype=np.uint8)
+    return text
+
+
+def _lines(values, form, roundOff, separator):
+    """Return the text of (rows, columns) complex values, one line per row ending with a line break."""
+    rows, columns = values.shape
+    if not 0 <= roundOff <= 15:
+        scalar = _SCALAR_CLASSES[form]
+        return "".join(separator.join(str(scalar._fromComplex(complex(i), roundOff)) for i in row) + "\n" for row in values)
+    text = _phasorText(values.ravel(), form, roundOff).reshape(rows, columns, -1)
+    parts = []
+    for column in range(columns):
+        parts.append(text[:, column])
+        parts.append(_constant(separator.encode() if column < columns - 1 else b"\n", rows))
+    text = np.concatenate(parts, axis=1)
+    return text[text != 0].tobytes().decode()
+
+
+def _rows(phasors, form, roundOff):
+    """Return phasors as (rows, columns) complex values with the form and roundOff to use."""
+    if form is None:
+        form = getattr(phasors, "form", "PD")
+    if roundOff is None:
+        roundOff = getattr(phasors, "roundOff", 2)
+    if form not in _SCALAR_CLASSES:
+        raise ValueError(f"Unsupported form: {form}. Form should be one of {tuple(_SCALAR_CLASSES)}.")
+    values = np.asarray(getattr(phasors, "complex", phasors), dtype=np.complex128)
+    # The column count is given explicitly, as -1 cannot be inferred for an empty chunk
+    return values.reshape(len(values) if values.ndim else 1, int(np.prod(values.shape[1:]))), form, roundOff
+
+
+def _render(values, form, roundOff, separator, header, file, chunkSize):
+    """Return or write the text of the rows, with an optional header line, chunkSize rows at a time."""
+    if not len(values):
+        text = separator.join(header) + "\n" if header else ""
+        if file is None:
+            return text[:-1]
+        file.write(text)
+        return None
+    lines = (_lines(values[start:start + chunkSize], form, roundOff, separator) for start in range(0, len(values), chunkSize))
+    if header:
+        lines = itertools.chain([separator.join(header) + "\n"], lines)
+    if file is None:
+        return "".join(lines)[:-1]
+    for chunk in lines:
+        file.write(chunk)
+    return None
+
+
+def formatPhasors(phasors, form = None, roundOff = None, separator = ", ", header = None, file = None, chunkSize = 65536):
+    """Render many phasors as text in one vectorized pass, each phasor written as str() of its scalar class writes it.
+
+    Args:
+        phasors (PhasorArray/array_like): (N,) phasors, one per line, or (N, ...) phasors, one row per line.
+        form (str, optional): "PD", "PR" or "Re" notation. Defaults to the form of a PhasorArray, otherwise "PD".
+        roundOff (int, optional): Decimalpoints to be roundoff. Defaults to the roundOff of a PhasorArray, otherwise 2.
+        separator (str, optional): Text between the phasors of a row. Defaults to ", ".
+        header (list of str, optional): Column names written as the first line. Defaults to None.
+        file (file object, optional): Text file to write to instead of returning the text. Defaults to None.
+        chunkSize (int, optional): Rows rendered and written at a time. Defaults to 65536.
+
+    Raises:
+        ValueError: If the form is not one of "PD", "PR" or "Re".
+
+    Returns:
+        str: The lines joined by line breaks, or None when they are written to file with a line break after every line.
+    """
+    values, form, roundOff = _rows(phasors, form, roundOff)
+    return _render(values, form, roundOff, separator, header, file, chunkSize)
+
+
+def formatSequences(components, form = None, roundOff = None, separator = ", ", phases = False, header = True, file = None, chunkSize = 65536):
+    """Render many sets of symmetrical components as text, one set per line.
+
+    Args:
+        components (ndarray/PhasorArray/list of UtoSC): (N, 3) zero, positive and negative sequence components
+            of phase A, e.g. from batchUtoSC, or UtoSC objects.
+        form (str, optional): "PD", "PR" or "Re" notation. Defaults to the form of a PhasorArray, otherwise "PD".
+        roundOff (int, optional): Decimalpoints to be roundoff. Defaults to the roundOff of a PhasorArray or
+            of the UtoSC objects, otherwise 2.
+        separator (str, optional): Text between the components of a line. Defaults to ", ".
+        phases (bool, optional): Write the components of every phase, A0 to C2 as in str(UtoSC), instead of A0, A1 and A2.
+            Defaults to False.
+        header (bool, optional): Write the component names as the first line. Defaults to True.
+        file (file object, optional): Text file to write to instead of returning the text. Defaults to None.
+        chunkSize (int, optional): Lines rendered and written at a time. Defaults to 65536.
+
+    Raises:
+        ValueError: If the form is not supported or the components do not hold 3 values per set.
+
+    Returns:
+        str: The lines joined by line breaks, or None when they are written to file with a line break after every line.
+    """
+    if isinstance(components, (list, tuple)) and not components:
+        components = np.empty((0, 3), dtype=np.complex128)
+    elif isinstance(components, (list, tuple)) and isinstance(components[0], UtoSC):
+        roundOff = components[0].roundOff if roundOff is None else roundOff
+        components = [[i.complex for i in result.components] for result in components]
+    values, form, roundOff = _rows(components, form, roundOff)
+    if values.shape[1] != 3:
+        raise ValueError(f"Unsupported components shape: {values.shape}. Components should be (N, 3).")
+    names = ["A0", "A1", "A2"]
+    if phases:
+        # [sample, sequence, phase] to [sample, phase, sequence], the order of str(UtoSC)
+        values = rotatedComponents(values).transpose(0, 2, 1).reshape(len(values), 9)
+        names = [phase + sequence for phase in "ABC" for sequence in "012"]
+    return _render(values, form, roundOff, separator, names if header else None, file, chunkSize)
@@ -0,0 +1,342 @@
+"""Ingest live IEEE C37.118 phasor streams with asyncio and convert them to symmetrical components in micro-batches.
+
+Each stream reads data frames from a TCP connection or UDP socket into a bounded queue. A TCP reader stops
+reading when the queue is full, so the kernel buffers fill and the sender is slowed down; UDP has no flow
+control, so frames arriving at a full queue are dropped and counted. The consumer iterates the stream with
+``async for``, receiving up to batchSize frames at a time, decoded and transformed with one batchUtoSC call.
+
+Frames are found by their SYNC byte and FRAMESIZE field, so a stream joined in the middle of a frame synchronises
+on the next whole frame. Configuration, header and command frames, data frames of another size and frames failing
+the CRC are skipped and counted.
+"""
+
+import asyncio
+import binascii
+import time
+from .c37118 import decodeDataFrames, frameType
+from .sc import batchUtoSC
+
+# Marks the end of a stream in its queue
+_END = None
+# Smallest frame: SYNC, FRAMESIZE, IDCODE, SOC, FRACSEC and CHK
+_MIN_FRAME_SIZE = 16
+
+
+class PhasorStream:
+    """Asynchronous iterator of micro-batches of symmetrical components from one PMU data stream.
+
+    Use openTCPStream() or openUDPStream() to create streams. The configuration arguments describe the data
+    frames as in decodeDataFrames, the PMU should already be sending data frames.
+    """
+    def __init__(self, phasors = 3, format = 0, analogs = 0, digitals = 0, timeBase = 1000000, scale = 1.0, batchSize = 32, maxDelay = 0.005, queueSize = 256):
+        """Initialize PhasorStream objects
+
+        Args:
+            phasors (int, optional): Number of phasors per frame, a multiple of 3 ordered A, B, C. Defaults to 3.
+            format (int, optional): FORMAT field of the configuration frame. Defaults to 0.
+            analogs (int, optional): Number of analog values. Defaults to 0.
+            digitals (int, optional): Number of digital status words. Defaults to 0.
+            timeBase (int, optional): TIME_BASE of the configuration frame. Defaults to 1000000.
+            scale (float/array_like, optional): Conversion factor per phasor for integer formats. Defaults to 1.0.
+            batchSize (int, optional): Largest number of frames per batch. Defaults to 32.
+            maxDelay (float, optional): Longest time in seconds a batch waits for more frames once it has one. Defaults to 0.005.
+            queueSize (int, optional): Number of frames buffered before backpressure or dropping. Defaults to 256.
+
+        Raises:
+            ValueError: If the number of phasors is not a multiple of 3.
+        """
+        if phasors <= 0 or phasors % 3:
+            raise ValueError(f"Unsupported phasors: {phasors}. Phasors should be a positive multiple of 3.")
+        self.phasors = phasors
+        self.format = format
+        self.analogs = analogs
+        self.digitals = digitals
+        self.timeBase = timeBase
+        self.scale = scale
+        self.frameSize = frameType(phasors, format, analogs, digitals).itemsize
+        self.batchSize = batchSize
+        self.maxDelay = maxDelay
+        self.queue = asyncio.Queue(queueSize)
+        self.address = None
+
+        self.frames = 0
+        self.batches = 0
+        self.dropped = 0
+        self.skipped = 0
+        self.busyTime = 0.0
+        self.startTime = None
+        self.maxLatency = 0.0
+        self._latency = 0.0
+        self._ended = False
+        self._closer = None
+        self._synchronised = False
+
+
+    @property
+    def throughput(self):
+        """float: Frames processed per second of wall-clock time since the first frame arrived."""
+        if self.startTime is None:
+            return 0.0
+        elapsed = time.perf_counter() - self.startTime
+        return self.frames / elapsed if elapsed > 0 else 0.0
+
+
+    @property
+    def latency(self):
+        """float: Mean time in seconds from the arrival of a frame to its batch being ready."""
+        return self._latency / self.frames if self.frames else 0.0
+
+
+    def metrics(self):
+        """Return the counters of the stream.
+
+        Returns:
+            dict: frames, batches, dropped, skipped, queued, throughput, latency, maxLatency and busyTime.
+        """
+        return {
+            "frames": self.frames, "batches": self.batches, "dropped": self.dropped, "skipped": self.skipped, "queued": self.queue.qsize(),
+            "throughput": self.throughput, "latency": self.latency, "maxLatency": self.maxLatency, "busyTime": self.busyTime,
+        }
+
+
+    def _split(self, buffer):
+        """Split the data frames off a buffer of received bytes.
+
+        Frames start at a SYNC byte 0xAA and their length is read from FRAMESIZE. Other frame types and data
+        frames of another size are skipped. A frame failing the CRC is not a frame boundary after all, or was
+        corrupted, so the search continues at the next SYNC byte. Skipped frames are counted, except while
+        searching for the first frame after connecting or after a CRC failure.
+
+        A stray 0xAA byte can announce any FRAMESIZE up to 65535 bytes, so waiting for the whole frame before
+        checking its CRC would hold back the real frames behind it. An incomplete data frame is only waited for
+        when it has the configured size, and an incomplete frame of another type is given up as soon as a valid
+        data frame starts after its SYNC byte.
+
+        Args:
+            buffer (bytes): Received bytes, starting with the incomplete frame left by the previous call.
+
+        Returns:
+            list,bytes: The data frames, and the bytes of an incomplete frame at the end of the buffer.
+        """
+        frames = []
+        start = 0
+        while True:
+            start = buffer.find(b"\xaa", start)
+            if start < 0:
+                return frames, b""
+            if len(buffer) - start < 4:
+                return frames, buffer[start:]
+            kind = buffer[start + 1]
+            size = int.from_bytes(buffer[start + 2:start + 4], "big")
+            # Bit 7 of the second SYNC byte is reserved and bits 4-6 hold the frame type, 0 to 5
+            if kind & 0x80 or kind >> 4 > 5 or size < _MIN_FRAME_SIZE:
+                start += 1
+                continue
+            if len(buffer) - start < size:
+                if not kind >> 4 and size != self.frameSize:
+                    start += 1
+                    continue
+                following = self._nextDataFrame(buffer, start + 1)
+                if following is None:
+                    return frames, buffer[start:]
+                self._lostSync()
+                start = following
+                continue
+            frame = buffer[start:start + size]
+            if binascii.crc_hqx(frame[:-2], 0xFFFF) != int.from_bytes(frame[-2:], "big"):
+                self._lostSync()
+                start += 1
+                continue
+            self._synchronised = True
+            if kind >> 4 or size != self.frameSize:
+                self.skipped += 1
+            else:
+                frames.append(frame)
+            start += size
+
+
+    def _nextDataFrame(self, buffer, start):
+        """Return the position of the first complete data frame of the configured size with a valid CRC, or None."""
+        while True:
+            start = buffer.find(b"\xaa", start)
+            if start < 0 or len(buffer) - start < self.frameSize:
+                return None
+            frame = buffer[start:start + self.frameSize]
+            if (frame[1] & 0xF0 == 0 and int.from_bytes(frame[2:4], "big") == self.frameSize
+                    and binascii.crc_hqx(frame[:-2], 0xFFFF) == int.from_bytes(frame[-2:], "big")):
+                return start
+            start += 1
+
+
+    def _lostSync(self):
+        """Count the frame lost when a frame boundary turns out to be wrong while the stream was synchronised."""
+        if self._synchronised:
+            self.skipped += 1
+            self._synchronised = False
+
+
+    def _frame(self, frame):
+        """Queue a frame without waiting, dropping it when the queue is full."""
+        if self.startTime is None:
+            self.startTime = time.perf_counter()
+        try:
+            self.queue.put_nowait((time.perf_counter(), frame))
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+
+    async def _put(self, frame):
+        """Queue a frame, waiting while the queue is full."""
+        if self.startTime is None:
+            self.startTime = time.perf_counter()
+        await self.queue.put((time.perf_counter(), frame))
+
+
+    def _end(self):
+        """Mark the end of the stream after the frames already queued."""
+        try:
+            self.queue.put_nowait(_END)
+        except asyncio.QueueFull:
+            # The consumer stops at the first empty queue instead
+            self._ended = True
+
+
+    def __aiter__(self):
+        return self
+
+
+    async def __anext__(self):
+        """Return the next batch.
+
+        Returns:
+            ndarray,ndarray: (N,) timestamps in seconds and (N, 3) zero, positive and negative sequence components
+                of phase A, or (N, phasors // 3, 3) for frames holding several three phase sets.
+        """
+        while True:
+            items = await self._collect()
+            try:
+                return self._transform(items)
+            except ValueError:
+                # Frames that cannot be decoded are skipped without ending the stream
+                self.skipped += len(items)
+
+
+    async def _collect(self):
+        """Wait for the (arrival time, frame) items of the next batch."""
+        if self._ended and self.queue.empty():
+            raise StopAsyncIteration
+        item = await self.queue.get()
+        if item is _END:
+            self._ended = True
+            raise StopAsyncIteration
+        items = [item]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.maxDelay
+        while len(items) < self.batchSize:
+            if self.queue.empty():
+                timeout = deadline - loop.time()
+                if self._ended or timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self.queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            else:
+                item = self.queue.get_nowait()
+            if item is _END:
+                self._ended = True
+                break
+            items.append(item)
+        return items
+
+
+    def _transform(self, items):
+        """Decode and transform a batch of (arrival time, frame) items and update the counters."""
+        start = time.perf_counter()
+        times, phasors = decodeDataFrames(b"".join(frame for _, frame in items), self.phasors, self.format,
+                                          self.analogs, self.digitals, self.timeBase, self.scale)
+        components = batchUtoSC(phasors.reshape(len(items), -1, 3))
+        if self.phasors == 3:
+            components = components[:, 0]
+        done = time.perf_counter()
+        self.busyTime += done - start
+        self.frames += len(items)
+        self.batches += 1
+        self._latency += sum(done - arrival for arrival, _ in items)
+        self.maxLatency = max(self.maxLatency, done - items[0][0])
+        return times, components
+
+
+    def close(self):
+        """Stop receiving. Frames already queued are still returned by the iterator."""
+        if self._closer is not None:
+            self._closer()
+            self._closer = None
+        self._end()
+
+
+class _DatagramReceiver(asyncio.DatagramProtocol):
+    """Split datagrams of whole frames into the queue of a stream."""
+    def __init__(self, stream):
+        self.stream = stream
+
+
+    def datagram_received(self, data, address):
+        # A frame never continues in the next datagram, so an incomplete one is discarded
+        frames, _ = self.stream._split(data)
+        for frame in frames:
+            self.stream._frame(frame)
+
+
+async def openTCPStream(host, port, **options):
+    """Connect to a PMU sending data frames over TCP.
+
+    Args:
+        host (str): Host of the PMU or PDC.
+        port (int): TCP port.
+        **options: Configuration and batching arguments of PhasorStream.
+
+    Returns:
+        PhasorStream: Stream receiving in a background task until the connection closes or close() is called.
+    """
+    stream = PhasorStream(**options)
+    reader, writer = await asyncio.open_connection(host, port)
+
+    async def receive():
+        pending = b""
+        try:
+            while True:
+                data = await reader.read(65536)
+                if not data:
+                    break
+                frames, pending = stream._split(pending + data)
+                for frame in frames:
+                    # Waiting on a full queue stops reading the socket, which pushes back on the sender
+                    await stream._put(frame)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            stream._end()
+
+    task = asyncio.get_running_loop().create_task(receive())
+    stream._closer = task.cancel
+    return stream
+
+
+async def openUDPStream(host, port, **options):
+    """Listen for data frames sent by a PMU over UDP.
+
+    Args:
+        host (str): Local address to bind.
+        port (int): Local UDP port, 0 to pick a free port.
+        **options: Configuration and batching arguments of PhasorStream.
+
+    Returns:
+        PhasorStream: Stream receiving until close() is called. Its address attribute holds the bound (host, port).
+    """
+    stream = PhasorStream(**options)
+    transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(lambda: _DatagramReceiver(stream), local_addr=(host, port))
+    stream.address = transport.get_extra_info("sockname")[:2]
+    stream._closer = transport.close
+    return stream
@@ -0,0 +1,206 @@
+"""Opt-in instrumentation of the phasor hot paths: call counts, created phasor objects and cumulative time per operation.
+
+Instrumentation is switched on with the instrument() context manager, with enable()/disable(), or for a whole
+process by setting the PHASOR_INSTRUMENT environment variable before importing the package. While enabled, the
+Phasor and PhasorArray operators, the conversion functions and the symmetrical component transforms are replaced
+by timing wrappers. Every phasor, PhasorArray and symmetrical component object constructed during a call, including
+inside nested calls, counts as an object of that call. Disabling puts the original functions back, so there is no
+overhead at all while disabled.
+Functions are patched in the modules of this package only: code that bound a conversion function to its own
+name with ``from Phasor.conversions import *`` before enabling keeps calling the original, so call it through the module.
+"""
+
+import functools
+import sys
+import time
+from contextlib import contextmanager
+from . import conversions, phasor, sc
+
+_OPERATORS = ("__add__", "__radd__", "__sub__", "__rsub__", "__mul__", "__rmul__", "__truediv__", "__rtruediv__", "__pow__", "__invert__")
+
+_stats = {}
+_hooks = []
+_patches = []
+_originals = {}
+# Number of phasor objects constructed while enabled; calls record how much it grew while they ran
+_created = 0
+
+
+def _targets():
+    """Return (owner, attribute) of every instrumented function."""
+    targets = [(phasor.Phasor, name) for name in _OPERATORS if name in vars(phasor.Phasor)]
+    targets += [(phasor.PhasorArray, name) for name in _OPERATORS if name in vars(phasor.PhasorArray)]
+    targets += [(cls, "__init__") for cls in (phasor.PhasorPD, phasor.PhasorPR, phasor.PhasorRe, phasor.PhasorArray, sc.UtoSC, sc.SCtoU)]
+    targets += [(conversions, name) for name, value in vars(conversions).items()
+                if callable(value) and not name.startswith("_") and getattr(value, "__module__", None) == conversions.__name__]
+    targets += [(sc, name) for name in ("batchUtoSC", "batchSCtoU", "rotatedComponents")]
+    return targets
+
+
+def _record(name, seconds, allocations):
+    """Add one call to the statistics and notify the hooks."""
+    stats = _stats.get(name)
+    if stats is None:
+        stats = _stats[name] = [0, 0, 0.0]
+    stats[0] += 1
+    stats[1] += allocations
+    stats[2] += seconds
+    for hook in _hooks:
+        hook(name, seconds, allocations)
+
+
+def _wrapCounter(function):
+    """Wrap a function creating a phasor object without __init__ so that it counts the object."""
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        global _created
+        _created += 1
+        return function(*args, **kwargs)
+    return wrapper
+
+
+def _wrapFunction(name, function):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        created = _created
+        start = time.perf_counter()
+        result = function(*args, **kwargs)
+        _record(name, time.perf_counter() - start, _created - created)
+        return result
+    return wrapper
+
+
+def _wrapMethod(attribute, function):
+    constructor = attribute == "__init__"
+
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        global _created
+        created = _created
+        if constructor:
+            _created += 1
+        start = time.perf_counter()
+        result = function(self, *args, **kwargs)
+        elapsed = time.perf_counter() - start
+        _record(f"{type(self).__name__}.{attribute}", elapsed, _created - created)
+        return result
+    return wrapper
+
+
+def _packageModules():
+    """Return the loaded modules of this package."""
+    package = __name__.rpartition(".")[0]
+    return [module for name, module in list(sys.modules.items())
+            if module is not None and (name == package or name.startswith(package + "."))]
+
+
+def isEnabled():
+    """Return whether instrumentation is enabled."""
+    return bool(_patches)
+
+
+def enable():
+    """Replace the instrumented functions with timing wrappers. Does nothing when already enabled."""
+    if _patches:
+        return
+    modules = _packageModules()
+    # Phasors created from a complex value or by conversion bypass __init__, so they are counted separately
+    for attribute in ("_fromComplex", "_convert"):
+        original = vars(phasor.Phasor)[attribute]
+        if isinstance(original, classmethod):
+            wrapper = classmethod(_wrapCounter(original.__func__))
+        else:
+            wrapper = _wrapCounter(original)
+        _patches.append((phasor.Phasor, attribute, original))
+        setattr(phasor.Phasor, attribute, wrapper)
+    for owner, attribute in _targets():
+        original = vars(owner)[attribute]
+        if isinstance(owner, type):
+            wrapper = _wrapMethod(attribute, original)
+            _patches.append((owner, attribute, original))
+            setattr(owner, attribute, wrapper)
+            continue
+        wrapper = _wrapFunction(f"{owner.__name__.rpartition('.')[2]}.{attribute}", original)
+        _originals[wrapper] = original
+        # Functions are also bound by name in every module that imported them, including the package namespace
+        for module in modules:
+            if vars(module).get(attribute) is original:
+                _patches.append((module, attribute, original))
+                setattr(module, attribute, wrapper)
+
+
+def disable():
+    """Put the original functions back."""
+    while _patches:
+        owner, attribute, original = _patches.pop()
+        setattr(owner, attribute, original)
+    # Modules imported while enabled picked up the wrappers through their own imports
+    for module in _packageModules():
+        for attribute, value in list(vars(module).items()):
+            if callable(value) and value in _originals:
+                setattr(module, attribute, _originals[value])
+    _originals.clear()
+
+
+def reset():
+    """Clear the collected statistics."""
+    _stats.clear()
+
+
+def addHook(callback):
+    """Register a callback called as callback(name, seconds, objects) after every instrumented call.
+
+    Args:
+        callback (callable): Callback, for example a metrics exporter.
+    """
+    _hooks.append(callback)
+
+
+def removeHook(callback):
+    """Unregister a callback registered with addHook."""
+    _hooks.remove(callback)
+
+
+def report():
+    """Return the collected statistics.
+
+    Returns:
+        dict: Operation name mapped to a dict with "calls", "allocations" and "seconds", where "allocations" is the
+            number of phasor objects created. Both are inclusive, so an operation calling another one also counts
+            its time and objects.
+    """
+    return {name: {"calls": calls, "allocations": allocations, "seconds": seconds}
+            for name, (calls, allocations, seconds) in _stats.items()}
+
+
+def formatReport():
+    """Return the collected statistics as a text table sorted by cumulative time."""
+    rows = sorted(report().items(), key=lambda item: item[1]["seconds"], reverse=True)
+    width = max([len(name) for name, _ in rows] + [9])
+    lines = [f"{'operation':<{width}}  {'calls':>10}  {'objects':>10}  {'total ms':>10}  {'us/call':>9}"]
+    for name, stats in rows:
+        lines.append(f"{name:<{width}}  {stats['calls']:>10}  {stats['allocations']:>10}  {stats['seconds'] * 1e3:>10.3f}  {stats['seconds'] / stats['calls'] * 1e6:>9.3f}")
+    return "\n".join(lines)
+
+
+@contextmanager
+def instrument(hook = None):
+    """Enable instrumentation for the duration of a with block.
+
+    Args:
+        hook (callable, optional): Callback registered for the block, see addHook. Defaults to None.
+
+    Yields:
+        module: This module, so report() and formatReport() can be called on it.
+    """
+    wasEnabled = isEnabled()
+    if hook is not None:
+        addHook(hook)
+    enable()
+    try:
+        yield sys.modules[__name__]
+    finally:
+        if not wasEnabled:
+            disable()
+        if hook is not None:
+            removeHook(hook)
@@ -0,0 +1,299 @@
+"""Build phasor arithmetic as an expression graph and evaluate it in one fused, blockwise pass.
+
+Wrapping operands with lazy() makes the Phasor and PhasorArray operators build an expression instead of
+computing every intermediate result. evaluate() merges repeated subexpressions, compiles the graph into a
+short program of in-place NumPy operations that reuses a few temporary buffers, caches the program by
+expression shape, and runs it over blocks of rows so the temporaries stay small whatever the array size.
+"""
+
+import operator
+import numpy as np
+from .phasor import Phasor, PhasorArray, _Deferred, _FORM_NAMES, _SCALAR_CLASSES
+
+_BLOCK_SIZE = 1 << 14
+_CACHE_SIZE = 256
+
+# Operation name: (NumPy ufunc, function used when every operand is a scalar)
+_OPERATIONS = {
+    "add": (np.add, operator.add),
+    "sub": (np.subtract, operator.sub),
+    "mul": (np.multiply, operator.mul),
+    "truediv": (np.divide, operator.truediv),
+    "pow": (np.power, operator.pow),
+    "invert": (np.conjugate, lambda value: value.conjugate()),
+    "copy": (np.positive, operator.pos),
+}
+_SYMBOLS = {"add": "+", "sub": "-", "mul": "*", "truediv": "/", "pow": "**"}
+_NAMES = {"add": "Addition", "sub": "Substraction"}
+
+_programs = {}
+
+
+class Lazy:
+    """A deferred phasor expression.
+
+    Lazy objects support the same operators as the phasor classes and can be mixed with Phasor,
+    PhasorArray and numerical operands. Nothing is computed until evaluate() is called.
+    """
+    __slots__ = ("operation", "operands", "kind", "roundOff", "form")
+    __array_ufunc__ = None
+
+    def __init__(self, operation, operands, kind, roundOff = 2, form = "PD"):
+        """Initialize Lazy objects
+
+        Args:
+            operation (str): Operation name, or "leaf" for a wrapped value.
+            operands (tuple): Lazy operands, or the wrapped value for a leaf.
+            kind (str): "array", "phasor" or "number", the type of the evaluated result.
+            roundOff (int, optional): Decimalpoints to be roundoff in the result. Defaults to 2.
+            form (str, optional): Form of the result, one of "PD", "PR" or "Re". Defaults to "PD".
+        """
+        self.operation = operation
+        self.operands = operands
+        self.kind = kind
+        self.roundOff = roundOff
+        self.form = form
+
+
+    def __add__(self, other):
+        return _node("add", self, other)
+
+
+    def __radd__(self, other):
+        return _node("add", other, self)
+
+
+    def __sub__(self, other):
+        return _node("sub", self, other)
+
+
+    def __rsub__(self, other):
+        return _node("sub", other, self)
+
+
+    def __mul__(self, other):
+        return _node("mul", self, other)
+
+
+    def __rmul__(self, other):
+        return _node("mul", other, self)
+
+
+    def __truediv__(self, other):
+        return _node("truediv", self, other)
+
+
+    def __rtruediv__(self, other):
+        return _node("truediv", other, self)
+
+
+    def __pow__(self, power):
+        if isinstance(power, (Lazy, Phasor, PhasorArray)):
+            raise TypeError(f"Unsupported exponent type: {type(power)}. The exponent should be a number.")
+        return _node("pow", self, power)
+
+
+    def __invert__(self):
+        return Lazy("invert", (self,), self.kind, self.roundOff, self.form)
+
+
+    def evaluate(self, out = None, blockSize = _BLOCK_SIZE):
+        """Compute the expression.
+
+        Args:
+            out (ndarray, optional): complex128 array of the result shape to write the result to. Defaults to None.
+            blockSize (int, optional): Number of elements computed per block. Defaults to 16384.
+
+        Raises:
+            ZeroDivisionError: If any divisor is zero
+            ValueError: If out does not have the shape of the result.
+
+        Returns:
+            PhasorArray/Phasor/complex/ndarray: Result as the eager operators would return it.
+        """
+        leaves, instructions = _flatten(self)
+        program = _programs.get(instructions)
+        if program is None:
+            if len(_programs) >= _CACHE_SIZE:
+                _programs.clear()
+            program = _programs[instructions] = _Program(instructions, len(leaves))
+        value = program.run([_leafValue(leaf) for leaf in leaves], out, blockSize)
+        if self.kind == "number":
+            return value
+        if isinstance(value, np.ndarray) and value.ndim:
+            return PhasorArray(value, self.roundOff, self.form)
+        return _SCALAR_CLASSES[self.form]._fromComplex(complex(value), self.roundOff)
+
+
+    def __repr__(self):
+        if self.operation == "leaf":
+            return f"Lazy({type(self.operands[0]).__name__})"
+        if self.operation == "invert":
+            return f"~{self.operands[0]!r}"
+        left, right = self.operands
+        return f"({left!r} {_SYMBOLS[self.operation]} {right!r})"
+
+
+_Deferred.register(Lazy)
+
+
+def lazy(*values):
+    """Wrap values so that arithmetic on them builds a Lazy expression.
+
+    Args:
+        *values (Phasor/PhasorArray/int/float/complex/ndarray): Operands of the expression.
+
+    Raises:
+        TypeError: If a value is not a phasor or a number.
+
+    Returns:
+        Lazy/tuple: One Lazy leaf per value.
+    """
+    leaves = tuple(_wrap(value) for value in values)
+    return leaves[0] if len(leaves) == 1 else leaves
+
+
+def _wrap(value):
+    """Return a value as a Lazy node."""
+    if isinstance(value, Lazy):
+        return value
+    if isinstance(value, PhasorArray):
+        return Lazy("leaf", (value,), "array", value.roundOff, value.form)
+    if isinstance(value, Phasor):
+        return Lazy("leaf", (value,), "phasor", value.roundOff, _FORM_NAMES.get(type(value), "PD"))
+    if isinstance(value, (int, float, complex, np.number, np.ndarray)):
+        return Lazy("leaf", (value,), "number", None, None)
+    raise TypeError(f"Unsupported operand type: {type(value)}.")
+
+
+def _node(operation, left, right):
+    """Return the Lazy node of a binary operation, with the result type the eager operator would give."""
+    left, right = _wrap(left), _wrap(right)
+    if operation in _NAMES and "number" in (left.kind, right.kind):
+        number = left if left.kind == "number" else right
+        raise TypeError(f"Unsupported operand type: {type(number.operands[0])}. {_NAMES[operation]} can only be performed with Phasor instances.")
+    kinds = (left.kind, right.kind)
+    kind = "array" if "array" in kinds else "phasor" if "phasor" in kinds else "number"
+    # The left phasor operand decides the form of the result, as with the eager operators
+    source = left if left.kind != "number" else right
+    return Lazy(operation, (left, right), kind, source.roundOff, source.form)
+
+
+def _leafValue(value):
+    """Return the complex value of a leaf."""
+    if isinstance(value, PhasorArray):
+        return value.complex
+    if isinstance(value, Phasor):
+        return value.complex
+    return value
+
+
+def _flatten(root):
+    """Return the distinct leaf values and the instructions computing the expression.
+
+    Identical subexpressions become a single instruction. Instructions are tuples of the operation name and
+    its operands, where an operand i >= 0 is leaf i and an operand -1-j is the result of instruction j.
+    """
+    leaves = []
+    slots = {}
+    keys = {}
+    instructions = []
+    stack = [(root, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if id(node) in slots:
+            continue
+        if node.operation == "leaf":
+            key = ("leaf", id(node.operands[0]))
+            if key not in keys:
+                keys[key] = len(leaves)
+                leaves.append(node.operands[0])
+            slots[id(node)] = keys[key]
+            continue
+        if not expanded:
+            stack.append((node, True))
+            stack.extend((operand, False) for operand in reversed(node.operands))
+            continue
+        key = (node.operation,) + tuple(slots[id(operand)] for operand in node.operands)
+        if key not in keys:
+            keys[key] = -1 - len(instructions)
+            instructions.append(key)
+        slots[id(node)] = keys[key]
+    if not instructions or slots[id(root)] != -len(instructions):
+        instructions.append(("copy", slots[id(root)]))
+    return leaves, tuple(instructions)
+
+
+class _Program:
+    """Instructions compiled to in-place operations on a minimal set of temporary buffers.
+    """
+    def __init__(self, instructions, leafCount):
+        lastUse = {}
+        for index, (_, *operands) in enumerate(instructions):
+            for operand in operands:
+                lastUse[operand] = index
+
+        registers = {}
+        free = []
+        self.registers = 0
+        self.steps = []
+        for index, (operation, *operands) in enumerate(instructions):
+            references = [operand if operand >= 0 else leafCount + registers[operand] for operand in operands]
+            # Buffers of operands used for the last time are released first, so the result can overwrite them
+            for operand in set(operands):
+                if operand < 0 and lastUse[operand] == index:
+                    free.append(registers[operand])
+            if index == len(instructions) - 1:
+                target = None
+            else:
+                if not free:
+                    free.append(self.registers)
+                    self.registers += 1
+                target = registers[-1 - index] = free.pop()
+            ufunc, function = _OPERATIONS[operation]
+            self.steps.append((operation, ufunc, function, tuple(references), target))
+        self.leafCount = leafCount
+
+
+    def run(self, values, out, blockSize):
+        """Run the program on the leaf values and return the result."""
+        shape = np.broadcast_shapes(*(np.shape(value) for value in values))
+        if not shape:
+            return self._runScalar([value.item() if isinstance(value, np.ndarray) else value for value in values])
+
+        if out is None:
+            out = np.empty(shape, dtype=np.complex128)
+        elif out.shape != shape:
+            raise ValueError(f"Unsupported out shape: {out.shape}. The result shape is {shape}.")
+        rows = shape[0]
+        rowSize = int(np.prod(shape[1:]))
+        block = max(1, min(rows, blockSize // max(rowSize, 1)))
+        # Leaves spanning the first axis are sliced per block, the others broadcast over every block
+        values = [np.asarray(value) for value in values]
+        split = [value.ndim == len(shape) and value.shape[0] == rows and rows != 1 for value in values]
+        buffers = [np.empty((block,) + shape[1:], dtype=np.complex128) for _ in range(self.registers)]
+
+        for start in range(0, rows, block):
+            stop = min(start + block, rows)
+            slots = [value[start:stop] if sliced else value for value, sliced in zip(values, split)]
+            slots += [buffer[:stop - start] for buffer in buffers]
+            for operation, ufunc, _, references, target in self.steps:
+                operands = [slots[reference] for reference in references]
+                if operation == "truediv" and np.any(np.equal(operands[1], 0)):
+                    raise ZeroDivisionError("Divisor phasor is zero")
+                ufunc(*operands, out=out[start:stop] if target is None else slots[self.leafCount + target])
+        return out
+
+
+    def _runScalar(self, values):
+        """Run the program with Python arithmetic when every operand is a scalar."""
+        slots = values + [None] * self.registers
+        result = None
+        for operation, _, function, references, target in self.steps:
+            operands = [slots[reference] for reference in references]
+            if operation == "truediv" and operands[1] == 0:
+                raise ZeroDivisionError("Divisor phasor is zero")
+            result = function(*operands)
+            if target is not None:
+                slots[self.leafCount + target] = result
+        return result
@@ -0,0 +1,185 @@
+"""Measure the memory footprint of phasor representations and profile the allocations of a workload.
+
+footprint() reports the bytes held per phasor by the scalar classes, object arrays and complex arrays,
+and per three-phase sample by the symmetrical component results. profile() runs any function under
+tracemalloc and reports its peak memory and the source lines that allocated the most.
+"""
+
+import gc
+import sys
+import tracemalloc
+import types
+import numpy as np
+from .phasor import PhasorArray, PhasorPD, PhasorPR, PhasorRe
+from .sc import SCtoU, UtoSC, batchUtoSC, rotatedComponents
+
+# Objects shared by the whole program rather than owned by the measured object
+_SHARED = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType)
+
+
+def deepSize(value):
+    """Return the bytes of an object and of every object it references, each counted once.
+
+    Classes, modules and functions are shared by the whole program and are not counted. NumPy arrays
+    count their data buffer when they own it.
+
+    Args:
+        value (object): Object to measure.
+
+    Returns:
+        int: Size in bytes.
+    """
+    seen = set()
+    pending = [value]
+    size = 0
+    while pending:
+        item = pending.pop()
+        if id(item) in seen or isinstance(item, _SHARED) or item is None:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        pending.extend(gc.get_referents(item))
+    return size
+
+
+def allocatedPerItem(factory, count = 10000):
+    """Return the bytes allocated per item when count items are created and kept alive.
+
+    Unlike deepSize, values shared between items such as cached small integers are not counted, so the
+    result is the memory that each additional item really costs.
+
+    Args:
+        factory (callable): Called as factory(i) to create item i.
+        count (int, optional): Number of items to create. Defaults to 10000.
+
+    Returns:
+        float: Bytes per item.
+    """
+    keep = [None] * count
+    wasTracing = tracemalloc.is_tracing()
+    if not wasTracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for i in range(count):
+            keep[i] = factory(i)
+        after = tracemalloc.take_snapshot()
+    finally:
+        if not wasTracing:
+            tracemalloc.stop()
+    return sum(stat.size_diff for stat in after.compare_to(before, "filename")) / count
+
+
+def _cached(phasor):
+    """Return the phasor after filling its cached polar values, as printing it does."""
+    phasor.modulus, phasor.degree, phasor.radian
+    return phasor
+
+
+def footprint(count = 10000):
+    """Measure the memory held by every representation of phasors and symmetrical component results.
+
+    Args:
+        count (int, optional): Number of items created per measurement. Defaults to 10000.
+
+    Returns:
+        dict: Representation name mapped to bytes per phasor, or per three-phase sample for the transforms.
+    """
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=count) + 1j * rng.normal(size=count)
+    items = values.tolist()
+    phases = rng.normal(size=(count, 3)) + 1j * rng.normal(size=(count, 3))
+    triples = [tuple(PhasorRe(complex(i)) for i in row) for row in phases[:min(count, 2000)].tolist()]
+
+    report = {
+        "PhasorPD": allocatedPerItem(lambda i: PhasorPD(1.0 + i, 45.0), count),
+        "PhasorPD, polar values cached": allocatedPerItem(lambda i: _cached(PhasorPD(1.0 + i, 45.0)), count),
+        "PhasorPR": allocatedPerItem(lambda i: PhasorPR(1.0 + i, 0.7), count),
+        "PhasorRe": allocatedPerItem(lambda i: PhasorRe(items[i]), count),
+        "object ndarray of PhasorRe": allocatedPerItem(lambda i: np.array([PhasorRe(z) for z in items], dtype=object), 1) / count,
+        "PhasorArray (complex128)": allocatedPerItem(lambda i: PhasorArray(values.copy()), 1) / count,
+        "ndarray complex64": allocatedPerItem(lambda i: values.astype(np.complex64), 1) / count,
+        "UtoSC per sample": allocatedPerItem(lambda i: UtoSC(*triples[i]), len(triples)),
+        "SCtoU per sample": allocatedPerItem(lambda i: SCtoU(*triples[i]), len(triples)),
+        "batchUtoSC per sample": allocatedPerItem(lambda i: batchUtoSC(phases), 1) / count,
+        "batchUtoSC + rotatedComponents per sample": allocatedPerItem(lambda i: rotatedComponents(batchUtoSC(phases)), 1) / count,
+    }
+    return report
+
+
+def formatFootprint(report):
+    """Return the result of footprint() as a text table.
+
+    Args:
+        report (dict): Result of footprint().
+
+    Returns:
+        String: One line per representation.
+    """
+    width = max(len(name) for name in report)
+    return "\n".join(f"{name:<{width}}  {size:10.1f} B" for name, size in report.items())
+
+
+class MemoryProfile:
+    """Result of profile(): the return value of the workload and its memory statistics.
+    """
+    def __init__(self, result, current, peak, statistics):
+        """Initialize MemoryProfile objects
+
+        Args:
+            result (object): Return value of the workload.
+            current (int): Bytes still allocated by the workload when it returned, including its result.
+            peak (int): Highest number of bytes allocated while the workload ran.
+            statistics (list): tracemalloc.StatisticDiff of the largest allocation sites, largest first.
+        """
+        self.result = result
+        self.current = current
+        self.peak = peak
+        self.statistics = statistics
+
+
+    def __str__(self):
+        """Return the profile in a String format
+
+        Returns:
+            String: Current and peak memory and the largest allocation sites
+        """
+        lines = [f"current {self.current / 1024:.1f} KiB, peak {self.peak / 1024:.1f} KiB"]
+        for stat in self.statistics:
+            frame = stat.traceback[0]
+            lines.append(f"  {stat.size_diff / 1024:10.1f} KiB  {stat.count_diff:8} blocks  {frame.filename}:{frame.lineno}")
+        return "\n".join(lines)
+
+
+    def __repr__(self):
+        return self.__str__()
+
+
+def profile(workload, *args, top = 10, **kwargs):
+    """Run a workload under tracemalloc and report the memory it allocated.
+
+    Args:
+        workload (callable): Function to profile, called as workload(*args, **kwargs).
+        top (int, optional): Number of allocation sites to report. Defaults to 10.
+
+    Returns:
+        MemoryProfile: Return value, current and peak bytes, and the largest allocation sites.
+    """
+    wasTracing = tracemalloc.is_tracing()
+    if not wasTracing:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = workload(*args, **kwargs)
+        current, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        if not wasTracing:
+            tracemalloc.stop()
+    # Allocations of tracemalloc itself are not part of the workload
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+    statistics = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), "lineno")
+    statistics = [stat for stat in statistics if stat.size_diff > 0][:top]
+    return MemoryProfile(result, current - start, peak - start, statistics)
@@ -0,0 +1,141 @@
+"""Nodal analysis of linear AC networks with a sparse admittance matrix.
+
+Branches are stamped into a sparse nodal admittance matrix (Y-bus) whose LU factorization is computed once
+and reused for every right-hand side, so thousands of injection scenarios cost one factorization plus one
+cheap triangular solve each.
+"""
+
+import numpy as np
+import scipy.sparse as sparse
+import scipy.sparse.linalg as linalg
+from .phasor import Phasor, PhasorArray
+
+
+def _complexValues(values):
+    """Return phasors, numbers or arrays of them as a 1D complex array."""
+    if isinstance(values, Phasor):
+        values = values.complex
+    elif isinstance(values, (list, tuple)):
+        values = [i.complex if isinstance(i, Phasor) else i for i in values]
+    return np.atleast_1d(np.asarray(getattr(values, "complex", values), dtype=np.complex128)).ravel()
+
+
+class Network:
+    """Linear network of nodes joined by branch impedances, solved for node voltages by nodal analysis.
+
+    Nodes are numbered from 0 to nodes - 1 and the reference node (ground) is None.
+    """
+    def __init__(self, nodes, roundOff = 2):
+        """Initialize Network objects
+
+        Args:
+            nodes (int): Number of nodes, excluding the reference node.
+            roundOff (int, optional): Decimalpoints to be roundoff in the returned voltages. Defaults to 2.
+        """
+        self.nodes = nodes
+        self.roundOff = roundOff
+        self._starts = []
+        self._ends = []
+        self._admittances = []
+        self._matrix = None
+        self._factor = None
+
+
+    def addBranch(self, start, end, impedance):
+        """Connect two nodes, or a node and the reference node, through an impedance.
+
+        Args:
+            start (int): First node.
+            end (int/None): Second node, or None for the reference node.
+            impedance (Phasor/complex/float): Branch impedance in ohms or per unit.
+
+        Raises:
+            ValueError: If a node does not exist or the impedance is zero.
+        """
+        self.addBranches([start], [-1 if end is None else end], [impedance])
+
+
+    def addBranches(self, starts, ends, impedances):
+        """Connect many pairs of nodes at once.
+
+        Args:
+            starts (array_like): First node of each branch.
+            ends (array_like): Second node of each branch, -1 for the reference node.
+            impedances (array_like/PhasorArray/list of Phasor): Impedance of each branch.
+
+        Raises:
+            ValueError: If the inputs do not have the same length, a node does not exist or an impedance is zero.
+        """
+        starts = np.asarray(starts, dtype=np.int64).ravel()
+        ends = np.asarray(ends, dtype=np.int64).ravel()
+        impedances = _complexValues(impedances)
+        if not len(starts) == len(ends) == len(impedances):
+            raise ValueError(f"Unsupported branches: {len(starts)} starts, {len(ends)} ends and {len(impedances)} impedances should have the same length.")
+        if np.any((starts < 0) | (starts >= self.nodes) | (ends < -1) | (ends >= self.nodes)):
+            raise ValueError(f"Unsupported node: nodes should be within [0, {self.nodes}) or -1 for the reference node.")
+        if np.any(impedances == 0):
+            raise ValueError("Unsupported impedance: zero impedance branches should be merged into one node.")
+        self._starts.append(starts)
+        self._ends.append(ends)
+        self._admittances.append(1 / impedances)
+        self._matrix = self._factor = None
+
+
+    @property
+    def admittance(self):
+        """scipy.sparse.csc_matrix: Nodal admittance matrix (Y-bus)."""
+        if self._matrix is None:
+            starts = np.concatenate(self._starts) if self._starts else np.empty(0, dtype=np.int64)
+            ends = np.concatenate(self._ends) if self._ends else np.empty(0, dtype=np.int64)
+            admittances = np.concatenate(self._admittances) if self._admittances else np.empty(0, dtype=np.complex128)
+            # Every branch adds y to both diagonal entries and -y to both off-diagonal entries
+            linked = ends >= 0
+            rows = np.concatenate((starts, ends[linked], starts[linked], ends[linked]))
+            columns = np.concatenate((starts, ends[linked], ends[linked], starts[linked]))
+            values = np.concatenate((admittances, admittances[linked], -admittances[linked], -admittances[linked]))
+            self._matrix = sparse.csc_matrix((values, (rows, columns)), shape=(self.nodes, self.nodes))
+        return self._matrix
+
+
+    def factorize(self):
+        """Compute the sparse LU factorization of the admittance matrix, unless it is cached already.
+
+        Raises:
+            ValueError: If the matrix is singular, e.g. a part of the network has no path to the reference node.
+
+        Returns:
+            scipy.sparse.linalg.SuperLU: LU factorization reused by solve().
+        """
+        if self._factor is None:
+            try:
+                self._factor = linalg.splu(self.admittance)
+            except RuntimeError as error:
+                raise ValueError(f"Unsupported network: the admittance matrix is singular ({error}). Every node needs a path to the reference node.") from None
+        return self._factor
+
+
+    def solve(self, currents):
+        """Solve the node voltages for current injections, reusing the cached factorization.
+
+        Args:
+            currents (array_like/PhasorArray/list of Phasor): (nodes,) currents injected into every node,
+                or (scenarios, nodes) for many scenarios solved as one multi right-hand side batch.
+
+        Raises:
+            ValueError: If the currents do not have one value per node.
+
+        Returns:
+            PhasorArray: Node voltages with the shape of currents. A single node voltage is a PhasorPD,
+                and three phase voltages can be passed to UtoSC, or a (..., 3) array to batchUtoSC.
+        """
+        if isinstance(currents, (list, tuple)):
+            currents = [i.complex if isinstance(i, Phasor) else i for i in currents]
+        currents = np.asarray(getattr(currents, "complex", currents), dtype=np.complex128)
+        if currents.shape[-1:] != (self.nodes,) or currents.ndim > 2:
+            raise ValueError(f"Unsupported currents shape: {currents.shape}. Currents should be ({self.nodes},) or (scenarios, {self.nodes}).")
+        factor = self.factorize()
+        if currents.ndim == 1:
+            return PhasorArray(factor.solve(currents), self.roundOff)
+        # SuperLU solves column right-hand sides, so scenarios are passed as the columns of a Fortran array
+        voltages = factor.solve(np.asfortranarray(currents.T))
+        return PhasorArray(np.ascontiguousarray(voltages.T), self.roundOff)
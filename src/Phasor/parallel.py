@@ -0,0 +1,177 @@
+"""Run batch phasor functions over large arrays in a process pool, with every buffer in shared memory.
+
+The executor splits the rows of its input arrays into chunks and calls the function on each chunk in a
+worker process. Inputs and outputs are placed in multiprocessing.shared_memory blocks which the workers
+map by name, so only the block names and row ranges are sent to the workers. Any function following the
+out= convention of this package can be used, e.g. batchUtoSC, batchSCtoU or the conversion functions.
+"""
+
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+# Removed blocks that arrays still use, unmapped by a later release once the arrays are freed
+_unmapped = []
+
+
+def _runChunk(function, inputs, outputs, start, stop, kwargs):
+    """Call the function on rows [start, stop) of arrays described by (name, offset, shape, dtype, strides), inside a worker process."""
+    blocks = {name: shared_memory.SharedMemory(name=name) for name, *_ in inputs + outputs}
+    try:
+        arrays = [np.ndarray(shape, dtype=dtype, buffer=blocks[name].buf, offset=offset, strides=strides)[start:stop]
+                  for name, offset, shape, dtype, strides in inputs + outputs]
+        out = arrays[len(inputs):]
+        function(*arrays[:len(inputs)], out=out[0] if len(out) == 1 else tuple(out), **kwargs)
+        # Views must be released before the blocks can be unmapped
+        del arrays, out
+    finally:
+        for block in blocks.values():
+            block.close()
+    return stop - start
+
+
+class SharedExecutor:
+    """Process pool running functions over row chunks of arrays held in shared memory.
+    """
+    def __init__(self, workers = None, chunkSize = 1 << 16):
+        """Initialize SharedExecutor objects
+
+        Args:
+            workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+            chunkSize (int, optional): Number of rows per task. Defaults to 65536.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.chunkSize = chunkSize
+        self._pool = None
+        self._blocks = []
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
+
+
+    def array(self, shape, dtype = np.complex128):
+        """Allocate an array in shared memory, so it can be filled and passed to map() without any copy.
+
+        The memory is removed when the executor is closed, and unmapped once the array and its views are freed.
+
+        Args:
+            shape (int/tuple): Shape of the array.
+            dtype (dtype, optional): Data type of the array. Defaults to np.complex128.
+
+        Returns:
+            ndarray: Uninitialized array backed by shared memory.
+        """
+        shape = (shape,) if np.isscalar(shape) else tuple(shape)
+        dtype = np.dtype(dtype)
+        size = max(int(np.prod(shape)) * dtype.itemsize, 1)
+        block = shared_memory.SharedMemory(create=True, size=size)
+        self._blocks.append(block)
+        # frombuffer holds the buffer, so the block cannot be unmapped while the array or a view of it exists
+        return np.frombuffer(block.buf, dtype=dtype, count=int(np.prod(shape))).reshape(shape)
+
+
+    def _spec(self, array):
+        """Return the (name, offset, shape, dtype, strides) of an array in one of the shared blocks, or None."""
+        address = array.__array_interface__["data"][0]
+        if not self._blocks:
+            return None
+        for block in self._blocks:
+            base = np.frombuffer(block.buf, dtype=np.uint8)
+            if np.may_share_memory(array, base):
+                start = base.__array_interface__["data"][0]
+                return block.name, address - start, array.shape, array.dtype.str, array.strides
+        return None
+
+
+    def _shared(self, array):
+        """Return the spec of an array, copying it into shared memory first when it is not there yet."""
+        spec = self._spec(array)
+        if spec is None:
+            copy = self.array(array.shape, array.dtype)
+            copy[...] = array
+            spec = self._spec(copy)
+        return spec
+
+
+    def map(self, function, *arrays, out = None, shape = None, dtype = np.complex128, outputs = 1, **kwargs):
+        """Call function(*chunks, out=chunkOut, **kwargs) on row chunks of the arrays across the worker processes.
+
+        Args:
+            function (callable): Module level function writing its result into out, e.g. batchUtoSC.
+            *arrays (array_like/PhasorArray): Inputs with the same number of rows.
+            out (ndarray/tuple of ndarray, optional): Output arrays. Arrays from array() are written in place,
+                other arrays receive a copy of the results. Defaults to None, allocating the outputs.
+            shape (tuple, optional): Shape of one output row. Defaults to the row shape of the first input.
+            dtype (dtype, optional): Data type of the allocated outputs. Defaults to np.complex128.
+            outputs (int, optional): Number of outputs written by the function, 2 for RectangularToPolarDegree. Defaults to 1.
+            **kwargs: Other arguments passed to the function.
+
+        Raises:
+            ValueError: If the arrays do not have the same number of rows.
+
+        Returns:
+            ndarray/tuple of ndarray: The outputs.
+        """
+        arrays = [np.asarray(getattr(array, "complex", array)) for array in arrays]
+        rows = len(arrays[0])
+        if any(len(array) != rows for array in arrays):
+            raise ValueError(f"Unsupported arrays: every array should have {rows} rows.")
+        if out is None:
+            rowShape = arrays[0].shape[1:] if shape is None else tuple(shape)
+            out = tuple(np.empty((rows,) + rowShape, dtype=dtype) for _ in range(outputs))
+            out = out[0] if outputs == 1 else out
+        targets = out if isinstance(out, tuple) else (out,)
+
+        if self.workers == 1:
+            function(*arrays, out=out, **kwargs)
+            return out
+
+        temporary = len(self._blocks)
+        try:
+            inputs = [self._shared(array) for array in arrays]
+            # Outputs that are not in shared memory are computed into temporary shared arrays and copied back
+            buffers = [None if self._spec(target) is not None else self.array(target.shape, target.dtype) for target in targets]
+            results = [self._spec(target if buffer is None else buffer) for target, buffer in zip(targets, buffers)]
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(self.workers)
+            tasks = [self._pool.submit(_runChunk, function, inputs, results, start, min(start + self.chunkSize, rows), kwargs)
+                     for start in range(0, rows, self.chunkSize)]
+            for task in tasks:
+                task.result()
+            for target, buffer in zip(targets, buffers):
+                if buffer is not None:
+                    target[...] = buffer
+            del buffers, buffer
+        finally:
+            # Blocks allocated for this call are released, blocks returned by array() stay
+            self._release(self._blocks[temporary:])
+            del self._blocks[temporary:]
+        return out
+
+
+    def _release(self, blocks):
+        """Remove shared memory blocks and unmap them, along with blocks that could not be unmapped before."""
+        for block in blocks:
+            block.unlink()
+        pending = _unmapped + list(blocks)
+        _unmapped.clear()
+        for block in pending:
+            try:
+                block.close()
+            except BufferError:
+                _unmapped.append(block)
+
+
+    def close(self):
+        """Stop the worker processes and release the shared memory."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        self._release(self._blocks)
+        self._blocks = []
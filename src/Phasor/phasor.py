@@ -1,49 +1,106 @@
 """Create Phasor objects with different formats and provide capability to do basic phsor calculations.
 """
 
+import cmath
+import math
 import numpy as np
 from abc import ABC, abstractmethod
+from numbers import Number
 from .conversions import *
 
+_TWO_PI = 2 * math.pi
+
+
+class _Deferred(ABC):
+    """Operand types whose reflected operators handle arithmetic with phasors, such as PhasorArray."""
+
+
 class Phasor(ABC):
     """An abstract class for Phasor objects
 
+    A phasor only stores its complex value. Modulus and angles are derived on first access and cached.
+
     Args:
         ABC (ABC): abc.ABC superclass
     """
+    __slots__ = ("_complex", "_modulus", "_radian", "_degree", "roundOff")
+
     @abstractmethod
     def __init__(self):
-        self.complex = 0
-        self.modulus = 0
-        self.radian = 0
-        self.degree = 0
+        self._complex = 0j
+        self._modulus = self._radian = self._degree = None
         self.roundOff = 2
-        
 
-class PhasorPD(Phasor):
-    """Initialize Phasor objects in Polor Coordinates with degree as the angle unit
 
-    Args:
-        Phasor (Phasor): Abstract Phasor parent class
-    """
-    
-    def __init__(self,modulus, degree, roundOff = 2):
-        """Initiate PhasorPD objects
+    @classmethod
+    def _fromComplex(cls, value, roundOff = 2):
+        """Create a phasor object directly from its complex value without going through __init__.
 
         Args:
-            modulus (int/float): modulus 
-            degree (_type_): angle in degrees
+            value (complex): Complex form of the phasor
             roundOff (int, optional): Decimalpoints to be roundoff. Defaults to 2.
+
+        Returns:
+            Phasor: Phasor object of the calling class
         """
-        self.modulus = modulus
-        self.degree = degree % 360
-        self.radian = PolarDegreeToPolarRadians(degree)  % (2*np.pi)
-        self.complex = PolarDegreeToRectangle(modulus, degree)
-        self.roundOff = roundOff
+        phasor = object.__new__(cls)
+        phasor._complex = value
+        phasor._modulus = phasor._radian = phasor._degree = None
+        phasor.roundOff = roundOff
+        return phasor
+
+
+    def _convert(self, cls):
+        """Return a copy of the phasor as an object of another Phasor class, keeping the cached values."""
+        phasor = object.__new__(cls)
+        phasor._complex = self._complex
+        phasor._modulus = self._modulus
+        phasor._radian = self._radian
+        phasor._degree = self._degree
+        phasor.roundOff = self.roundOff
+        return phasor
+
+
+    def __reduce__(self):
+        """Pickle only the class, the complex value and roundOff, the cached values are derived again on access."""
+        return (_restorePhasor, (type(self), self._complex, self.roundOff))
+
+
+    @property
+    def complex(self):
+        """complex: Rectangular form of the phasor."""
+        return self._complex
+
+
+    @property
+    def modulus(self):
+        """float: Modulus of the phasor."""
+        if self._modulus is None:
+            self._modulus = abs(self._complex)
+        return self._modulus
+
+
+    @property
+    def radian(self):
+        """float: Angle of the phasor in radians, within [0, 2*pi)."""
+        if self._radian is None:
+            if self._degree is None:
+                self._radian = cmath.phase(self._complex) % _TWO_PI
+            else:
+                self._radian = math.radians(self._degree) % _TWO_PI
+        return self._radian
+
+
+    @property
+    def degree(self):
+        """float: Angle of the phasor in degrees, within [0, 360)."""
+        if self._degree is None:
+            self._degree = math.degrees(self.radian) % 360
+        return self._degree
 
 
     def __add__(self, other):
-        """Add two phasor objects together wit '+' operator.
+        """Add two phasor objects together with '+' operator.
 
         Args:
             other (Phasor): Other Phasor object to be added
@@ -52,17 +109,17 @@ class PhasorPD(Phasor):
             TypeError: If the second object is not a Phasor object. 
 
         Returns:
-            PhasorPD: Return addition.
+            Phasor: Returns addition as an object of the same class as this phasor.
         """
         if isinstance(other, Phasor):
-            mod, deg = RectangularToPolarDegree(self.complex+other.complex)
-            return PhasorPD(mod,deg, self.roundOff)
-        else:
-            raise TypeError(f"Unsupported operand type: {type(other)}. Addition can only be performed with Phasor instances.")
+            return self._fromComplex(self._complex + other._complex, self.roundOff)
+        if isinstance(other, _Deferred):
+            return NotImplemented
+        raise TypeError(f"Unsupported operand type: {type(other)}. Addition can only be performed with Phasor instances.")
 
     
     def __sub__(self, other):
-        """Substract of two phasor objects with '-' operatoe. 
+        """Substract of two phasor objects with '-' operator. 
 
         Args:
             other (Phasor): Other Phasor object to be substracted
@@ -71,39 +128,38 @@ class PhasorPD(Phasor):
             TypeError: If the second object is not a Phasor object. 
 
         Returns:
-             Return the defference between the phasor objects.
+            Phasor: Return the defference between the phasor objects as an object of the same class as this phasor.
         """
-        if(isinstance(other, Phasor)):
-            mod, deg = RectangularToPolarDegree(self.complex-other.complex)
-            return PhasorPD(mod,deg, self.roundOff)
-        else:
-            raise TypeError(f"Unsupported operand type: {type(other)}. Substraction can only be performed with Phasor instances.")
+        if isinstance(other, Phasor):
+            return self._fromComplex(self._complex - other._complex, self.roundOff)
+        if isinstance(other, _Deferred):
+            return NotImplemented
+        raise TypeError(f"Unsupported operand type: {type(other)}. Substraction can only be performed with Phasor instances.")
 
 
     def __mul__(self, other):
         """Multiply the Phasor object with another Phasor object or with a numerical object together with '*' operator 
 
         Args:
-            other (Phasor): Other Phasor object to be added
+            other (Phasor/int/float/complex): Other Phasor object or numerical object to be multiplied
 
         Raises:
             TypeError: If the second object is not a Phasor object or numerical object. 
 
         Returns:
-            PhasorPD: Returns multipication of the phasor object with another Phasor object or another numerical object.
+            Phasor: Returns multipication as an object of the same class as this phasor.
         """
-        if(isinstance(other, Phasor)):
-            mod, deg = RectangularToPolarDegree(self.complex * other.complex)
-            return PhasorPD(mod,deg, self.roundOff)
-        elif isinstance(other, int) or isinstance(other, float) or isinstance(other, complex):
-            mod, deg = RectangularToPolarDegree(self.complex * other)
-            return PhasorPD(mod,deg, self.roundOff)
-        else:
-            raise TypeError(f"Unsupported operand type: {type(other)}. Multiplication can only be performed with Phasor instances or with numerical instances.")
+        if isinstance(other, Phasor):
+            return self._fromComplex(self._complex * other._complex, self.roundOff)
+        if isinstance(other, (int, float, complex)):
+            return self._fromComplex(self._complex * other, self.roundOff)
+        if isinstance(other, _Deferred):
+            return NotImplemented
+        raise TypeError(f"Unsupported operand type: {type(other)}. Multiplication can only be performed with Phasor instances or with numerical instances.")
 
 
     def __truediv__(self, other):
-        """Divide the Phasor object with another Phasor object or with a numerical object together with '*' operator 
+        """Divide the Phasor object with another Phasor object or with a numerical object together with '/' operator 
 
         Args:
             other (Phasor/float/int/complex): Phasor object or the numerical value as the divisor
@@ -114,22 +170,19 @@ class PhasorPD(Phasor):
             TypeError: If the divisor object is not a Phasor object or a numerical object
 
         Returns:
-            PhasorPD: Returns the division of the Phasor object with the divisor object
+            Phasor: Returns the division as an object of the same class as this phasor.
         """
-        if(isinstance(other, Phasor)):
-            if other.complex == 0:
+        if isinstance(other, Phasor):
+            if other._complex == 0:
                 raise ZeroDivisionError("Divisor phasor is zero")
-            else:
-                mod, deg = RectangularToPolarDegree(self.complex / other.complex)
-                return PhasorPD(mod,deg, self.roundOff)
-        elif isinstance(other, int) or isinstance(other, float) or isinstance(other, complex):
+            return self._fromComplex(self._complex / other._complex, self.roundOff)
+        if isinstance(other, (int, float, complex)):
             if other == 0:
                 raise ZeroDivisionError("Divisor is zero")
-            else:
-                mod, deg = RectangularToPolarDegree(self.complex / other)
-                return PhasorPD(mod,deg, self.roundOff)
-        else:
-            raise TypeError(f"Unsupported operand type: {type(other)}. Division can only be performed with Phasor instances.")
+            return self._fromComplex(self._complex / other, self.roundOff)
+        if isinstance(other, _Deferred):
+            return NotImplemented
+        raise TypeError(f"Unsupported operand type: {type(other)}. Division can only be performed with Phasor instances or numbers.")
 
 
     def __pow__(self, power):
@@ -139,19 +192,41 @@ class PhasorPD(Phasor):
             power (int/float): The exponent 
 
         Returns:
-            PhasorPD: Returns the power of the Phasor
+            Phasor: Returns the power of the Phasor as an object of the same class as this phasor.
         """
-        mod, deg = RectangularToPolarDegree(self.complex ** power)
-        return PhasorPD(mod,deg, self.roundOff)
-       
+        return self._fromComplex(self._complex ** power, self.roundOff)
+
 
     def __invert__(self):
-        """Return the complex conjugate of the Phasor object.
+        """Return the complex conjugate of the Phasor object with '~' operator.
 
         Returns:
-            PhasorPD: Returns the conjugate. 
+            Phasor: Returns the conjugate as an object of the same class as this phasor.
+        """
+        return self._fromComplex(self._complex.conjugate(), self.roundOff)
+        
+
+class PhasorPD(Phasor):
+    """Initialize Phasor objects in Polor Coordinates with degree as the angle unit
+
+    Args:
+        Phasor (Phasor): Abstract Phasor parent class
+    """
+    __slots__ = ()
+    
+    def __init__(self,modulus, degree, roundOff = 2):
+        """Initiate PhasorPD objects
+
+        Args:
+            modulus (int/float): modulus 
+            degree (int/float): angle in degrees
+            roundOff (int, optional): Decimalpoints to be roundoff. Defaults to 2.
         """
-        return PhasorPD(self.modulus, self.degree, self.roundOff)
+        self._complex = cmath.rect(modulus, math.radians(degree))
+        self._modulus = modulus
+        self._radian = None
+        self._degree = degree % 360
+        self.roundOff = roundOff
     
     
     def __str__(self):
@@ -160,8 +235,8 @@ class PhasorPD(Phasor):
         Returns:
             String: Returns modulus and angle in degree
         """
-        mod,ang = RectangularToPolarDegree(self.complex)
-        return f"{round(mod,self.roundOff)} \u2220 {round(ang,self.roundOff)}\u00b0"
+        value = self._complex
+        return f"{round(abs(value),self.roundOff)} \u2220 {round(math.degrees(cmath.phase(value)),self.roundOff)}\u00b0"
     
 
     def __repr__(self):
@@ -170,8 +245,7 @@ class PhasorPD(Phasor):
         Returns:
             String: Returns modulus and angle in degree
         """
-        mod,ang = RectangularToPolarDegree(self.complex)
-        return f"{round(mod,self.roundOff)} \u2220 {round(ang,self.roundOff)}\u00b0"
+        return self.__str__()
 
 
 
@@ -181,6 +255,8 @@ class PhasorPR(Phasor):
     Args:
         Phasor (Phasor): Abstract Phasor parent class
     """
+    __slots__ = ()
+
     def __init__(self,modulus, radian, roundOff = 2):
         """Initiate PhasorPR objects
 
@@ -189,275 +265,391 @@ class PhasorPR(Phasor):
             radian (int/float): angle in radians
             roundOff (int, optional): Decimalpoints to be roundoff. Defaults to 2.
         """
-        self.modulus = modulus
-        self.radian = radian % (2*np.pi)
-        self.degree = PolarRadiansToPolarDegree(radian)  % 360
-        self.complex = PolarRadiansToRectangular(modulus, radian)
+        self._complex = cmath.rect(modulus, radian)
+        self._modulus = modulus
+        self._radian = radian % _TWO_PI
+        self._degree = None
         self.roundOff = roundOff
+    
+    
+    def __str__(self):
+        """Return information of Phasor object
 
+        Returns:
+            String: Returns modulus and angle in radians
+        """
+        value = self._complex
+        return f"{round(abs(value),self.roundOff)} \u2220 {round(cmath.phase(value),self.roundOff)} \u33AD"
+    
 
+    def __repr__(self):
+        """Return information of Phasor object
 
-    def __add__(self, other):
-        """Add two phasor objects together with '+' operator.
+        Returns:
+            String: Returns modulus and angle in radians
+        """
+        return self.__str__()
 
-        Args:
-            other (Phasor): Other Phasor object to be added
 
-        Raises:
-            TypeError: If the second object is not a Phasor object. 
 
-        Returns:
-            PhasorPR: Returns addition.
-        """
-        if isinstance(other, Phasor):
-            mod, rad = RectangularToPolarRadians(self.complex+other.complex)
-            return PhasorPR(mod,rad, self.roundOff)
-        else:
-            raise TypeError(f"Unsupported operand type: {type(other)}. Addition can only be performed with Phasor instances.")
 
+class PhasorRe(Phasor):
+    """Initialize Phasor objects in Rectangulatr Coordinates with complex numbers
+
+    Args:
+        Phasor (Phasor): Abstract Phasor parent class
+    """
+    __slots__ = ()
     
-    def __sub__(self, other):
-        """Substract of two phasor objects with '-' operator. 
+    def __init__(self,complex, roundOff = 2):
+        """Initiate PhasorRe objects
 
         Args:
-            other (Phasor): Other Phasor object to be substracted
+            complex (complex): Rectangular coordinates of the phasor
+            roundOff (int, optional): Decimalpoints to be roundoff. Defaults to 2.
+        """
+        self._complex = complex
+        self._modulus = self._radian = self._degree = None
+        self.roundOff = roundOff
+    
 
-        Raises:
-            TypeError: If the second object is not a Phasor object. 
+    def __str__(self):
+        """Return information of Phasor object
 
         Returns:
-            PhasorPR:  Return the defference between the phasor objects.
+            String: Returns the phasor in rectangular coordinates
         """
-        if(isinstance(other, Phasor)):
-            mod, rad = RectangularToPolarRadians(self.complex-other.complex)
-            return PhasorPR(mod,rad, self.roundOff)
-        else:
-            raise TypeError(f"Unsupported operand type: {type(other)}. Substraction can only be performed with Phasor instances.")
+        value = self._complex
+        return f"{complex(round(value.real, self.roundOff),round(value.imag, self.roundOff))}"
+    
 
+    def __repr__(self):
+        """Return information of Phasor object
 
-    def __mul__(self, other):
-        """Multiply the Phasor object with another Phasor object or with a numerical object together with '*' operator 
+        Returns:
+            String: Returns the phasor in rectangular coordinates
+        """
+        return self.__str__()
 
-        Args:
-            other (Phasor): Other Phasor object to be added
 
-        Raises:
-            TypeError: If the second object is not a Phasor object or numerical object. 
 
-        Returns:
-            PhasorPR: Returns multipication of the phasor object with another Phasor object or another numerical object.
-        """
-        if(isinstance(other, Phasor)):
-            mod, rad = RectangularToPolarDegree(self.complex * other.complex)
-            return PhasorPR(mod, rad, self.roundOff)
-        elif isinstance(other, int) or isinstance(other, float) or isinstance(other, complex):
-            mod, rad = RectangularToPolarDegree(self.complex * other)
-            return PhasorPR(mod, rad, self.roundOff)
-        else:
-            raise TypeError(f"Unsupported operand type: {type(other)}. Multiplication can only be performed with Phasor instances.")
+class PhasorArray:
+    """Store many phasors in one contiguous complex128 array and do whole-array phasor calculations.
 
+    The operators mirror the scalar Phasor classes but run as single NumPy operations over the whole buffer.
+    Scalar Phasor objects can be mixed in as operands and are broadcast over the array.
+    """
+    __array_ufunc__ = None
 
-    def __truediv__(self, other):
-        """Divide the Phasor object with another Phasor object or with a numerical object together with '*' operator 
+    def __init__(self, values, roundOff = 2, form = "PD"):
+        """Initiate PhasorArray objects
 
         Args:
-            other (Phasor/float/int/complex): Phasor object or the numerical value as the divisor
+            values (array_like/PhasorArray/list of Phasor): Complex values or Phasor objects to store, in nested
+                sequences or object arrays of any shape.
+            roundOff (int, optional): Decimalpoints to be roundoff. Defaults to 2.
+            form (str, optional): Display form of the phasors, one of "PD", "PR" or "Re". Defaults to "PD".
 
         Raises:
-            ZeroDivisionError: If the divisor is Phasor object and value is zero 
-            ZeroDivisionError: If the divisor is numerical object and value is zero
-            TypeError: If the divisor object is not a Phasor object or a numerical object
-
-        Returns:
-            PhasorPR: Returns the division of the Phasor object with the divisor object
+            ValueError: If the form is not one of "PD", "PR" or "Re".
         """
-        if(isinstance(other, Phasor)):
-            if other.complex == 0:
-                raise ZeroDivisionError("Divisor phasor is zero")
-            else:
-                mod, rad = RectangularToPolarRadians(self.complex / other.complex)
-                return PhasorPR(mod,rad, self.roundOff)
-        elif isinstance(other, int) or isinstance(other, float) or isinstance(other, complex):
-            if other == 0:
-                raise ZeroDivisionError("Divisor is zero")
-            else:
-                mod, rad = RectangularToPolarRadians(self.complex / other)
-                return PhasorPR(mod,rad, self.roundOff)
-        else:
-            raise TypeError(f"Unsupported operand type: {type(other)}. Division can only be performed with Phasor instances.")
+        if form not in _SCALAR_CLASSES:
+            raise ValueError(f"Unsupported form: {form}. Form should be one of {tuple(_SCALAR_CLASSES)}.")
+        if isinstance(values, PhasorArray):
+            values = values.complex
+        elif isinstance(values, Phasor):
+            values = values.complex
+        elif isinstance(values, (list, tuple)) or (isinstance(values, np.ndarray) and values.dtype == object):
+            try:
+                values = np.asarray(values, dtype=np.complex128)
+            except TypeError:
+                # Phasor objects inside the sequences are replaced by their complex values, at any depth
+                values = _complexValues(np.array(values, dtype=object))
+        self.complex = np.asarray(values, dtype=np.complex128)
+        self.roundOff = roundOff
+        self.form = form
 
 
-    def __pow__(self, power):
-        """Returns the power of an phasor object by using '**' operator
+    @classmethod
+    def fromDegree(cls, modulus, degree, roundOff = 2):
+        """Create a PhasorArray from moduli and angles in degrees.
 
         Args:
-            power (int/float): The exponent 
+            modulus (array_like): Moduli of the phasors
+            degree (array_like): Angles in degrees
+            roundOff (int, optional): Decimalpoints to be roundoff. Defaults to 2.
 
         Returns:
-            PhasorPR: Returns the power of the Phasor
+            PhasorArray: Phasors in polar coordinates with degree as the angle unit
         """
-        mod, rad = RectangularToPolarRadians(self.complex ** power)
-        return PhasorPR(mod ,rad, self.roundOff)
-       
+        return cls(PolarDegreeToRectangle(np.asarray(modulus, dtype=float), degree), roundOff, "PD")
 
-    def __invert__(self):
-        """Return the complex conjugate of the Phasor object.
 
-        Returns:
-            PhasorPR: Returns the conjugate. 
-        """
-        "Find the complex conjugate of the phasor by ' ` ' "
-        return PhasorPR(self.modulus, -self.radian, self.roundOff)
-    
-    
-    def __str__(self):
-        """Return information of Phasor object
+    @classmethod
+    def fromRadian(cls, modulus, radian, roundOff = 2):
+        """Create a PhasorArray from moduli and angles in radians.
+
+        Args:
+            modulus (array_like): Moduli of the phasors
+            radian (array_like): Angles in radians
+            roundOff (int, optional): Decimalpoints to be roundoff. Defaults to 2.
 
         Returns:
-            String: Returns modulus and angle in radians
+            PhasorArray: Phasors in polar coordinates with radians as the angle unit
         """
-        mod,ang = RectangularToPolarRadians(self.complex)
-        return f"{round(mod,self.roundOff)} \u2220 {round(ang,self.roundOff)} \u33AD"
-    
+        return cls(PolarRadiansToRectangular(np.asarray(modulus, dtype=float), radian), roundOff, "PR")
 
-    def __repr__(self):
-        """Return information of Phasor object
+
+    @property
+    def modulus(self):
+        """ndarray: Moduli of all phasors."""
+        return np.absolute(self.complex)
+
+
+    @property
+    def radian(self):
+        """ndarray: Angles of all phasors in radians, within [0, 2*pi)."""
+        return np.angle(self.complex) % (2*np.pi)
+
+
+    @property
+    def degree(self):
+        """ndarray: Angles of all phasors in degrees, within [0, 360)."""
+        return np.angle(self.complex, deg=True) % 360
+
+
+    @property
+    def shape(self):
+        """tuple: Shape of the underlying complex array."""
+        return self.complex.shape
+
+
+    def __len__(self):
+        if not self.complex.ndim:
+            raise TypeError("Unsupported operation: len() of a 0-d PhasorArray. Index it with [()] to get its Phasor object.")
+        return len(self.complex)
+
+
+    def __reduce__(self):
+        """Pickle the complex buffer with roundOff and form, without the instance dictionary."""
+        return (PhasorArray, (self.complex, self.roundOff, self.form))
+
+
+    def __getitem__(self, index):
+        """Index the array like an ndarray.
+
+        Args:
+            index (int/slice/tuple/ndarray): Index into the underlying complex array.
 
         Returns:
-            String: Returns modulus and angle in radians
+            Phasor/PhasorArray: A scalar Phasor object for a single element, otherwise a PhasorArray.
         """
-        mod,ang = RectangularToPolarRadians(self.complex)
-        return f"{round(mod,self.roundOff)} \u2220 {round(ang,self.roundOff)} \u00b0"
+        value = self.complex[index]
+        if isinstance(value, np.ndarray):
+            return PhasorArray(value, self.roundOff, self.form)
+        return _SCALAR_CLASSES[self.form]._fromComplex(complex(value), self.roundOff)
 
 
+    def __iter__(self):
+        if not self.complex.ndim:
+            raise TypeError("Unsupported operation: iteration over a 0-d PhasorArray. Index it with [()] to get its Phasor object.")
+        return (self[i] for i in range(len(self.complex)))
 
 
-class PhasorRe(Phasor):
-    """Initialize Phasor objects in Rectangulatr Coordinates with complex numbers
+    def __array__(self, dtype = None, copy = None):
+        if dtype is None or np.dtype(dtype) == self.complex.dtype:
+            return self.complex.copy() if copy else self.complex
+        return self.complex.astype(dtype)
 
-    Args:
-        Phasor (Phasor): Abstract Phasor parent class
-    """
-    
-    def __init__(self,complex, roundOff = 2):
-        """Initiate PhasorRe objects
+
+    def _operand(self, other, numbers):
+        """Return the complex value of an operand, None when it is not supported, or NotImplemented when
+        the operand handles the operation itself.
 
         Args:
-            complex (complex): Rectangular coordinates of the phasor
-            roundOff (int, optional): Decimalpoints to be roundoff. Defaults to 2.
+            other (PhasorArray/Phasor/Number/ndarray): Operand, where numbers include NumPy scalars
+            numbers (bool): Whether numerical operands are accepted.
         """
-        self.complex = complex
-        self.modulus,self.radian = RectangularToPolarRadians(complex) 
-        self.radian = self.radian % (2 * np.pi)
-        self.degree = PolarRadiansToPolarDegree(self.radian) % 360
-        self.roundOff = roundOff
+        if isinstance(other, (PhasorArray, Phasor)):
+            return other.complex
+        if numbers and isinstance(other, (Number, np.ndarray)):
+            return other
+        if isinstance(other, _Deferred):
+            return NotImplemented
+        return None
+
+
+    def _reflected(self, other):
+        """Return the roundOff and form a result should take when a scalar Phasor is the left operand."""
+        if isinstance(other, Phasor):
+            return other.roundOff, _FORM_NAMES.get(type(other), self.form)
+        return self.roundOff, self.form
 
 
     def __add__(self, other):
-        """Add two phasor objects together with '+' operator.
+        """Add phasors element-wise with '+' operator.
 
         Args:
-            other (Phasor): Other Phasor object to be added
+            other (PhasorArray/Phasor): Phasors to be added
 
         Raises:
-            TypeError: If the second object is not a Phasor object. 
+            TypeError: If the second object is not a Phasor or PhasorArray object.
 
         Returns:
-            PhasorRe: Returns addition.
+            PhasorArray: Return addition.
         """
-        if isinstance(other, Phasor):
-            return PhasorRe(self.complex + other.complex, self.roundOff)
-        else:
+        value = self._operand(other, False)
+        if value is NotImplemented:
+            return value
+        if value is None:
             raise TypeError(f"Unsupported operand type: {type(other)}. Addition can only be performed with Phasor instances.")
+        return PhasorArray(self.complex + value, self.roundOff, self.form)
+
+
+    def __radd__(self, other):
+        value = self._operand(other, False)
+        if value is NotImplemented:
+            return value
+        if value is None:
+            raise TypeError(f"Unsupported operand type: {type(other)}. Addition can only be performed with Phasor instances.")
+        return PhasorArray(value + self.complex, *self._reflected(other))
+
 
-    
     def __sub__(self, other):
-        """Substract of two phasor objects with '-' operator. 
+        """Substract phasors element-wise with '-' operator.
 
         Args:
-            other (Phasor): Other Phasor object to be substracted
+            other (PhasorArray/Phasor): Phasors to be substracted
 
         Raises:
-            TypeError: If the second object is not a Phasor object. 
+            TypeError: If the second object is not a Phasor or PhasorArray object.
 
         Returns:
-            PhasorRe: Return the defference between the phasor objects.
+            PhasorArray: Return the defference between the phasors.
         """
-        if(isinstance(other, Phasor)):
-            return PhasorRe(self.complex - other.complex ,  self.roundOff)
-        else:
+        value = self._operand(other, False)
+        if value is NotImplemented:
+            return value
+        if value is None:
+            raise TypeError(f"Unsupported operand type: {type(other)}. Substraction can only be performed with Phasor instances.")
+        return PhasorArray(self.complex - value, self.roundOff, self.form)
+
+
+    def __rsub__(self, other):
+        value = self._operand(other, False)
+        if value is NotImplemented:
+            return value
+        if value is None:
             raise TypeError(f"Unsupported operand type: {type(other)}. Substraction can only be performed with Phasor instances.")
+        return PhasorArray(value - self.complex, *self._reflected(other))
 
 
     def __mul__(self, other):
-        """Multiply phashor instances"""
-        if(isinstance(other, Phasor)):
-            return PhasorRe(self.complex * other.complex,  self.roundOff)
-        elif isinstance(other, int) or isinstance(other, float) or isinstance(other, complex):
-            return PhasorRe(self.complex * other)
-        else:
-            raise TypeError(f"Unsupported operand type: {type(other)}. Multiplication can only be performed with Phasor instances or numbers.")
+        """Multiply phasors element-wise with Phasor objects or numerical objects with '*' operator.
+
+        Args:
+            other (PhasorArray/Phasor/int/float/complex/ndarray): Multiplier
+
+        Raises:
+            TypeError: If the second object is not a Phasor object or numerical object.
+
+        Returns:
+            PhasorArray: Returns multipication.
+        """
+        value = self._operand(other, True)
+        if value is NotImplemented:
+            return value
+        if value is None:
+            raise TypeError(f"Unsupported operand type: {type(other)}. Multiplication can only be performed with Phasor instances or with numerical instances.")
+        return PhasorArray(self.complex * value, self.roundOff, self.form)
+
+
+    def __rmul__(self, other):
+        value = self._operand(other, True)
+        if value is NotImplemented:
+            return value
+        if value is None:
+            raise TypeError(f"Unsupported operand type: {type(other)}. Multiplication can only be performed with Phasor instances or with numerical instances.")
+        return PhasorArray(value * self.complex, *self._reflected(other))
 
 
     def __truediv__(self, other):
-        """Multiply the Phasor object with another Phasor object or with a numerical object together with '*' operator 
+        """Divide phasors element-wise by Phasor objects or numerical objects with '/' operator.
 
         Args:
-            other (Phasor): Other Phasor object to be added
+            other (PhasorArray/Phasor/int/float/complex/ndarray): Divisor
 
         Raises:
-            TypeError: If the second object is not a Phasor object or numerical object. 
+            ZeroDivisionError: If any divisor is zero
+            TypeError: If the divisor object is not a Phasor object or a numerical object
 
         Returns:
-            PhasorRe: Returns multipication of the phasor object with another Phasor object or another numerical object.
+            PhasorArray: Returns the division.
         """
-        if(isinstance(other, Phasor)):
-            if other.complex == 0:
-                raise ZeroDivisionError("Divisor phasor is zero")
-            else:
-                return PhasorRe(self.complex / other.complex,  self.roundOff)
-        elif isinstance(other, int) or isinstance(other, float) or isinstance(other, complex):
-            if other == 0:
-                raise ZeroDivisionError("Divisor is zero")
-            else:
-                return PhasorRe(self.complex * other)
-        else:
+        value = self._operand(other, True)
+        if value is NotImplemented:
+            return value
+        if value is None:
             raise TypeError(f"Unsupported operand type: {type(other)}. Division can only be performed with Phasor instances or numbers.")
+        if np.any(np.equal(value, 0)):
+            raise ZeroDivisionError("Divisor phasor is zero")
+        return PhasorArray(self.complex / value, self.roundOff, self.form)
 
 
-    def __pow__(self, value):
-        """Provide the power functionality for phasors"""
-        return PhasorRe(self.complex ** value,  self.roundOff)
-       
+    def __rtruediv__(self, other):
+        value = self._operand(other, True)
+        if value is NotImplemented:
+            return value
+        if value is None:
+            raise TypeError(f"Unsupported operand type: {type(other)}. Division can only be performed with Phasor instances or numbers.")
+        if np.any(self.complex == 0):
+            raise ZeroDivisionError("Divisor phasor is zero")
+        return PhasorArray(value / self.complex, *self._reflected(other))
 
-    def __invert__(self):
-        """Returns the power of an phasor object by using '**' operator
+
+    def __pow__(self, power):
+        """Returns the element-wise power of the phasors by using '**' operator
 
         Args:
-            power (int/float): The exponent 
+            power (int/float/ndarray): The exponent
 
         Returns:
-            PhasorRe: Returns the power of the Phasor
+            PhasorArray: Returns the power of the phasors
         """
-        return PhasorRe(np.conjugate(self.complex), self.roundOff)
-    
+        return PhasorArray(self.complex ** power, self.roundOff, self.form)
+
+
+    def __invert__(self):
+        """Return the complex conjugate of all phasors.
+
+        Returns:
+            PhasorArray: Returns the conjugate.
+        """
+        return PhasorArray(np.conjugate(self.complex), self.roundOff, self.form)
+
 
     def __str__(self):
-        """Return information of Phasor object
+        """Return information of PhasorArray object
 
         Returns:
-            String: Returns the phasor in rectangular coordinates
+            String: Returns the phasors in the display form of the array
         """
-        return f"{complex(round(self.complex.real, self.roundOff),round(self.complex.imag, self.roundOff))}"
-    
+        flat = self.complex.ravel()
+        shown = np.concatenate((flat[:3], flat[-3:])) if flat.size > 6 else flat
+        scalar = _SCALAR_CLASSES[self.form]
+        items = [str(scalar._fromComplex(complex(i), self.roundOff)) for i in shown]
+        if flat.size > 6:
+            items.insert(3, "...")
+        return f"PhasorArray([{', '.join(items)}], shape={self.shape})"
+
 
     def __repr__(self):
-        """Return information of Phasor object
+        """Return information of PhasorArray object
 
         Returns:
-            String: Returns the phasor in rectangular coordinates
+            String: Returns the phasors in the display form of the array
         """
-        return f"{complex(round(self.complex.real, self.roundOff),round(self.complex.imag, self.roundOff))}"
+        return self.__str__()
 
 
 
@@ -465,16 +657,18 @@ def toRec(phasorObject):
     """Convert any type of phaasor object to PhasorRe object.
 
     Args:
-        phasorObject (Phasor): Phasor object to be converted.
+        phasorObject (Phasor/PhasorArray): Phasor object to be converted.
 
     Raises:
         TypeError: If the argument is not a phasor object.
 
     Returns:
-        PhasorRe: Phasor object with rectangular coordinates.
+        PhasorRe/PhasorArray: Phasor object with rectangular coordinates. A PhasorArray is returned as a view sharing the same complex buffer.
     """
+    if isinstance(phasorObject, PhasorArray):
+        return PhasorArray(phasorObject.complex, phasorObject.roundOff, "Re")
     if isinstance(phasorObject, Phasor):
-        return PhasorRe(phasorObject.complex, phasorObject.roundOff) 
+        return phasorObject._convert(PhasorRe)
     else:
         raise TypeError(f"Unsupported argument type: {type(phasorObject)}.")
         
@@ -483,16 +677,18 @@ def toRad(phasorObject):
     """Convert any type of phasor object to PhasorPR object.
 
     Args:
-        phasorObject (Phasor): Phasor object to be converted.
+        phasorObject (Phasor/PhasorArray): Phasor object to be converted.
 
     Raises:
         TypeError: If the argument is not a phasor object.
 
     Returns:
-        PhasorPR: Phasor object with polar coordiantes with angles in radians.
+        PhasorPR/PhasorArray: Phasor object with polar coordiantes with angles in radians. A PhasorArray is returned as a view sharing the same complex buffer.
     """
+    if isinstance(phasorObject, PhasorArray):
+        return PhasorArray(phasorObject.complex, phasorObject.roundOff, "PR")
     if isinstance(phasorObject, Phasor):
-        return PhasorPR(phasorObject.modulus, phasorObject.radian, phasorObject.roundOff) 
+        return phasorObject._convert(PhasorPR)
     else:
         raise TypeError(f"Unsupported argument type: {type(phasorObject)}.")
 
@@ -501,16 +697,28 @@ def toDeg(phasorObject):
     """Convert any type of phasor object to PhasorPD object.
 
     Args:
-        phasorObject (Phasor): Phasor object to be converted.
+        phasorObject (Phasor/PhasorArray): Phasor object to be converted.
 
     Raises:
         TypeError: If the argument is not a phasor object.
 
     Returns:
-        PhasorPD: Phasor object with polar coordiantes with angles in degrees.
+        PhasorPD/PhasorArray: Phasor object with polar coordiantes with angles in degrees. A PhasorArray is returned as a view sharing the same complex buffer.
     """
+    if isinstance(phasorObject, PhasorArray):
+        return PhasorArray(phasorObject.complex, phasorObject.roundOff, "PD")
     if isinstance(phasorObject, Phasor):
-        return PhasorPD(phasorObject.modulus, phasorObject.degree, phasorObject.roundOff) 
+        return phasorObject._convert(PhasorPD)
     else:
         raise TypeError(f"Unsupported argument type: {type(phasorObject)}.")
 
+
+def _restorePhasor(cls, value, roundOff):
+    """Recreate a pickled phasor object from its complex value."""
+    return cls._fromComplex(value, roundOff)
+
+
+_Deferred.register(PhasorArray)
+_SCALAR_CLASSES = {"PD": PhasorPD, "PR": PhasorPR, "Re": PhasorRe}
+_complexValues = np.frompyfunc(lambda value: value.complex if isinstance(value, Phasor) else value, 1, 1)
+_FORM_NAMES = {PhasorPD: "PD", PhasorPR: "PR", PhasorRe: "Re"}
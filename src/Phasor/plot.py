@@ -1,95 +1,267 @@
-"""Plots the phasor objects and symmetrical phasor components."""
+"""Plots the phasor objects and symmetrical phasor components.
 
-from .sc import *
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-from .phasor import *
-from abc import abstractmethod
+plotly is imported when the first figure is built, so importing this module stays cheap.
+"""
+
+import numbers
+import threading
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+# The phasor and sequence classes are imported by name, and stay available to star imports of this module
+from .phasor import Phasor, PhasorPD, PhasorPR, PhasorRe, PhasorArray, toRec, toRad, toDeg
+from .sc import UtoSC, SCtoU, batchUtoSC, batchSCtoU, rotatedComponents
+
+
+_ARROW = dict(
+    symbol="arrow",
+    size=15,
+    angleref="previous",
+)
+
+_CONFIG = {'modeBarButtonsToAdd': ['drawline',
+                                    'drawopenpath',
+                                    'drawclosedpath',
+                                    'drawcircle',
+                                    'drawrect',
+                                    'eraseshape'
+                                    ]}
 
 
 class Plot:
-    """Generate polar plots to visualize Phasor objects, SCToUnbalanced objects, unbalancedToSC objects  
+    """Generate polar plots to visualize Phasor objects, PhasorArray objects, SCtoU objects and UtoSC objects
     """
-    def __init__(self,*phasor,theme = 0):
+    def __init__(self,*phasor,theme = 0, maxPoints = None, webgl = False, show = True):
         """Initialize Plot objects.
 
         Args:
-            *phasor (Phasor/SCToUnbalanced/unbalancedToSC): phasor objects to visualize
+            *phasor (Phasor/PhasorArray/SCtoU/UtoSC): phasor objects to visualize
             theme (int, optional): Theme selection. Defaults to 0.
+            maxPoints (int, optional): Maximum number of phasors drawn from each PhasorArray. Larger arrays are
+                decimated with an even stride. Defaults to None, drawing every phasor.
+            webgl (bool, optional): Draw PhasorArray traces with WebGL backed Scatterpolargl. Defaults to False.
+            show (bool, optional): Show the figure once it is built. Set to False for batch or headless use. Defaults to True.
+
+        Raises:
+            ValueError: If maxPoints is not a positive integer.
         """
+        if maxPoints is not None and (isinstance(maxPoints, bool) or not isinstance(maxPoints, numbers.Integral) or maxPoints <= 0):
+            raise ValueError(f"Unsupported maxPoints: {maxPoints}. maxPoints should be a positive integer or None.")
         self.phasor = phasor
         self.theme = theme
+        self.maxPoints = maxPoints
+        self.webgl = webgl
+        import plotly.graph_objects as go
         self.fig = go.Figure()
         
         for i in phasor:
             self.createTrace(i)
         
         self.fig.update_layout(template = self.setTheme())
-        self.fig.show(config={'modeBarButtonsToAdd': ['drawline',
-                                    'drawopenpath',
-                                    'drawclosedpath',
-                                    'drawcircle',
-                                    'drawrect',
-                                    'eraseshape'
-                                    ]})
-    
+        if show:
+            self.show()
+
+
+    def show(self):
+        """Show the figure."""
+        self.fig.show(config=_CONFIG)
+
+
+    def update(self, *phasor):
+        """Reuse the figure as a template by replacing the data of its traces in place.
+
+        The layout, styling and trace objects are kept, only r, theta and names change.
+
+        Args:
+            *phasor (Phasor/PhasorArray/SCtoU/UtoSC): phasor objects of the same kinds the figure was built from
+
+        Raises:
+            ValueError: If the phasor objects do not produce the same number of traces as the figure holds.
+
+        Returns:
+            Plot: The same Plot object.
+        """
+        segments = [segment for i in phasor for segment in self.segments(i)]
+        if len(segments) != len(self.fig.data):
+            raise ValueError(f"Unsupported phasor objects: they give {len(segments)} traces but the figure holds {len(self.fig.data)}.")
+        with self.fig.batch_update():
+            for trace, (r, theta, name) in zip(self.fig.data, segments):
+                trace.r = r
+                trace.theta = theta
+                trace.name = name
+        self.phasor = phasor
+        return self
+
+
+    def segments(self, phasor):
+        """Return the data of every trace drawn for a phasor object.
+
+        Args:
+            phasor (Phasor/PhasorArray/SCtoU/UtoSC): phasor object to visualize
+
+        Raises:
+            TypeError: If the object is not one of the supported types.
+
+        Returns:
+            list: (r, theta, name) of each trace in the order they are drawn.
+        """
+        phasorNameSet = ("A","B","C")
+        if isinstance(phasor, Phasor):
+            return [([0 , phasor.modulus], [0 ,phasor.degree], f'{phasor}')]
+
+        elif isinstance(phasor, PhasorArray):
+            values = phasor.complex.ravel()
+            if self.maxPoints is not None and values.size > self.maxPoints:
+                values = values[::-(-values.size // self.maxPoints)]
+            # Every phasor is a line from the origin to its tip, followed by a NaN gap
+            r = np.zeros(3 * values.size)
+            theta = np.zeros(3 * values.size)
+            np.absolute(values, out=r[1::3])
+            theta[1::3] = np.angle(values, deg=True)
+            r[2::3] = np.nan
+            theta[2::3] = np.nan
+            return [(r, theta, f'{phasor.complex.size} phasors')]
+
+        elif isinstance(phasor, UtoSC):
+            return [([0, j.modulus], [0,j.degree], f'{phasorNameSet[idx]}{i} - {j}')
+                    for i in range(3) for idx,j in enumerate(phasor.allComponents[i])]
+
+        elif isinstance(phasor, SCtoU):
+            return [([0 , i.modulus], [0 ,i.degree], f'{phasorNameSet[idx]} - {i}') for idx,i in enumerate(phasor.unbalanced)]
+
+        else:
+          raise TypeError(f"Unsupported operand type: {type(phasor)}")
+
+
     def createTrace(self,phasor):
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+        segments = self.segments(phasor)
         
         if isinstance(phasor, Phasor):
-            self.fig = go.Figure()
+            (r, theta, name), = segments
             self.fig.add_trace(go.Scatterpolar(
-                r = [0 , phasor.modulus],
-                theta = [0 ,phasor.degree],
-                name = f'{phasor}',
+                r = r,
+                theta = theta,
+                name = name,
                 showlegend=True,
                 line_color = self.color(phasor),
                 mode="lines+markers",
-                marker=dict(
-                    symbol="arrow",
-                    size=15,
-                    angleref="previous",
-                )       
+                marker=_ARROW
             ))
 
-        elif isinstance(phasor, unbalancedToSC):
+        elif isinstance(phasor, PhasorArray):
+            (r, theta, name), = segments
+            trace = go.Scatterpolargl if self.webgl else go.Scatterpolar
+            self.fig.add_trace(trace(
+                r = r,
+                theta = theta,
+                name = name,
+                showlegend=True,
+                line_color = self.color(phasor),
+                mode="lines",
+                connectgaps=False,
+            ))
+
+        elif isinstance(phasor, UtoSC):
             phasorNameSet = ("A","B","C")
             self.fig = make_subplots(rows=1, cols=3, specs=[[{'type': 'polar'}]*3],subplot_titles=("Zero Sequence","Positive Sequence","Negative Sequence"))
-            for i in range(3):
-                for idx,j in enumerate(phasor.allComponents[i]):
-                    self.fig.add_trace(go.Scatterpolar(
-                        r = [0, j.modulus],
-                        theta= [0,j.degree],
-                        name = f'{phasorNameSet[idx]}{i} - {j}',
-                        line_color = self.color(phasorNameSet[idx]),
-                        mode="lines+markers",
-                        marker=dict(
-                            symbol="arrow",
-                            size=15,
-                            angleref="previous",
-                        ) 
-                    ),1, i+1)
-
-        elif isinstance(phasor, SCToUnbalanced):
+            for position, (r, theta, name) in enumerate(segments):
+                i, idx = divmod(position, 3)
+                self.fig.add_trace(go.Scatterpolar(
+                    r = r,
+                    theta= theta,
+                    name = name,
+                    line_color = self.color(phasorNameSet[idx]),
+                    mode="lines+markers",
+                    marker=_ARROW
+                ),1, i+1)
+
+        elif isinstance(phasor, SCtoU):
             phasorNameSet = ("A","B","C")
-            for idx,i in enumerate(phasor.unbalanced):
+            for idx, (r, theta, name) in enumerate(segments):
                 self.fig.add_trace(go.Scatterpolar(
-                    r = [0 , i.modulus],
-                    theta = [0 ,i.degree],
-                    # mode = 'lines',
-                    name = f'{phasorNameSet[idx]} - {i}',
+                    r = r,
+                    theta = theta,
+                    name = name,
                     line_color = self.color(phasorNameSet[idx]),
                     mode="lines+markers",
-                    marker=dict(
-                        symbol="arrow",
-                        size=15,
-                        angleref="previous",
-                    )       
+                    marker=_ARROW
                 ))
+        
 
+    def animate(self, series, sequence = False, maxFrames = 300, duration = 50):
+        """Replace the figure with an animated phasor diagram of a time series.
+
+        Frames only hold the r and theta values of each trace, all styling lives in the base traces.
+        Long series are subsampled to maxFrames evenly spaced frames so the figure size stays bounded.
+
+        Args:
+            series (PhasorArray/array_like/list of UtoSC): (T,) or (T, k) phasors over time, or UtoSC results over time.
+            sequence (bool, optional): Draw the zero, positive and negative sequence components of (T, 3) phases.
+                Always used for UtoSC results. Defaults to False.
+            maxFrames (int, optional): Maximum number of frames. None keeps every timestep. Defaults to 300.
+            duration (int, optional): Duration of each frame in milliseconds. Defaults to 50.
+
+        Raises:
+            ValueError: If the series holds no phasors.
+
+        Returns:
+            Plot: The same Plot object.
+        """
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+        if isinstance(series, (list, tuple)) and series and isinstance(series[0], UtoSC):
+            series = [(i.A.complex, i.B.complex, i.C.complex) for i in series]
+            sequence = True
+        values = np.asarray(getattr(series, "complex", series), dtype=np.complex128)
+        if not values.ndim or not values.size:
+            raise ValueError(f"Unsupported series of shape {values.shape}. The series should hold at least one timestep of phasors.")
+        values = values.reshape(len(values), -1)
+        if maxFrames is not None and len(values) > maxFrames:
+            values = values[np.unique(np.linspace(0, len(values) - 1, maxFrames).round().astype(int))]
+        if sequence:
+            values = rotatedComponents(batchUtoSC(values)).reshape(len(values), 9)
+
+        moduli = np.absolute(values)
+        angles = np.angle(values, deg=True)
+        phasorNameSet = ("A","B","C")
+        if sequence:
+            self.fig = make_subplots(rows=1, cols=3, specs=[[{'type': 'polar'}]*3],subplot_titles=("Zero Sequence","Positive Sequence","Negative Sequence"))
+            names = [f"{i}{j}" for j in range(3) for i in phasorNameSet]
         else:
-          raise TypeError(f"Unsupported operand type: {type(phasor)}")
-        
+            self.fig = go.Figure()
+            names = list(phasorNameSet) if values.shape[1] == 3 else [f"P{i}" for i in range(values.shape[1])]
+
+        for position, name in enumerate(names):
+            trace = go.Scatterpolar(
+                r = [0, moduli[0, position]],
+                theta = [0, angles[0, position]],
+                name = name,
+                line_color = self.color(name[0] if sequence else name),
+                mode="lines+markers",
+                marker=_ARROW
+            )
+            if sequence:
+                self.fig.add_trace(trace, 1, position // 3 + 1)
+            else:
+                self.fig.add_trace(trace)
+
+        radialRange = dict(range=[0, float(moduli.max())])
+        polars = ("polar", "polar2", "polar3") if sequence else ("polar",)
+        frameNames = [str(i) for i in range(len(values))]
+        self.fig.update_layout(
+            template = self.setTheme(),
+            **{polar: dict(radialaxis=radialRange) for polar in polars},
+            updatemenus=[dict(type="buttons", showactive=False, buttons=[
+                dict(label="Play", method="animate", args=[None, dict(frame=dict(duration=duration, redraw=True), fromcurrent=True)]),
+                dict(label="Pause", method="animate", args=[[None], dict(frame=dict(duration=0, redraw=False), mode="immediate")]),
+            ])],
+            sliders=[dict(steps=[dict(method="animate", label=name, args=[[name], dict(mode="immediate", frame=dict(duration=0, redraw=True))]) for name in frameNames])],
+        )
+        self.fig.frames = list(animationFrames(moduli, angles, frameNames))
+        return self
+
 
     def color(self,phasor):
         colorSet = [
@@ -110,3 +282,173 @@ class Plot:
         return themes[self.theme]
 
 
+
+def animationFrames(moduli, angles, names = None):
+    """Lazily generate compact animation frames holding only the r and theta values of each trace.
+
+    Args:
+        moduli (ndarray): (T, k) moduli of the k traces at each frame.
+        angles (ndarray): (T, k) angles in degrees of the k traces at each frame.
+        names (list, optional): Name of each frame. Defaults to the frame index.
+
+    Yields:
+        dict: Plotly frame of one timestep.
+    """
+    traces = list(range(moduli.shape[1]))
+    for index in range(len(moduli)):
+        yield dict(
+            name = names[index] if names is not None else str(index),
+            data = [dict(type="scatterpolar", r=(0, m), theta=(0, a)) for m, a in zip(moduli[index].tolist(), angles[index].tolist())],
+            traces = traces,
+        )
+
+
+class LivePlot:
+    """Keep one persistent phasor diagram and update it in place at PMU rates.
+
+    Pushed frames are coalesced: only the latest frame waits to be rendered, and frames that are replaced
+    before the renderer gets to them are counted as dropped. A frame held back by the rate limit is rendered
+    when the limit allows, by the running asyncio event loop or else by a timer thread, so the last frame
+    of a paused producer is always drawn.
+    """
+    def __init__(self, sequence = False, theme = 0, maxRate = 30.0, widget = True):
+        """Initialize LivePlot objects.
+
+        Args:
+            sequence (bool, optional): Draw the zero, positive and negative sequence components instead of phases A, B and C. Defaults to False.
+            theme (int, optional): Theme selection. Defaults to 0.
+            maxRate (float, optional): Maximum number of renders per second. Defaults to 30.0.
+            widget (bool, optional): Use a plotly FigureWidget so updates reach a notebook view directly.
+                Falls back to a plain Figure when the widget dependencies are missing. Defaults to True.
+        """
+        zero = PhasorRe(0j)
+        template = Plot(UtoSC(zero, zero, zero) if sequence else SCtoU(zero, zero, zero), theme=theme, show=False)
+        names = [f"{i}{j}" for j in range(3) for i in "ABC"] if sequence else ["A", "B", "C"]
+        for trace, name in zip(template.fig.data, names):
+            trace.name = name
+        self.fig = template.fig
+        if widget:
+            import plotly.graph_objects as go
+            try:
+                self.fig = go.FigureWidget(template.fig)
+            except ImportError:
+                pass
+
+        self.sequence = sequence
+        self.interval = 1 / maxRate
+        self.received = 0
+        self.rendered = 0
+        self.dropped = 0
+        self._pending = None
+        self._lastRender = float("-inf")
+        self._flush = None
+        self._lock = threading.RLock()
+
+
+    def push(self, *phasor):
+        """Push a new frame and render it when the rate limit allows.
+
+        Args:
+            *phasor: Phasors A, B and C as Phasor objects or complex numbers, a UtoSC object,
+                or a (3,) or (N, 3) array_like of A, B and C values. Only the last row of an (N, 3) array is drawn.
+
+        Raises:
+            ValueError: If the frame does not hold three phases.
+
+        Returns:
+            bool: Whether the frame was rendered immediately.
+        """
+        if len(phasor) == 1 and isinstance(phasor[0], UtoSC):
+            phasor = (phasor[0].A, phasor[0].B, phasor[0].C)
+        if len(phasor) == 3:
+            phases = np.array([getattr(i, "complex", i) for i in phasor], dtype=np.complex128)[None]
+        elif len(phasor) == 1:
+            phases = np.asarray(getattr(phasor[0], "complex", phasor[0]), dtype=np.complex128).reshape(-1, 3)
+        else:
+            raise ValueError(f"Unsupported frame: {len(phasor)} values were given instead of phases A, B and C.")
+
+        with self._lock:
+            self.received += len(phases)
+            self.dropped += len(phases) - 1 + (self._pending is not None)
+            self._pending = phases[-1]
+            remaining = self._lastRender + self.interval - time.perf_counter()
+            if remaining <= 0:
+                self.render()
+                return True
+            if self._flush is None:
+                self._scheduleFlush(remaining)
+            return False
+
+
+    def _scheduleFlush(self, delay):
+        """Render the pending frame after delay seconds, on the running event loop or on a timer thread."""
+        import asyncio
+        try:
+            self._flush = asyncio.get_running_loop().call_later(delay, self.render)
+        except RuntimeError:
+            self._flush = threading.Timer(min(delay, threading.TIMEOUT_MAX), self.render)
+            self._flush.daemon = True
+            self._flush.start()
+
+
+    def render(self):
+        """Draw the pending frame, if any, with one batched in-place update of the traces."""
+        with self._lock:
+            if self._flush is not None:
+                self._flush.cancel()
+                self._flush = None
+            if self._pending is None:
+                return
+            values = rotatedComponents(batchUtoSC(self._pending)).ravel() if self.sequence else self._pending
+            moduli = np.absolute(values)
+            angles = np.angle(values, deg=True)
+            with self.fig.batch_update():
+                for trace, modulus, angle in zip(self.fig.data, moduli, angles):
+                    trace.r = (0, modulus)
+                    trace.theta = (0, angle)
+            self._pending = None
+            self._lastRender = time.perf_counter()
+            self.rendered += 1
+
+
+    def show(self):
+        """Show the figure, or return the widget for display in a notebook."""
+        import plotly.graph_objects as go
+        if isinstance(self.fig, go.Figure):
+            self.fig.show(config=_CONFIG)
+        return self.fig
+
+
+def _writeHTML(figure, path, includePlotlyJS):
+    """Write one figure given as a dict to a HTML file and return the seconds it took."""
+    import plotly.graph_objects as go
+    start = time.perf_counter()
+    go.Figure(figure).write_html(path, include_plotlyjs=includePlotlyJS, config=_CONFIG)
+    return time.perf_counter() - start
+
+
+def exportHTML(figures, paths, workers = None, includePlotlyJS = True):
+    """Export many figures to standalone HTML files without showing them.
+
+    Args:
+        figures (iterable): Plot or plotly Figure objects to export.
+        paths (iterable): Output file path of each figure.
+        workers (int, optional): Number of worker processes. 0 writes the files in this process.
+            Defaults to None, using one worker per CPU.
+        includePlotlyJS (bool/str, optional): How plotly.js is included, passed to Figure.write_html.
+            True embeds it so every file works offline. Defaults to True.
+
+    Returns:
+        list: (path, seconds) of each figure in input order.
+    """
+    figures = [(i.fig if isinstance(i, Plot) else i).to_dict() for i in figures]
+    paths = [str(i) for i in paths]
+    if len(figures) != len(paths):
+        raise ValueError(f"Unsupported paths: {len(paths)} paths were given for {len(figures)} figures.")
+
+    if workers == 0:
+        timings = [_writeHTML(figure, path, includePlotlyJS) for figure, path in zip(figures, paths)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            timings = list(executor.map(_writeHTML, figures, paths, [includePlotlyJS] * len(paths)))
+    return list(zip(paths, timings))
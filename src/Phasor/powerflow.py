@@ -0,0 +1,186 @@
+"""AC power flow with the Newton-Raphson method in polar coordinates and a sparse Jacobian.
+
+Buses are slack, PV or PQ. Each iteration assembles the sparse Jacobian of the power mismatches with
+respect to the voltage angles of the PV and PQ buses and the voltage magnitudes of the PQ buses, and
+solves it with a sparse LU factorization. Solutions can warm-start the next solve, and many load
+snapshots can be solved in a row or split across a pool of worker processes.
+"""
+
+import numpy as np
+import scipy.sparse as sparse
+import scipy.sparse.linalg as linalg
+from concurrent.futures import ProcessPoolExecutor
+from .network import Network, _complexValues
+from .phasor import PhasorArray
+
+PQ = 1
+PV = 2
+SLACK = 3
+
+
+class PowerFlow:
+    """Newton-Raphson power flow of a network of buses.
+    """
+    def __init__(self, network, types, voltage = 1.0, tolerance = 1e-8, maxIterations = 20, roundOff = 4):
+        """Initialize PowerFlow objects
+
+        Args:
+            network (Network/sparse matrix): Network of the buses, or its (buses, buses) admittance matrix.
+            types (array_like): Type of every bus, PQ, PV or SLACK.
+            voltage (complex/array_like/PhasorArray, optional): Voltage of the slack buses and voltage magnitude
+                of the PV buses, per bus or for all buses. Defaults to 1.0.
+            tolerance (float, optional): Largest power mismatch of a converged solution. Defaults to 1e-8.
+            maxIterations (int, optional): Iterations before giving up. Defaults to 20.
+            roundOff (int, optional): Decimalpoints to be roundoff in the returned voltages. Defaults to 4.
+
+        Raises:
+            ValueError: If the bus types do not match the network or there is no slack bus.
+        """
+        admittance = network.admittance if isinstance(network, Network) else network
+        self.admittance = sparse.csr_matrix(admittance, dtype=np.complex128)
+        self.types = np.asarray(types).ravel()
+        buses = self.admittance.shape[0]
+        if self.types.shape != (buses,) or not np.isin(self.types, (PQ, PV, SLACK)).all():
+            raise ValueError(f"Unsupported types: types should hold PQ, PV or SLACK for each of the {buses} buses.")
+        if not np.any(self.types == SLACK):
+            raise ValueError("Unsupported types: the network needs a slack bus.")
+        self.voltage = np.broadcast_to(_complexValues(voltage), (buses,)).copy()
+        self.tolerance = tolerance
+        self.maxIterations = maxIterations
+        self.roundOff = roundOff
+        self.iterations = 0
+
+        self._pv = np.flatnonzero(self.types == PV)
+        self._pq = np.flatnonzero(self.types == PQ)
+        self._pvpq = np.concatenate((self._pv, self._pq))
+
+
+    def injections(self, voltages):
+        """Return the complex power injected into every bus by a voltage profile.
+
+        Args:
+            voltages (array_like/PhasorArray): (buses,) bus voltages.
+
+        Returns:
+            ndarray: (buses,) complex power S = V * conj(Y V).
+        """
+        voltages = _complexValues(voltages)
+        return voltages * np.conj(self.admittance @ voltages)
+
+
+    def _start(self, start):
+        """Return the initial voltages of an iteration: a flat profile or a previous solution, with the set points applied."""
+        if start is None:
+            voltages = np.ones(len(self.types), dtype=np.complex128)
+        else:
+            voltages = _complexValues(start).copy()
+        slack = self.types == SLACK
+        voltages[slack] = self.voltage[slack]
+        voltages[self._pv] *= np.abs(self.voltage[self._pv]) / np.abs(voltages[self._pv])
+        return voltages
+
+
+    def _mismatch(self, voltages, power):
+        """Return the active power mismatch of the PV and PQ buses followed by the reactive power mismatch of the PQ buses."""
+        difference = self.injections(voltages) - power
+        return np.concatenate((difference.real[self._pvpq], difference.imag[self._pq]))
+
+
+    def _jacobian(self, voltages):
+        """Return the sparse Jacobian of the mismatches with respect to the PV and PQ angles and the PQ magnitudes."""
+        current = self.admittance @ voltages
+        diagonalVoltage = sparse.diags(voltages)
+        diagonalNorm = sparse.diags(voltages / np.abs(voltages))
+        dMagnitude = diagonalVoltage @ (self.admittance @ diagonalNorm).conj() + sparse.diags(np.conj(current)) @ diagonalNorm
+        dAngle = 1j * diagonalVoltage @ (sparse.diags(current) - self.admittance @ diagonalVoltage).conj()
+        dMagnitude, dAngle = dMagnitude.tocsr(), dAngle.tocsr()
+        return sparse.bmat([
+            [dAngle[self._pvpq][:, self._pvpq].real, dMagnitude[self._pvpq][:, self._pq].real],
+            [dAngle[self._pq][:, self._pvpq].imag, dMagnitude[self._pq][:, self._pq].imag],
+        ], format="csc")
+
+
+    def _iterate(self, power, start):
+        """Run the Newton-Raphson iteration and return the complex voltages and the number of iterations."""
+        voltages = self._start(start)
+        magnitude, angle = np.abs(voltages), np.angle(voltages)
+        angles = len(self._pvpq)
+        mismatch = self._mismatch(voltages, power)
+        for iteration in range(self.maxIterations + 1):
+            if not mismatch.size or np.max(np.abs(mismatch)) < self.tolerance:
+                return voltages, iteration
+            if iteration == self.maxIterations:
+                break
+            try:
+                # The Jacobian is not symmetric in value, so SuperLU keeps its default COLAMD ordering and partial pivoting
+                factor = linalg.splu(self._jacobian(voltages))
+            except RuntimeError:
+                raise RuntimeError(f"Power flow did not converge: the Jacobian became singular at iteration {iteration}.") from None
+            step = factor.solve(-mismatch)
+            angle[self._pvpq] += step[:angles]
+            magnitude[self._pq] += step[angles:]
+            voltages = magnitude * np.exp(1j * angle)
+            mismatch = self._mismatch(voltages, power)
+        raise RuntimeError(f"Power flow did not converge in {self.maxIterations} iterations, largest mismatch {np.max(np.abs(mismatch)):.3g}.")
+
+
+    def solve(self, power, start = None):
+        """Solve the bus voltages of one operating point.
+
+        Args:
+            power (array_like/PhasorArray): (buses,) complex power injected into every bus, generation minus load.
+                Reactive power of PV buses and the power of slack buses are ignored.
+            start (array_like/PhasorArray, optional): Initial voltages, e.g. a previous solution. Defaults to a flat start.
+
+        Raises:
+            ValueError: If the power does not have one value per bus.
+            RuntimeError: If the iteration does not converge.
+
+        Returns:
+            PhasorArray: (buses,) bus voltages. The number of iterations is stored in iterations.
+        """
+        power = _complexValues(power)
+        if power.shape != self.types.shape:
+            raise ValueError(f"Unsupported power shape: {power.shape}. Power should be ({len(self.types)},).")
+        voltages, self.iterations = self._iterate(power, start)
+        return PhasorArray(voltages, self.roundOff)
+
+
+    def solveBatch(self, powers, start = None, workers = None):
+        """Solve many load snapshots, each one warm-started from the solution of the previous one.
+
+        Args:
+            powers (array_like/PhasorArray): (snapshots, buses) complex power injections.
+            start (array_like/PhasorArray, optional): Initial voltages of the first snapshot. Defaults to a flat start.
+            workers (int, optional): Number of worker processes. The snapshots are split into one contiguous
+                chunk per worker. Defaults to None, solving in this process.
+
+        Raises:
+            ValueError: If the powers do not have one column per bus.
+            RuntimeError: If a snapshot does not converge.
+
+        Returns:
+            PhasorArray: (snapshots, buses) bus voltages. The iterations of every snapshot are stored in iterations.
+        """
+        powers = np.asarray(getattr(powers, "complex", powers), dtype=np.complex128)
+        if powers.ndim != 2 or powers.shape[1] != len(self.types):
+            raise ValueError(f"Unsupported powers shape: {powers.shape}. Powers should be (snapshots, {len(self.types)}).")
+        if workers is None or workers <= 1 or len(powers) < 2:
+            voltages, self.iterations = _solveChunk(self, powers, start)
+        else:
+            chunks = np.array_split(powers, min(workers, len(powers)))
+            with ProcessPoolExecutor(workers) as executor:
+                results = list(executor.map(_solveChunk, [self] * len(chunks), chunks, [start] * len(chunks)))
+            voltages = np.concatenate([result[0] for result in results])
+            self.iterations = np.concatenate([result[1] for result in results])
+        return PhasorArray(voltages, self.roundOff)
+
+
+def _solveChunk(solver, powers, start):
+    """Solve consecutive snapshots in order, each one warm-started from the previous solution."""
+    voltages = np.empty(powers.shape, dtype=np.complex128)
+    iterations = np.empty(len(powers), dtype=np.int64)
+    for index, power in enumerate(powers):
+        voltages[index], iterations[index] = solver._iterate(power, start)
+        start = voltages[index]
+    return voltages, iterations
@@ -1,7 +1,90 @@
 """Convert symmetrical components to unbalanced three phase and convert unbalanced three phase to symmetrical components."""
 
-from .phasor import *
+import cmath
+import math
 import numpy as np
+# The phasor classes are imported by name, and stay available to star imports of this module
+from .phasor import Phasor, PhasorPD, PhasorPR, PhasorRe, PhasorArray, toRec, toRad, toDeg, _FORM_NAMES
+
+_a = cmath.rect(1, 2*math.pi/3)
+
+# Rows are the zero, positive and negative sequences, columns the A, B and C phases.
+# Phases are recovered as phases = _FORTESCUE @ components, and the matrix also holds
+# the rotation applied to the phase A component of each sequence to get phases B and C.
+_FORTESCUE = np.array([
+        [1, 1, 1],
+        [1, _a**2, _a],
+        [1, _a, _a**2]
+    ], dtype=np.complex128)
+_FORTESCUE_INVERSE = np.array([
+        [1, 1, 1],
+        [1, _a, _a**2],
+        [1, _a**2, _a]
+    ], dtype=np.complex128) / 3
+
+
+def _asThreePhase(values, name):
+    """Return array_like or PhasorArray input as a complex128 ndarray whose last axis holds the three phases."""
+    if isinstance(values, PhasorArray):
+        values = values.complex
+    values = np.asarray(values, dtype=np.complex128)
+    if values.ndim == 0 or values.shape[-1] != 3:
+        raise ValueError(f"Unsupported {name} shape: {values.shape}. The last axis should hold 3 values.")
+    return values
+
+
+def batchUtoSC(phasors, out=None):
+    """Convert many unbalanced three phase samples into symmetrical components in one matrix multiplication.
+
+    Args:
+        phasors (array_like/PhasorArray): (N, 3) complex values of phases A, B and C.
+        out (ndarray, optional): (N, 3) complex128 buffer to write the result into. Defaults to None.
+
+    Raises:
+        ValueError: If the last axis of phasors does not hold 3 values.
+
+    Returns:
+        ndarray: (N, 3) zero, positive and negative sequence components of phase A.
+    """
+    phasors = _asThreePhase(phasors, "phasors")
+    return np.matmul(phasors, _FORTESCUE_INVERSE.T, out=out)
+
+
+def batchSCtoU(components, out=None):
+    """Convert many sets of symmetrical components into unbalanced three phase samples in one matrix multiplication.
+
+    Wrap the result as PhasorArray(result, form=...) to get rectangular or polar views of the same buffer without copying.
+
+    Args:
+        components (array_like/PhasorArray): (N, 3) zero, positive and negative sequence components of phase A.
+        out (ndarray, optional): (N, 3) complex128 buffer to write the result into. Defaults to None.
+
+    Raises:
+        ValueError: If the last axis of components does not hold 3 values.
+
+    Returns:
+        ndarray: (N, 3) complex values of phases A, B and C.
+    """
+    components = _asThreePhase(components, "components")
+    return np.matmul(components, _FORTESCUE.T, out=out)
+
+
+def rotatedComponents(components, out=None):
+    """Return the zero, positive and negative sequence components of every phase.
+
+    Args:
+        components (array_like/PhasorArray): (N, 3) zero, positive and negative sequence components of phase A.
+        out (ndarray, optional): (N, 3, 3) complex128 buffer to write the result into. Defaults to None.
+
+    Raises:
+        ValueError: If the last axis of components does not hold 3 values.
+
+    Returns:
+        ndarray: (N, 3, 3) components indexed as [sample, sequence, phase].
+    """
+    components = _asThreePhase(components, "components")
+    return np.multiply(components[..., :, None], _FORTESCUE, out=out)
+
 
 class SCtoU:
     """Generate the corresponding unbalanced three-phase system using symmetrical components.
@@ -34,41 +117,35 @@ class SCtoU:
             raise TypeError(f"Unsupported argument type: {type(A0)}.") 
 
         self.roundOff = roundOff
-        self.delta = np.array([
-                [PhasorPD(1,0,self.roundOff), PhasorPD(1,0,self.roundOff),PhasorPD(1,0,self.roundOff)],
-                [PhasorPD(1,0,self.roundOff), PhasorPD(1,120,self.roundOff)**2,PhasorPD(1,120,self.roundOff)],
-                [PhasorPD(1,0,self.roundOff), PhasorPD(1,120,self.roundOff),PhasorPD(1,120,self.roundOff)**2]  
-            ], dtype=Phasor)
-        
         self.threeComponents = np.array([self.A0,self.A1,self.A2], dtype=Phasor)
-        self.unbalanced = np.dot(self.delta, self.threeComponents)
+        unbalanced = batchSCtoU((self.A0.complex, self.A1.complex, self.A2.complex))
+        self.unbalanced = np.array([PhasorPD._fromComplex(complex(i), self.roundOff) for i in unbalanced], dtype=Phasor)
+
+
+    def __reduce__(self):
+        """Pickle only the three components, roundOff and the form of the unbalanced phasors.
+
+        The unbalanced system is computed again when loading instead of being stored.
+        """
+        return (_restoreResult, (SCtoU, (self.A0, self.A1, self.A2), self.roundOff, _FORM_NAMES[type(self.unbalanced[0])]))
         
 
     def toRecList(self):
         """Convert all Phasor objects to rectangular coordinates.
         """
-        RecList = []
-        for i in self.unbalanced:
-            RecList.append(toRec(i))
-        self.unbalanced = RecList
+        self.unbalanced = [toRec(i) for i in self.unbalanced]
     
 
     def toRadList(self):
         """Convert all Phasor objects to polar coordinates where angle is in radians.
         """
-        RadList = []
-        for i in self.unbalanced:
-            RadList.append(toRad(i))
-        self.unbalanced = RadList
+        self.unbalanced = [toRad(i) for i in self.unbalanced]
     
 
     def toDegList(self):
         """Convert all Phasor objects to polar coordinates where angle is in degrees.
         """
-        DegList = []
-        for i in self.unbalanced:
-            DegList.append(toDeg(i))
-        self.unbalanced = DegList
+        self.unbalanced = [toDeg(i) for i in self.unbalanced]
 
 
     def __str__(self):
@@ -131,47 +208,41 @@ class UtoSC:
             raise TypeError(f"Unsupported argument type: {type(A)}.") 
 
         self.roundOff = roundOff
-        self.deltaInverse = np.array([
-                [PhasorPD(1,0,self.roundOff), PhasorPD(1,0,self.roundOff),PhasorPD(1,0,self.roundOff)],
-                [PhasorPD(1,0,self.roundOff), PhasorPD(1,120,self.roundOff),PhasorPD(1,120,self.roundOff)**2],
-                [PhasorPD(1,0,self.roundOff), PhasorPD(1,120,self.roundOff)**2,PhasorPD(1,120,self.roundOff)]
-            ], dtype=Phasor)/3
-        
         self.threePhasors = np.array([self.A,self.B,self.C], dtype=Phasor)
-        self.components = np.dot(self.deltaInverse, self.threePhasors)
+        components = batchUtoSC((self.A.complex, self.B.complex, self.C.complex))
+        self.components = np.array([PhasorPD._fromComplex(complex(i), self.roundOff) for i in components], dtype=Phasor)
 
-        self.zero = [self.components[0],self.components[0],self.components[0]]
-        self.positive = [self.components[1],self.components[1]*PhasorPD(1,120,self.roundOff),self.components[1]*(PhasorPD(1,120,self.roundOff)**2)]
-        self.negative = [self.components[2],self.components[2]*(PhasorPD(1,120,self.roundOff)**2),self.components[2]*PhasorPD(1,120,self.roundOff)]
+        self.zero, self.positive, self.negative = [
+            [PhasorPD._fromComplex(complex(i), self.roundOff) for i in sequence] for sequence in rotatedComponents(components)
+        ]
         
         self.allComponents = [self.zero,self.positive,self.negative]
+
+
+    def __reduce__(self):
+        """Pickle only the three phasors, roundOff and the form of the components.
+
+        The symmetrical components are computed again when loading instead of being stored.
+        """
+        return (_restoreResult, (UtoSC, (self.A, self.B, self.C), self.roundOff, _FORM_NAMES[type(self.components[0])]))
         
 
     def toRecList(self):
         """Convert all Phasor objects to rectangular coordinates.
         """
-        RecList = []
-        for i in self.components:
-            RecList.append(toRec(i))
-        self.components = RecList
+        self.components = [toRec(i) for i in self.components]
     
 
     def toRadList(self):
         """Convert all Phasor objects to polar coordinates where angle is in radians.
         """
-        RadList = []
-        for i in self.components:
-            RadList.append(toRad(i))
-        self.components = RadList
+        self.components = [toRad(i) for i in self.components]
     
 
     def toDegList(self):
         """Convert all Phasor objects to polar coordinates where angle is in degrees.
         """
-        DegList = []
-        for i in self.components:
-            DegList.append(toDeg(i))
-        self.components = DegList
+        self.components = [toDeg(i) for i in self.components]
 
 
     def zero(self):
@@ -255,3 +326,15 @@ class UtoSC:
     C2 - {self.negative[2]}
 
 """
+
+
+# Methods converting the result phasors of SCtoU and UtoSC to each form, PD being the form they are created in
+_LIST_CONVERSIONS = {"PD": None, "PR": "toRadList", "Re": "toRecList"}
+
+
+def _restoreResult(cls, phasors, roundOff, form):
+    """Recompute a pickled SCtoU or UtoSC object from its three input phasors and convert its results to their pickled form."""
+    result = cls(*phasors, roundOff=roundOff)
+    if _LIST_CONVERSIONS[form] is not None:
+        getattr(result, _LIST_CONVERSIONS[form])()
+    return result
@@ -0,0 +1,166 @@
+"""Store phasor time series on disk and read them back as zero-copy memory-mapped arrays.
+
+A store file is a 64 byte header followed by fixed size records, each holding a float64 timestamp
+and one complex value per channel. Records are appended in time order, so a time range is found with a
+binary search over the memory-mapped timestamps instead of a scan.
+"""
+
+import os
+import struct
+import numpy as np
+
+_MAGIC = b"PHSRSTOR"
+_VERSION = 1
+_HEADER = struct.Struct("<8sHHIQ")
+_HEADER_SIZE = 64
+_COUNT_OFFSET = 16
+
+
+def _recordType(channels, dtype):
+    """Return the structured dtype of one record."""
+    dtype = np.dtype(dtype).newbyteorder("<")
+    return np.dtype([("time", "<f8"), ("phasors", dtype, (channels,))])
+
+
+class PhasorStore:
+    """Append-only on-disk store of timestamped multi-channel phasors.
+    """
+    def __init__(self, path, channels = 3, dtype = np.complex128, mode = "a"):
+        """Open or create a store file.
+
+        Args:
+            path (str): Path of the store file.
+            channels (int, optional): Number of phasors per record, used when creating a file. Defaults to 3.
+            dtype (dtype, optional): np.complex64 or np.complex128, used when creating a file. Defaults to np.complex128.
+            mode (str, optional): "r" to read, "a" to read and append creating the file if needed,
+                "w" to create a new empty file. Defaults to "a".
+
+        Raises:
+            ValueError: If the mode or dtype is not supported, or the file is not a store file.
+        """
+        if mode not in ("r", "a", "w"):
+            raise ValueError(f"Unsupported mode: {mode}. Mode should be one of ('r', 'a', 'w').")
+        if np.dtype(dtype) not in (np.complex64, np.complex128):
+            raise ValueError(f"Unsupported dtype: {dtype}. dtype should be np.complex64 or np.complex128.")
+        self.path = path
+        self.mode = mode
+        self._map = None
+
+        if mode == "w" or (mode == "a" and not os.path.exists(path)):
+            with open(path, "wb") as file:
+                file.write(_HEADER.pack(_MAGIC, _VERSION, np.dtype(dtype).itemsize, channels, 0).ljust(_HEADER_SIZE, b"\0"))
+
+        self._file = open(path, "rb" if mode == "r" else "r+b")
+        header = self._file.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            self._file.close()
+            raise ValueError(f"Unsupported file: {path} is not a phasor store file.")
+        magic, version, itemsize, self.channels, self._count = _HEADER.unpack(header)
+        if magic != _MAGIC or version != _VERSION:
+            self._file.close()
+            raise ValueError(f"Unsupported file: {path} is not a phasor store file.")
+        self.dtype = np.dtype(np.complex64 if itemsize == 8 else np.complex128)
+        self.recordType = _recordType(self.channels, self.dtype)
+
+
+    def __len__(self):
+        return self._count
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
+
+
+    def close(self):
+        """Close the store file. Arrays that were already read stay valid."""
+        self._map = None
+        self._file.close()
+
+
+    @property
+    def records(self):
+        """np.memmap: All records as a read-only structured array."""
+        if self._map is None or len(self._map) != self._count:
+            if self._count == 0:
+                return np.empty(0, dtype=self.recordType)
+            self._map = np.memmap(self.path, dtype=self.recordType, mode="r", offset=_HEADER_SIZE, shape=(self._count,))
+        return self._map
+
+
+    @property
+    def times(self):
+        """ndarray: Zero-copy view of all timestamps."""
+        return self.records["time"]
+
+
+    @property
+    def phasors(self):
+        """ndarray: Zero-copy (N, channels) view of all phasors."""
+        return self.records["phasors"]
+
+
+    def append(self, times, phasors):
+        """Append records to the end of the store.
+
+        Args:
+            times (array_like): (N,) timestamps, not decreasing and not earlier than the last stored timestamp.
+            phasors (array_like/PhasorArray): (N, channels) complex values.
+
+        Raises:
+            ValueError: If the store is read-only, the shapes do not match or the timestamps are out of order.
+        """
+        if self.mode == "r":
+            raise ValueError("Unsupported operation: the store is opened read-only.")
+        times = np.asarray(times, dtype=float).reshape(-1)
+        phasors = np.asarray(getattr(phasors, "complex", phasors))
+        if phasors.shape != (len(times), self.channels):
+            raise ValueError(f"Unsupported phasors shape: {phasors.shape}. Phasors should be ({len(times)}, {self.channels}).")
+        if len(times) == 0:
+            return
+        if np.any(np.diff(times) < 0) or (self._count and times[0] < self.times[-1]):
+            raise ValueError("Unsupported times: timestamps should not decrease.")
+
+        records = np.empty(len(times), dtype=self.recordType)
+        records["time"] = times
+        records["phasors"] = phasors
+        self._file.seek(_HEADER_SIZE + self._count * self.recordType.itemsize)
+        self._file.write(records.tobytes())
+        self._count += len(times)
+        self._file.seek(_COUNT_OFFSET)
+        self._file.write(struct.pack("<Q", self._count))
+        self._file.flush()
+
+
+    def indexRange(self, start = None, stop = None):
+        """Return the record indices covering the time range [start, stop) with a binary search.
+
+        Args:
+            start (float, optional): First timestamp to include. Defaults to the beginning.
+            stop (float, optional): First timestamp to exclude. Defaults to the end.
+
+        Returns:
+            int,int: Index of the first record and one past the last record.
+        """
+        times = self.times
+        first = 0 if start is None else int(np.searchsorted(times, start, side="left"))
+        last = len(times) if stop is None else int(np.searchsorted(times, stop, side="left"))
+        return first, max(first, last)
+
+
+    def read(self, start = None, stop = None):
+        """Read the records in the time range [start, stop) without copying.
+
+        Args:
+            start (float, optional): First timestamp to include. Defaults to the beginning.
+            stop (float, optional): First timestamp to exclude. Defaults to the end.
+
+        Returns:
+            ndarray,ndarray: (N,) timestamps and (N, channels) phasors as views of the file.
+        """
+        first, last = self.indexRange(start, stop)
+        records = self.records[first:last]
+        return records["time"], records["phasors"]
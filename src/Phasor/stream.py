@@ -0,0 +1,88 @@
+"""Stream symmetrical components over chunked unbalanced three phase data with bounded memory."""
+
+import operator
+import time
+import numpy as np
+from .sc import batchUtoSC, _asThreePhase
+
+
+class SCStream:
+    """Convert an iterator of three phase chunks into chunks of symmetrical components.
+
+    Input chunks of any length are regrouped into chunks of chunkSize samples, only the final chunk may be shorter.
+    At most one chunk of input and one chunk of output are held at a time, so streams of any length run in constant memory.
+    """
+    def __init__(self, chunks, chunkSize = 4096, reuseBuffer = False):
+        """Initialize SCStream objects
+
+        Args:
+            chunks (iterable): Iterable of (n, 3) array_like or PhasorArray chunks holding phases A, B and C.
+            chunkSize (int, optional): Number of samples in each output chunk. Defaults to 4096.
+            reuseBuffer (bool, optional): Write every output chunk into the same buffer instead of allocating a new one.
+                The consumer then has to copy what it keeps before asking for the next chunk. Defaults to False.
+
+        Raises:
+            ValueError: If chunkSize is not a positive integer.
+        """
+        try:
+            size = operator.index(chunkSize)
+        except TypeError:
+            size = 0
+        if size <= 0:
+            raise ValueError(f"Unsupported chunkSize: {chunkSize}. chunkSize should be a positive integer.")
+        self.source = chunks
+        self.chunkSize = size
+        self.reuseBuffer = reuseBuffer
+        self.frames = 0
+        self.batches = 0
+        self.busyTime = 0.0
+        self.startTime = None
+
+
+    @property
+    def throughput(self):
+        """float: Frames processed per second of wall-clock time since the stream started."""
+        if self.startTime is None:
+            return 0.0
+        elapsed = time.perf_counter() - self.startTime
+        return self.frames / elapsed if elapsed > 0 else 0.0
+
+
+    def _transform(self, phasors, out):
+        """Convert one chunk and update the counters."""
+        start = time.perf_counter()
+        if out is not None:
+            out = out[:len(phasors)]
+        components = batchUtoSC(phasors, out=out)
+        self.busyTime += time.perf_counter() - start
+        self.frames += len(phasors)
+        self.batches += 1
+        return components
+
+
+    def __iter__(self):
+        """Yield (chunkSize, 3) arrays of zero, positive and negative sequence components of phase A."""
+        self.startTime = time.perf_counter()
+        pending = np.empty((self.chunkSize, 3), dtype=np.complex128)
+        out = np.empty((self.chunkSize, 3), dtype=np.complex128) if self.reuseBuffer else None
+        filled = 0
+
+        for chunk in self.source:
+            chunk = _asThreePhase(chunk, "chunk").reshape(-1, 3)
+            start = 0
+            while start < len(chunk):
+                if filled == 0 and len(chunk) - start >= self.chunkSize:
+                    # Whole chunks are transformed straight from the input without copying
+                    yield self._transform(chunk[start:start + self.chunkSize], out)
+                    start += self.chunkSize
+                    continue
+                take = min(self.chunkSize - filled, len(chunk) - start)
+                pending[filled:filled + take] = chunk[start:start + take]
+                filled += take
+                start += take
+                if filled == self.chunkSize:
+                    yield self._transform(pending, out)
+                    filled = 0
+
+        if filled:
+            yield self._transform(pending[:filled], out)
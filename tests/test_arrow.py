@@ -0,0 +1,66 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import tempfile
+import unittest
+import numpy as np
+from Phasor.arrow import *
+from Phasor.sc import *
+from unittest import TestCase
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+@unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+class test_arrow(TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.phases = PhasorArray(rng.normal(size=(20, 2, 3)) + 1j * rng.normal(size=(20, 2, 3)), 3, "Re")
+        self.times = np.arange(20) / 60
+
+    def test_floatColumns(self):
+        table = toTable(self.phases[:, 0], self.times, names=["a", "b", "c"])
+        self.assertEqual(table.column_names, ["time", "a_re", "a_im", "b_re", "b_im", "c_re", "c_im"])
+        self.assertEqual(table.schema.field("b_im").type, pyarrow.float64())
+        np.testing.assert_array_equal(table.column("b_im").to_numpy(), self.phases.complex[:, 0, 1].imag)
+
+    def test_tableRoundTrip(self):
+        times, phasors = fromTable(toTable(self.phases, self.times))
+        np.testing.assert_array_equal(times, self.times)
+        np.testing.assert_array_equal(phasors.complex, self.phases.complex)
+        self.assertEqual((phasors.roundOff, phasors.form), (3, "Re"))
+
+    def test_sequenceTable(self):
+        components = batchUtoSC(self.phases)
+        table = sequenceTable(components)
+        self.assertEqual(table.column_names[:4], ["zero0_re", "zero0_im", "positive0_re", "positive0_im"])
+        np.testing.assert_array_equal(fromTable(table)[1].complex, components)
+
+        results = [UtoSC(*(PhasorRe(complex(i)) for i in sample)) for sample in self.phases.complex[:5, 0]]
+        table = sequenceTable(results)
+        self.assertEqual(table.column_names, ["zero_re", "zero_im", "positive_re", "positive_im", "negative_re", "negative_im"])
+        np.testing.assert_allclose(fromTable(table)[1].complex, components[:5, 0])
+        with self.assertRaises(ValueError):
+            sequenceTable(self.phases.complex[..., :2])
+
+    def test_parquetRoundTrip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "phases.parquet")
+            writeParquet(path, self.phases, self.times, compression="zstd")
+            times, phasors = readParquet(path)
+        np.testing.assert_array_equal(times, self.times)
+        np.testing.assert_array_equal(phasors.complex, self.phases.complex)
+        self.assertEqual(phasors.shape, (20, 2, 3))
+
+    def test_foreignTable(self):
+        times, phasors = fromTable(pyarrow.table({"v_re": [1.0, 0.0], "v_im": [0.0, 2.0], "other": [1, 2]}))
+        self.assertIsNone(times)
+        np.testing.assert_array_equal(phasors.complex, [[1], [2j]])
+        with self.assertRaises(ValueError):
+            fromTable(pyarrow.table({"other": [1, 2]}))
+        with self.assertRaises(ValueError):
+            toTable(self.phases, names=["a", "b"])
@@ -0,0 +1,63 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import binascii
+import struct
+import tempfile
+import numpy as np
+from Phasor.c37118 import *
+from unittest import TestCase
+
+
+def frame(soc, fracsec, phasorBytes, frequencyBytes, extra=b""):
+    """Assemble one data frame with its CHK field."""
+    body = struct.pack(">IIH", soc, fracsec, 0) + phasorBytes + frequencyBytes + extra
+    size = 6 + len(body) + 2
+    data = struct.pack(">HHH", 0xAA01, size, 7) + body
+    return data + struct.pack(">H", binascii.crc_hqx(data, 0xFFFF))
+
+
+class test_c37118(TestCase):
+    def test_integerRectangular(self):
+        frames = frame(1700000000, 500000, struct.pack(">hhhh", 1000, -2000, 30, 40), struct.pack(">hh", 25, -3))
+        frames += frame(1700000001, 0, struct.pack(">hhhh", -5, 6, 7, -8), struct.pack(">hh", 0, 0))
+        times, phasors = decodeDataFrames(frames, 2, scale=[0.5, 2.0], checksum=True)
+        np.testing.assert_allclose(times, [1700000000.5, 1700000001.0])
+        np.testing.assert_allclose(phasors, [[500-1000j, 60+80j], [-2.5+3j, 14-16j]])
+
+    def test_integerPolar(self):
+        frames = frame(10, 250, struct.pack(">Hh", 60000, 15708), struct.pack(">hh", 0, 0))
+        times, phasors = decodeDataFrames(frames, 1, format=POLAR, timeBase=1000)
+        np.testing.assert_allclose(times, [10.25])
+        np.testing.assert_allclose(phasors, [[60000j]], atol=1)
+
+    def test_floatPolarWithAnalogsAndDigitals(self):
+        format = POLAR | PHASOR_FLOAT | ANALOG_FLOAT | FREQ_FLOAT
+        phasorBytes = struct.pack(">ffff", 230.0, np.pi / 6, 5.0, -np.pi / 2)
+        frames = frame(5, 0, phasorBytes, struct.pack(">ff", 60.01, 0.1), struct.pack(">fH", 1.5, 0xFFFF)) * 3
+        times, phasors = decodeDataFrames(frames, 2, format=format, analogs=1, digitals=1, checksum=True)
+        self.assertEqual(phasors.shape, (3, 2))
+        np.testing.assert_allclose(phasors[0], [230 * np.exp(1j * np.pi / 6), -5j], rtol=1e-6, atol=1e-5)
+        raw = np.frombuffer(frames, dtype=frameType(2, format, 1, 1))
+        np.testing.assert_allclose(raw["freq"], 60.01, rtol=1e-6)
+
+    def test_floatRectangularCaptureFile(self):
+        frames = b"".join(frame(i, 0, struct.pack(">ff", i, -i), struct.pack(">ff", 50, 0)) for i in range(100))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "capture.bin")
+            with open(path, "wb") as file:
+                file.write(frames)
+            times, phasors = readDataFrames(path, 1, format=PHASOR_FLOAT | FREQ_FLOAT)
+        np.testing.assert_allclose(times, np.arange(100))
+        np.testing.assert_allclose(phasors[:, 0], np.arange(100) * (1 - 1j))
+
+    def test_invalidFrames(self):
+        frames = bytearray(frame(1, 0, struct.pack(">hh", 1, 1), struct.pack(">hh", 0, 0)))
+        with self.assertRaises(ValueError):
+            decodeDataFrames(bytes(frames[:-1]), 1)
+        with self.assertRaises(ValueError):
+            decodeDataFrames(bytes(frames), 2)
+        frames[-1] ^= 0xFF
+        with self.assertRaises(ValueError):
+            decodeDataFrames(bytes(frames), 1, checksum=True)
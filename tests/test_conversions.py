@@ -0,0 +1,43 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import cmath
+import numpy as np
+from Phasor.conversions import *
+from unittest import TestCase
+
+class test_conversions(TestCase):
+    def setUp(self):
+        self.values = np.array([1+1j, -2+0.5j, 3-4j, 0.25j])
+
+    def test_scalarsUseBuiltinTypes(self):
+        modulus, angle = RectangularToPolarDegree(1j)
+        self.assertIs(type(modulus), float)
+        self.assertAlmostEqual(angle, 90)
+        self.assertIs(type(PolarDegreeToRectangle(2, 90)), complex)
+        self.assertAlmostEqual(PolarRadiansToRectangular(2, np.pi/2), 2j)
+        self.assertAlmostEqual(PolarDegreeToPolarRadians(180), np.pi)
+        self.assertEqual(RoundOff(1.2345+2.3456j, 2), 1.23+2.35j)
+
+    def test_arrays(self):
+        modulus, angle = RectangularToPolarRadians(self.values)
+        np.testing.assert_allclose(modulus, np.abs(self.values))
+        np.testing.assert_allclose(angle, np.angle(self.values))
+        np.testing.assert_allclose(PolarRadiansToRectangular(modulus, angle), self.values)
+        np.testing.assert_allclose(PolarDegreeToRectangle(modulus, np.rad2deg(angle)), self.values)
+        np.testing.assert_allclose(PolarRadiansToPolarDegree(list(angle)), np.angle(self.values, deg=True))
+
+    def test_outBuffers(self):
+        modulus, angle = np.empty(4), np.empty(4)
+        result = RectangularToPolarDegree(self.values, out=(modulus, angle))
+        self.assertIs(result[0], modulus)
+        self.assertIs(result[1], angle)
+        np.testing.assert_allclose(angle, np.angle(self.values, deg=True))
+        out = np.empty(4, dtype=np.complex128)
+        self.assertIs(PolarDegreeToRectangle(modulus, angle, out=out), out)
+        np.testing.assert_allclose(out, self.values)
+
+    def test_broadcasting(self):
+        result = PolarDegreeToRectangle(1, [0, 90, 180])
+        np.testing.assert_allclose(result, [1, 1j, -1], atol=1e-12)
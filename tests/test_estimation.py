@@ -0,0 +1,41 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import numpy as np
+from Phasor.estimation import SlidingDFT, estimatePhasors
+from Phasor.sc import batchUtoSC
+from unittest import TestCase
+
+class test_slidingDFT(TestCase):
+    def setUp(self):
+        self.sampleRate, self.frequency = 1200.0, 60.0
+        self.expected = np.array([230 * np.exp(1j * np.deg2rad(10)), 220 * np.exp(1j * np.deg2rad(-115)), 240 * np.exp(1j * np.deg2rad(125))])
+        t = np.arange(600) / self.sampleRate
+        self.samples = np.sqrt(2) * np.abs(self.expected) * np.cos(2 * np.pi * self.frequency * t[:, None] + np.angle(self.expected))
+
+    def test_steadyState(self):
+        estimates = estimatePhasors(self.samples, self.sampleRate, self.frequency, cycles=2)
+        self.assertTrue(np.isnan(estimates.complex[:39]).all())
+        np.testing.assert_allclose(estimates.complex[39:], np.broadcast_to(self.expected, (561, 3)), rtol=1e-9)
+
+    def test_incrementalMatchesBatch(self):
+        batch = SlidingDFT(self.sampleRate, self.frequency, channels=3).update(self.samples).complex
+        estimator = SlidingDFT(self.sampleRate, self.frequency, channels=3)
+        pieces = [estimator.update(self.samples[i:i + 7]).complex for i in range(0, 600, 7)]
+        np.testing.assert_allclose(np.concatenate(pieces), batch, equal_nan=True)
+        np.testing.assert_allclose(estimator.phasor.complex, self.expected, rtol=1e-9)
+
+    def test_feedsSequenceComponents(self):
+        estimates = estimatePhasors(self.samples, self.sampleRate, self.frequency)
+        components = batchUtoSC(estimates[-1:])
+        np.testing.assert_allclose(components[0], batchUtoSC(self.expected), rtol=1e-9)
+
+    def test_singleChannel(self):
+        estimates = estimatePhasors(self.samples[:, 0], self.sampleRate, self.frequency)
+        self.assertEqual(estimates.shape, (600,))
+        self.assertAlmostEqual(estimates[-1].modulus, 230)
+
+    def test_window(self):
+        with self.assertRaises(ValueError):
+            SlidingDFT(1000.0, 60.0)
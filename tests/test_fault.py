@@ -0,0 +1,70 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import numpy as np
+from Phasor.fault import *
+from Phasor.phasor import *
+from Phasor.sc import SCtoU
+from unittest import TestCase
+
+class test_fault(TestCase):
+    def test_boltedFaults(self):
+        z = 0.1j
+        slg = Fault(SLG, z, z, z)
+        np.testing.assert_allclose(slg.phaseCurrents.complex, [-10j, 0, 0], atol=1e-12)
+        self.assertAlmostEqual(slg.phaseVoltages.complex[0], 0)
+
+        ll = Fault(LL, z, z, z)
+        ia, ib, ic = ll.phaseCurrents.complex
+        self.assertAlmostEqual(ia, 0)
+        self.assertAlmostEqual(ib, -ic)
+        self.assertAlmostEqual(abs(ib), np.sqrt(3) / 0.2)
+        self.assertAlmostEqual(ll.phaseVoltages.complex[1], ll.phaseVoltages.complex[2])
+
+        dlg = Fault(DLG, z, z, z)
+        self.assertAlmostEqual(dlg.phaseCurrents.complex[0], 0)
+        np.testing.assert_allclose(dlg.phaseVoltages.complex[1:], 0, atol=1e-12)
+
+        three = Fault(THREE_PHASE, z, PhasorRe(z), z, prefault=PhasorPD(1, 30))
+        np.testing.assert_allclose(three.phaseVoltages.complex, 0, atol=1e-12)
+        self.assertAlmostEqual(abs(three.phaseCurrents.complex[1]), 10)
+
+    def test_faultImpedance(self):
+        # SLG through Zf: phase A voltage is Zf times the fault current
+        fault = Fault(SLG, 0.3j, 0.1j, 0.1j, impedance=0.05)
+        self.assertAlmostEqual(fault.phaseVoltages.complex[0], 0.05 * fault.phaseCurrents.complex[0])
+        # DLG through Zf: phases B and C are at the same voltage, Zf times the ground current
+        fault = Fault(DLG, 0.3j, 0.1j, 0.1j, impedance=0.05)
+        vb, vc = fault.phaseVoltages.complex[1:]
+        self.assertAlmostEqual(vb, vc)
+        self.assertAlmostEqual(vb, 0.05 * 3 * fault.sequenceCurrents.complex[0])
+
+    def test_sweep(self):
+        rng = np.random.default_rng(3)
+        buses = 1000
+        Z0, Z1, Z2 = (rng.uniform(0.01, 0.5, buses) * (0.1+1j) for _ in range(3))
+        impedance = rng.uniform(0, 0.1, buses)
+        kinds = np.array([THREE_PHASE, SLG, LL, DLG])[:, None]
+        fault = Fault(kinds, Z0, Z1, Z2, impedance=impedance)
+        self.assertEqual(fault.phaseCurrents.shape, (4, buses, 3))
+        for row, kind in enumerate(kinds[:, 0]):
+            single = Fault(kind, PhasorRe(Z0[7]), Z1[7], Z2[7], impedance=impedance[7])
+            np.testing.assert_allclose(fault.phaseCurrents.complex[row, 7], single.phaseCurrents.complex, atol=1e-12)
+            np.testing.assert_allclose(fault.phaseVoltages.complex[row, 7], single.phaseVoltages.complex, atol=1e-12)
+
+        case = fault.toSCtoU((2, 7))
+        self.assertIsInstance(case, SCtoU)
+        np.testing.assert_allclose([i.complex for i in case.unbalanced], fault.phaseCurrents.complex[2, 7])
+        voltages = Fault(SLG, 1j, 1j, 1j).toSCtoU(quantity="voltage")
+        self.assertAlmostEqual(voltages.unbalanced[0].complex, 0)
+        out = np.empty((4, buses, 3), dtype=complex)
+        self.assertIs(faultSequenceCurrents(kinds, Z0, Z1, Z2, out=out), out)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            Fault("LLG", 1j, 1j, 1j)
+        with self.assertRaises(ValueError):
+            Fault([SLG, "x"], 1j, 1j, 1j)
+        with self.assertRaises(ValueError):
+            Fault(SLG, 1j, 1j, 1j).toSCtoU(0, "power")
@@ -0,0 +1,63 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import io
+import numpy as np
+from Phasor.formatting import *
+from Phasor.sc import *
+from unittest import TestCase
+
+class test_formatPhasors(TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        values = rng.normal(size=2000) * 10.0 ** rng.integers(-6, 10, 2000) + 1j * rng.normal(size=2000)
+        special = [0, -0.0, complex(0, -0.0), 1j, -1j, 2.675 + 0.125j, 0.005 - 0.005j, 1e-5 + 3j, 1e20 + 1j,
+                   complex(np.nan, 1), complex(1, np.inf), -0.004 + 0.004j, 10 + 100j]
+        self.values = np.concatenate((values, special))
+
+    def test_matchesScalarStr(self):
+        for form, scalar in (("PD", PhasorPD), ("PR", PhasorPR), ("Re", PhasorRe)):
+            for roundOff in (0, 2, 5, -1):
+                expected = [str(scalar._fromComplex(complex(i), roundOff)) for i in self.values]
+                self.assertEqual(formatPhasors(self.values, form, roundOff, chunkSize=500).split("\n"), expected)
+
+    def test_arrayDefaults(self):
+        array = PhasorArray(self.values[:10].reshape(5, 2), 3, "Re")
+        lines = formatPhasors(array, separator=",", header=["a", "b"]).split("\n")
+        self.assertEqual(lines[0], "a,b")
+        self.assertEqual(lines[1], ",".join(str(i) for i in array[0]))
+        self.assertEqual(formatPhasors(PhasorPD(2, 30)), str(PhasorPD(2, 30)))
+        with self.assertRaises(ValueError):
+            formatPhasors(array, form="XY")
+
+    def test_chunkedFile(self):
+        file = io.StringIO()
+        self.assertIsNone(formatPhasors(self.values, file=file, chunkSize=300))
+        self.assertEqual(file.getvalue(), formatPhasors(self.values) + "\n")
+
+
+class test_formatSequences(TestCase):
+    def test_matchesUtoSC(self):
+        rng = np.random.default_rng(1)
+        phases = rng.normal(size=(20, 3)) + 1j * rng.normal(size=(20, 3))
+        results = [UtoSC(*(PhasorRe(complex(i)) for i in sample), roundOff=3) for sample in phases]
+        lines = formatSequences(results, phases=True).split("\n")
+        self.assertEqual(lines[0], "A0, A1, A2, B0, B1, B2, C0, C1, C2")
+        for line, result in zip(lines[1:], results):
+            self.assertEqual(line.split(", "), [str(i) for phase in zip(*result.allComponents) for i in phase])
+
+        lines = formatSequences(batchUtoSC(phases), "Re", 3, header=False).split("\n")
+        self.assertEqual(lines[0].split(", "), [str(toRec(i)) for i in results[0].components])
+        with self.assertRaises(ValueError):
+            formatSequences(phases[:, :2])
+
+    def test_emptyInput(self):
+        empty = np.empty((0, 3), dtype=np.complex128)
+        self.assertEqual(formatPhasors(empty), "")
+        self.assertEqual(formatPhasors(PhasorArray(empty), header=["a", "b", "c"]), "a, b, c")
+        self.assertEqual(formatSequences(empty), "A0, A1, A2")
+        self.assertEqual(formatSequences([], header=False), "")
+        file = io.StringIO()
+        formatSequences(empty, phases=True, file=file)
+        self.assertEqual(file.getvalue(), "A0, A1, A2, B0, B1, B2, C0, C1, C2\n")
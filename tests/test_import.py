@@ -0,0 +1,76 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import json
+import subprocess
+from unittest import TestCase, skipUnless
+
+# Seconds allowed for "import Phasor" alone, and for the first use of the arithmetic API, which imports NumPy
+IMPORT_BUDGET = 0.05
+ARITHMETIC_BUDGET = 1.0
+# Factor on the budgets for default runs, for busy CI machines. An import of NumPy or plotly still exceeds it
+SLACK = 2
+
+_MEASURE = """
+import json, sys, time
+start = time.perf_counter()
+import Phasor
+imported = time.perf_counter() - start
+a = Phasor.PhasorPD(100, 45) + Phasor.PhasorRe(1j)
+Phasor.UtoSC(a, a * 2, a / 2)
+used = time.perf_counter() - start
+Phasor.Plot
+loaded = sorted({name.split(".")[0] for name in sys.modules})
+print(json.dumps({"imported": imported, "used": used, "modules": loaded}))
+"""
+
+
+class test_import(TestCase):
+    def measure(self, code):
+        """Run code in a fresh interpreter and return the JSON it prints."""
+        environment = {key: value for key, value in os.environ.items() if key != "PHASOR_INSTRUMENT"}
+        environment["PYTHONPATH"] = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+        output = subprocess.run([sys.executable, "-c", code], env=environment, capture_output=True, text=True, check=True).stdout
+        return json.loads(output)
+
+    def bestOf(self, runs = 3):
+        """Return the lowest import and first use times of a few fresh interpreters."""
+        # The best of a few runs keeps a busy machine from failing the budget
+        runs = [self.measure(_MEASURE) for _ in range(runs)]
+        return min(i["imported"] for i in runs), min(i["used"] for i in runs)
+
+    def test_importBudget(self):
+        imported, used = self.bestOf()
+        self.assertLess(imported, IMPORT_BUDGET * SLACK)
+        self.assertLess(used, ARITHMETIC_BUDGET * SLACK)
+
+    @skipUnless(os.environ.get("PHASOR_TIMING_TESTS"), "set PHASOR_TIMING_TESTS to check the exact time budgets")
+    def test_importBudgetExact(self):
+        imported, used = self.bestOf()
+        self.assertLess(imported, IMPORT_BUDGET)
+        self.assertLess(used, ARITHMETIC_BUDGET)
+
+    def test_lazySubmodules(self):
+        modules = self.measure(_MEASURE)["modules"]
+        for heavy in ("plotly", "scipy", "asyncio", "pyarrow"):
+            self.assertNotIn(heavy, modules)
+        code = "import json, sys, Phasor; print(json.dumps(sorted(sys.modules)))"
+        self.assertNotIn("numpy", self.measure(code))
+
+    def test_starImport(self):
+        code = "import json, sys; from Phasor import *; print(json.dumps(sorted(set(sys.modules) | set(globals()))))"
+        names = self.measure(code)
+        for heavy in ("plotly", "scipy", "asyncio", "Phasor.phasor", "PhasorPD"):
+            self.assertNotIn(heavy, names)
+
+    def test_publicApi(self):
+        import Phasor
+        from Phasor import phasor, sc, plot
+        self.assertIs(Phasor.PhasorPD, phasor.PhasorPD)
+        self.assertIs(Phasor.batchUtoSC, sc.batchUtoSC)
+        self.assertIs(Phasor.Plot, plot.Plot)
+        self.assertIn("UtoSC", dir(Phasor))
+        self.assertEqual(Phasor.instrument.__name__, "Phasor.instrument")
+        with self.assertRaises(AttributeError):
+            Phasor.unbalancedToSC
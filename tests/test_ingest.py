@@ -0,0 +1,160 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import asyncio
+import binascii
+import socket
+import numpy as np
+from Phasor.c37118 import PHASOR_FLOAT, checksums, frameType
+from Phasor.ingest import *
+from Phasor.sc import batchUtoSC
+from unittest import IsolatedAsyncioTestCase
+
+def dataFrames(phasors, rate = 60):
+    """Return C37.118 data frames of float rectangular phasors, one frame per row."""
+    frames = np.zeros(len(phasors), dtype=frameType(phasors.shape[1], PHASOR_FLOAT))
+    frames["sync"] = 0xAA01
+    frames["framesize"] = frames.dtype.itemsize
+    frames["soc"] = 1700000000
+    frames["fracsec"] = np.arange(len(phasors)) * 1000000 // rate
+    frames["phasors"]["real"] = phasors.real
+    frames["phasors"]["imag"] = phasors.imag
+    frames["chk"] = checksums(frames)
+    return frames.tobytes()
+
+def configFrame():
+    """Return a C37.118 configuration frame with a valid CHK, for streams that are not data only."""
+    body = bytes([0xAA, 0x31]) + (24).to_bytes(2, "big") + bytes(18)
+    return body + binascii.crc_hqx(body, 0xFFFF).to_bytes(2, "big")
+
+class test_ingest(IsolatedAsyncioTestCase):
+    def setUp(self):
+        rng = np.random.default_rng(5)
+        self.phasors = (rng.normal(size=(300, 3)) + 1j * rng.normal(size=(300, 3))).astype(np.complex64).astype(complex)
+        self.data = dataFrames(self.phasors)
+
+    async def sender(self, data, pieces = 7):
+        """Start a fake PMU sending the data over TCP in uneven pieces, and return its port."""
+        async def send(reader, writer):
+            for piece in np.array_split(np.frombuffer(data, dtype=np.uint8), pieces):
+                writer.write(piece.tobytes())
+                await writer.drain()
+            writer.close()
+        server = await asyncio.start_server(send, "127.0.0.1", 0)
+        self.addAsyncCleanup(self.closeServer, server)
+        return server.sockets[0].getsockname()[1]
+
+    async def closeServer(self, server):
+        server.close()
+        await server.wait_closed()
+
+    async def test_tcp(self):
+        port = await self.sender(self.data)
+        stream = await openTCPStream("127.0.0.1", port, format=PHASOR_FLOAT, batchSize=64)
+        times, components = [], []
+        async for batchTimes, batchComponents in stream:
+            self.assertLessEqual(len(batchTimes), 64)
+            times.append(batchTimes)
+            components.append(batchComponents)
+        np.testing.assert_allclose(np.concatenate(components), batchUtoSC(self.phasors), atol=1e-9)
+        np.testing.assert_allclose(np.concatenate(times), 1700000000 + np.arange(300) * 1000000 // 60 / 1e6)
+        metrics = stream.metrics()
+        self.assertEqual(metrics["frames"], 300)
+        self.assertEqual(metrics["dropped"], 0)
+        self.assertGreaterEqual(metrics["batches"], 5)
+        self.assertGreater(metrics["throughput"], 0)
+        self.assertGreaterEqual(metrics["maxLatency"], metrics["latency"])
+
+    async def test_resynchronise(self):
+        size = len(self.data) // 300
+        corrupted = bytearray(self.data[200 * size:201 * size])
+        corrupted[20] ^= 0xFF
+        # Joined in the middle of a frame, with other frame types and a corrupted frame in between
+        data = (self.data[size // 2:size] + self.data[size:100 * size] + configFrame() + self.data[100 * size:200 * size]
+                + bytes(corrupted) + self.data[201 * size:])
+        port = await self.sender(data, pieces=13)
+        stream = await openTCPStream("127.0.0.1", port, format=PHASOR_FLOAT)
+        received = np.concatenate([components async for times, components in stream])
+        kept = np.delete(self.phasors, [0, 200], axis=0)
+        np.testing.assert_allclose(received, batchUtoSC(kept), atol=1e-9)
+        self.assertEqual(stream.metrics()["frames"], 298)
+        self.assertEqual(stream.metrics()["skipped"], 2)
+
+    async def test_falseSyncWithLargeFrameSize(self):
+        size = len(self.data) // 300
+        # A stray SYNC announcing a 60000 byte frame of another type, then a data frame size that is not configured
+        data = b"\x00\xaa\x31\xea\x60" + b"\x00\xaa\x01\x10\x00" + self.data[:10 * size]
+        stream = await openUDPStream("127.0.0.1", 0, format=PHASOR_FLOAT)
+        frames, pending = stream._split(data)
+        self.assertEqual(b"".join(frames), self.data[:10 * size])
+        self.assertEqual(pending, b"")
+        stream.close()
+
+        # Over TCP the good frames after the false SYNC arrive without waiting for 60000 bytes
+        port = await self.sender(data[:5] + self.data[:100 * size], pieces=50)
+        stream = await openTCPStream("127.0.0.1", port, format=PHASOR_FLOAT, batchSize=8, maxDelay=0.001)
+        times, components = await asyncio.wait_for(stream.__anext__(), 1)
+        np.testing.assert_allclose(components, batchUtoSC(self.phasors[:len(times)]), atol=1e-9)
+        self.assertEqual(sum([len(times) async for times, components in stream]) + len(times), 100)
+        self.assertEqual(stream.skipped, 0)
+
+    async def test_undecodableFrame(self):
+        stream = await openUDPStream("127.0.0.1", 0, format=PHASOR_FLOAT, maxDelay=0.001)
+        stream._frame(bytes(stream.frameSize))
+        batch = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0.01)
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sender:
+            sender.sendto(self.data[:3 * stream.frameSize], stream.address)
+            times, components = await batch
+        stream.close()
+        np.testing.assert_allclose(components, batchUtoSC(self.phasors[:3]), atol=1e-9)
+        self.assertEqual(stream.skipped, 1)
+
+    async def test_backpressure(self):
+        data = dataFrames(np.tile(self.phasors, (20, 1)))
+        port = await self.sender(data, pieces=3)
+        stream = await openTCPStream("127.0.0.1", port, format=PHASOR_FLOAT, batchSize=16, queueSize=32)
+        await asyncio.sleep(0.05)
+        # The reader waits for the slow consumer instead of buffering or dropping frames
+        self.assertLessEqual(stream.queue.qsize(), 32)
+        frames = 0
+        async for times, components in stream:
+            frames += len(times)
+            self.assertLessEqual(stream.queue.qsize(), 32)
+        self.assertEqual(frames, 6000)
+        self.assertEqual(stream.dropped, 0)
+
+    async def test_udp(self):
+        stream = await openUDPStream("127.0.0.1", 0, format=PHASOR_FLOAT, queueSize=100, maxDelay=0.001)
+        size = stream.frameSize
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sender:
+            # Two frames per datagram, more than the queue holds while nothing consumes it
+            for start in range(0, len(self.data), 2 * size):
+                sender.sendto(self.data[start:start + 2 * size], stream.address)
+            await asyncio.sleep(0.1)
+        self.assertEqual(stream.frames + stream.dropped + stream.queue.qsize(), 300)
+        self.assertEqual(stream.dropped, 200)
+        stream.close()
+        received = [components async for times, components in stream]
+        np.testing.assert_allclose(np.concatenate(received), batchUtoSC(self.phasors[:100]), atol=1e-9)
+
+    async def test_manyStreams(self):
+        streams = []
+        for i in range(12):
+            port = await self.sender(self.data)
+            streams.append(await openTCPStream("127.0.0.1", port, format=PHASOR_FLOAT))
+
+        async def consume(stream):
+            return sum([len(times) async for times, components in stream])
+
+        self.assertEqual(await asyncio.gather(*map(consume, streams)), [300] * 12)
+
+    async def test_sixPhasors(self):
+        phasors = np.concatenate((self.phasors, self.phasors[::-1]), axis=1)
+        port = await self.sender(dataFrames(phasors))
+        stream = await openTCPStream("127.0.0.1", port, phasors=6, format=PHASOR_FLOAT)
+        components = np.concatenate([components async for times, components in stream])
+        self.assertEqual(components.shape, (300, 2, 3))
+        with self.assertRaises(ValueError):
+            PhasorStream(phasors=4)
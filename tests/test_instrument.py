@@ -0,0 +1,55 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import subprocess
+import numpy as np
+from Phasor import conversions, instrument, phasor, sc
+from Phasor.sc import *
+from unittest import TestCase
+
+class test_instrument(TestCase):
+    def setUp(self):
+        instrument.reset()
+
+    def test_countsOperations(self):
+        a, b = PhasorPD(1, 30), PhasorRe(1j)
+        events = []
+        with instrument.instrument(hook=lambda *event: events.append(event)) as stats:
+            a + b
+            a * 2
+            conversions.PolarDegreeToRectangle([1, 2], [0, 90])
+            sc.batchUtoSC(np.ones((4, 3)))
+            UtoSC(a, a, b)
+        result = stats.report()
+        self.assertEqual(result["PhasorPD.__add__"]["calls"], 1)
+        self.assertEqual(result["PhasorPD.__mul__"]["allocations"], 1)
+        self.assertEqual(result["conversions.PolarDegreeToRectangle"]["calls"], 1)
+        self.assertEqual(result["sc.batchUtoSC"]["calls"], 2)
+        self.assertEqual(result["UtoSC.__init__"]["calls"], 1)
+        # The result itself, its three sequence components and the nine phase components
+        self.assertEqual(result["UtoSC.__init__"]["allocations"], 13)
+        self.assertEqual(result["sc.batchUtoSC"]["allocations"], 0)
+        self.assertGreater(result["UtoSC.__init__"]["seconds"], 0)
+        self.assertEqual(len(events), sum(i["calls"] for i in result.values()))
+        self.assertIn("PhasorPD.__add__", instrument.formatReport())
+
+    def test_disabledRestoresOriginals(self):
+        add, convert, batch = phasor.Phasor.__add__, phasor.PolarDegreeToRectangle, sc.batchUtoSC
+        fromComplex = vars(phasor.Phasor)["_fromComplex"]
+        with instrument.instrument():
+            self.assertIsNot(phasor.Phasor.__add__, add)
+            self.assertIsNot(phasor.PolarDegreeToRectangle, convert)
+        self.assertFalse(instrument.isEnabled())
+        self.assertIs(phasor.Phasor.__add__, add)
+        self.assertIs(phasor.PolarDegreeToRectangle, convert)
+        self.assertIs(sc.batchUtoSC, batch)
+        self.assertIs(vars(phasor.Phasor)["_fromComplex"], fromComplex)
+        PhasorPD(1, 0) + PhasorPD(1, 0)
+        self.assertEqual(instrument.report(), {})
+
+    def test_environmentVariable(self):
+        code = "import Phasor.phasor as p; p.PhasorRe(1) + p.PhasorRe(2); from Phasor import instrument; print(instrument.report()['PhasorRe.__add__']['calls'])"
+        environment = dict(os.environ, PHASOR_INSTRUMENT="1", PYTHONPATH=os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+        output = subprocess.run([sys.executable, "-c", code], env=environment, capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), "1")
@@ -0,0 +1,94 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import numpy as np
+from Phasor import lazy as lazyModule
+from Phasor.lazy import *
+from Phasor.phasor import *
+from unittest import TestCase
+
+class test_lazy(TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.arrays = [PhasorArray(rng.normal(size=(1000, 3)) + 1j * rng.normal(size=(1000, 3)), 3, "Re") for _ in range(4)]
+
+    def test_scalar(self):
+        a, b, c, d = PhasorPD(100, 30), PhasorPR(5, 1.2), PhasorRe(3+4j, 3), PhasorPD(2, -45)
+        eager = (a + b) * c / d ** 2
+        x, y, z, w = lazy(a, b, c, d)
+        result = ((x + y) * z / w ** 2).evaluate()
+        self.assertIsInstance(result, PhasorPD)
+        self.assertAlmostEqual(result.complex, eager.complex)
+        self.assertEqual(result.roundOff, eager.roundOff)
+        self.assertAlmostEqual((~x - 2 * y).evaluate().complex, (~a).complex - 2 * b.complex)
+        self.assertAlmostEqual(x.evaluate().complex, a.complex)
+
+    def test_array(self):
+        a, b, c, d = self.arrays
+        eager = (a + b) * c / d ** 2
+        x, y, z = lazy(a, b, c)
+        expression = (x + y) * z / d ** 2
+        for blockSize in (7, 300, 10**6):
+            result = expression.evaluate(blockSize=blockSize)
+            self.assertIsInstance(result, PhasorArray)
+            self.assertEqual((result.form, result.roundOff), ("Re", 3))
+            np.testing.assert_allclose(result.complex, eager.complex)
+
+        # Scalar phasors, numbers and arrays of other shapes broadcast over the array
+        p = PhasorPR(2, 0.5, 1)
+        row = np.array([1, 2, 3j])
+        result = (p * x + y * row - 1.5 * ~z).evaluate(blockSize=64)
+        eager = p * a + b * row - 1.5 * ~c
+        np.testing.assert_allclose(result.complex, eager.complex)
+        self.assertEqual((result.form, result.roundOff), ("PR", 1))
+
+        out = np.empty((1000, 3), dtype=complex)
+        self.assertIs((x + y).evaluate(out=out).complex, out)
+        with self.assertRaises(ValueError):
+            (x + y).evaluate(out=np.empty(3, dtype=complex))
+
+    def test_eliminatesCommonSubexpressions(self):
+        a, b = self.arrays[:2]
+        x, y = lazy(a, b)
+        expression = (x + y) * (lazy(a) + y) - (x + y)
+        np.testing.assert_allclose(expression.evaluate().complex, (a + b) * (a + b) - (a + b))
+        leaves, instructions = lazyModule._flatten(expression)
+        self.assertEqual(len(leaves), 2)
+        self.assertEqual(len(instructions), 3)
+
+        # The same expression shape on other data reuses the compiled program
+        program = lazyModule._programs[instructions]
+        c, d = self.arrays[2:]
+        u, v = lazy(c, d)
+        ((u + v) * (u + v) - (u + v)).evaluate()
+        self.assertIs(lazyModule._programs[lazyModule._flatten((u + v) * (u + v) - (u + v))[1]], program)
+        self.assertEqual(program.registers, 2)
+
+    def test_deferredOperators(self):
+        a, b = self.arrays[:2]
+        p = PhasorPD(2, 90)
+        self.assertIsInstance(p + lazy(a), Lazy)
+        self.assertIsInstance(a * lazy(b), Lazy)
+        np.testing.assert_allclose((a * lazy(b)).evaluate().complex, (a * b).complex)
+        self.assertAlmostEqual((p / lazy(PhasorRe(1j))).evaluate().complex, p.complex / 1j)
+
+    def test_errors(self):
+        x = lazy(self.arrays[0])
+        with self.assertRaises(TypeError):
+            x + 1
+        with self.assertRaises(TypeError):
+            x ** lazy(PhasorPD(1, 0))
+        with self.assertRaises(TypeError):
+            lazy("a")
+        with self.assertRaises(ZeroDivisionError):
+            (x / PhasorArray(np.zeros(3))).evaluate()
+        with self.assertRaises(ZeroDivisionError):
+            (lazy(PhasorPD(1, 0)) / 0).evaluate()
+
+    def test_longChain(self):
+        a = PhasorArray(np.ones(10))
+        expression = lazy(a)
+        for i in range(5000):
+            expression = expression + a
+        np.testing.assert_allclose(expression.evaluate().complex, np.full(10, 5001))
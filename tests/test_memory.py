@@ -0,0 +1,31 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import numpy as np
+from Phasor.memory import *
+from Phasor.phasor import *
+from unittest import TestCase
+
+class test_memory(TestCase):
+    def test_deepSize(self):
+        phasor = PhasorRe(3+4j)
+        self.assertEqual(deepSize(phasor), sys.getsizeof(phasor) + sys.getsizeof(3+4j) + sys.getsizeof(2))
+        array = np.zeros(1000, dtype=complex)
+        self.assertGreaterEqual(deepSize(array), array.nbytes)
+
+    def test_footprint(self):
+        report = footprint(1000)
+        self.assertAlmostEqual(report["PhasorArray (complex128)"], 16, delta=2)
+        self.assertAlmostEqual(report["batchUtoSC per sample"], 48, delta=1)
+        self.assertLess(report["PhasorArray (complex128)"], report["object ndarray of PhasorRe"])
+        self.assertLess(report["PhasorRe"], report["PhasorPD, polar values cached"])
+        self.assertIn("UtoSC per sample", formatFootprint(report))
+
+    def test_profile(self):
+        result = profile(lambda size: np.ones(size), 10**6, top=3)
+        self.assertEqual(len(result.result), 10**6)
+        self.assertGreaterEqual(result.peak, 8 * 10**6)
+        self.assertGreaterEqual(result.current, 8 * 10**6)
+        self.assertLessEqual(len(result.statistics), 3)
+        self.assertIn("peak", str(result))
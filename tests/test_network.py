@@ -0,0 +1,61 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import numpy as np
+from Phasor.network import *
+from Phasor.sc import *
+from unittest import TestCase
+
+class test_network(TestCase):
+    def test_divider(self):
+        # 10 A into node 0, 2 ohm to node 1, (1+1j) ohm from node 1 to ground
+        network = Network(2)
+        network.addBranch(0, 1, 2)
+        network.addBranch(1, None, PhasorRe(1+1j))
+        voltages = network.solve([10, 0])
+        self.assertIsInstance(voltages, PhasorArray)
+        self.assertAlmostEqual(voltages[0].complex, 10 * (3+1j))
+        self.assertAlmostEqual(voltages[1].complex, 10 * (1+1j))
+        self.assertAlmostEqual(network.admittance[0, 1], -0.5)
+
+    def test_multipleScenarios(self):
+        rng = np.random.default_rng(2)
+        nodes = 200
+        network = Network(nodes)
+        network.addBranches(np.arange(nodes - 1), np.arange(1, nodes), rng.uniform(0.1, 1, nodes - 1) * (1+3j))
+        network.addBranches(rng.integers(0, nodes, 50), np.full(50, -1), PhasorArray(rng.uniform(10, 100, 50) + 5j))
+        currents = rng.normal(size=(300, nodes)) + 1j * rng.normal(size=(300, nodes))
+        voltages = network.solve(currents)
+        factor = network.factorize()
+        self.assertEqual(voltages.shape, (300, nodes))
+        expected = np.linalg.solve(network.admittance.toarray(), currents.T).T
+        np.testing.assert_allclose(voltages.complex, expected, atol=1e-9)
+        # The factorization is reused until the network changes
+        network.solve(currents[0])
+        self.assertIs(network.factorize(), factor)
+        network.addBranch(0, None, 50)
+        self.assertIsNot(network.factorize(), factor)
+
+    def test_threePhase(self):
+        # Three phases each fed through 1 ohm into a star load of (9+3j) ohm per phase, driven by unbalanced currents
+        network = Network(3)
+        network.addBranches([0, 1, 2], [-1, -1, -1], [9+3j] * 3)
+        currents = [PhasorPD(10, 0), PhasorPD(8, -120), PhasorPD(10, 120)]
+        a, b, c = network.solve(currents)
+        sequence = UtoSC(a, b, c)
+        expected = batchUtoSC(np.array([i.complex for i in currents]) * (9+3j))
+        np.testing.assert_allclose([i.complex for i in sequence.components], expected)
+
+    def test_errors(self):
+        network = Network(2)
+        with self.assertRaises(ValueError):
+            network.addBranch(0, 2, 1)
+        with self.assertRaises(ValueError):
+            network.addBranch(0, 1, 0)
+        network.addBranch(0, 1, 1)
+        with self.assertRaises(ValueError):
+            network.solve([1, 0])
+        network.addBranch(0, None, 1)
+        with self.assertRaises(ValueError):
+            network.solve([1, 0, 0])
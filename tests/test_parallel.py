@@ -0,0 +1,47 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import numpy as np
+from Phasor.conversions import RectangularToPolarDegree
+from Phasor.parallel import *
+from Phasor.phasor import PhasorArray
+from Phasor.sc import batchSCtoU, batchUtoSC
+from unittest import TestCase
+
+def scaledSum(a, b, out, scale = 1.0):
+    np.add(a, b, out=out)
+    out *= scale
+
+class test_parallel(TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(4)
+        self.phases = rng.normal(size=(10000, 3)) + 1j * rng.normal(size=(10000, 3))
+
+    def test_transforms(self):
+        with SharedExecutor(workers=2, chunkSize=1500) as executor:
+            components = executor.map(batchUtoSC, PhasorArray(self.phases))
+            np.testing.assert_allclose(components, batchUtoSC(self.phases))
+            np.testing.assert_allclose(executor.map(batchSCtoU, components), self.phases)
+            modulus, angle = executor.map(RectangularToPolarDegree, self.phases, dtype=float, outputs=2)
+            np.testing.assert_allclose(modulus, np.abs(self.phases))
+            np.testing.assert_allclose(angle, np.angle(self.phases, deg=True))
+            self.assertEqual(executor._blocks, [])
+
+    def test_sharedArrays(self):
+        with SharedExecutor(workers=2, chunkSize=4096) as executor:
+            a = executor.array(self.phases.shape)
+            a[...] = self.phases
+            out = executor.array((10000, 3))
+            result = executor.map(scaledSum, a, a[:, ::-1], out=out, scale=0.5)
+            self.assertIs(result, out)
+            np.testing.assert_allclose(out, (self.phases + self.phases[:, ::-1]) / 2)
+            self.assertEqual(len(executor._blocks), 2)
+            del a, out, result
+
+    def test_singleWorker(self):
+        executor = SharedExecutor(workers=1)
+        np.testing.assert_allclose(executor.map(batchUtoSC, self.phases), batchUtoSC(self.phases))
+        with self.assertRaises(ValueError):
+            executor.map(scaledSum, self.phases, self.phases[:10])
+        executor.close()
@@ -1,12 +1,126 @@
+import os
 import sys
-sys.path.append("<root>\src")
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
 
-from Phasor import *
+import pickle
+import numpy as np
+from Phasor.phasor import *
 from unittest import TestCase
 
 class test_phasor(TestCase):
     def test_abstractPhasor(self):
-        self.assertEqual()
+        with self.assertRaises(TypeError):
+            Phasor()
 
 
+class test_scalarPhasor(TestCase):
+    def test_slotsOnly(self):
+        for phasor in (PhasorPD(1, 30), PhasorPR(1, 0.5), PhasorRe(1+1j)):
+            self.assertFalse(hasattr(phasor, "__dict__"))
 
+    def test_lazyPolarValues(self):
+        phasor = PhasorRe(-1-1j)
+        self.assertIsNone(phasor._modulus)
+        self.assertAlmostEqual(phasor.modulus, np.sqrt(2))
+        self.assertAlmostEqual(phasor.degree, 225)
+        self.assertAlmostEqual(phasor.radian, 1.25 * np.pi)
+        self.assertEqual(PhasorPD(10, 400).degree, 40)
+
+    def test_operatorsKeepClass(self):
+        a, b = PhasorPD(100, 45), PhasorPR(200, 3.14)
+        self.assertIsInstance(a + b, PhasorPD)
+        self.assertIsInstance(b * a, PhasorPR)
+        self.assertIsInstance(toRec(a) / 2, PhasorRe)
+        self.assertAlmostEqual((a * b).complex, a.complex * b.complex)
+        self.assertAlmostEqual((toRec(a) / 2).complex, a.complex / 2)
+        self.assertAlmostEqual((~a).degree, 315)
+        with self.assertRaises(ZeroDivisionError):
+            a / PhasorRe(0)
+
+    def test_compactPickle(self):
+        for phasor in (PhasorPD(100, 45, 3), PhasorPR(2, 0.5), PhasorRe(1-2j, 4)):
+            phasor.degree
+            restored = pickle.loads(pickle.dumps(phasor))
+            self.assertIs(type(restored), type(phasor))
+            self.assertEqual(restored.complex, phasor.complex)
+            self.assertEqual(restored.roundOff, phasor.roundOff)
+            self.assertIsNone(restored._degree)
+            self.assertEqual(str(restored), str(phasor))
+
+
+class test_phasorArray(TestCase):
+    def setUp(self):
+        self.values = np.array([1+1j, -2+0.5j, 3-4j, 0.25j])
+        self.array = PhasorArray(self.values)
+
+    def test_storesComplex128(self):
+        self.assertEqual(self.array.complex.dtype, np.complex128)
+        self.assertEqual(len(self.array), 4)
+
+    def test_properties(self):
+        np.testing.assert_allclose(self.array.modulus, np.abs(self.values))
+        np.testing.assert_allclose(self.array.degree, np.angle(self.values, deg=True) % 360)
+        np.testing.assert_allclose(self.array.radian, np.angle(self.values) % (2*np.pi))
+
+    def test_fromDegree(self):
+        array = PhasorArray.fromDegree([100, 200], [45, -90])
+        np.testing.assert_allclose(array.modulus, [100, 200])
+        np.testing.assert_allclose(array.degree, [45, 270])
+
+    def test_operatorsMatchScalars(self):
+        other = PhasorArray(self.values[::-1])
+        for op in (lambda a, b: a + b, lambda a, b: a - b, lambda a, b: a * b, lambda a, b: a / b):
+            result = op(self.array, other)
+            expected = [op(PhasorRe(a), PhasorRe(b)).complex for a, b in zip(self.values, self.values[::-1])]
+            np.testing.assert_allclose(result.complex, expected)
+        np.testing.assert_allclose((self.array ** 2).complex, self.values ** 2)
+        np.testing.assert_allclose((~self.array).complex, np.conjugate(self.values))
+
+    def test_mixedWithScalars(self):
+        scalar = PhasorPD(2, 30)
+        np.testing.assert_allclose((self.array + scalar).complex, self.values + scalar.complex)
+        np.testing.assert_allclose((scalar - self.array).complex, scalar.complex - self.values)
+        np.testing.assert_allclose((scalar * self.array).complex, scalar.complex * self.values)
+        np.testing.assert_allclose((3 * self.array).complex, 3 * self.values)
+        np.testing.assert_allclose((np.float64(2) * self.array).complex, 2 * self.values)
+        self.assertEqual((scalar * self.array).form, "PD")
+        self.assertEqual((toRec(PhasorPD(1, 0)) * self.array).form, "Re")
+
+    def test_unsupportedOperands(self):
+        with self.assertRaises(TypeError):
+            self.array + 1
+        with self.assertRaises(ZeroDivisionError):
+            self.array / 0
+
+    def test_nestedPhasors(self):
+        a, b, c = PhasorPD(1, 0), PhasorPD(1, -120), PhasorRe(1j)
+        array = PhasorArray([[a, b, c], [c, b, 2]])
+        self.assertEqual(array.shape, (2, 3))
+        np.testing.assert_allclose(array.complex, [[a.complex, b.complex, 1j], [1j, b.complex, 2]])
+        np.testing.assert_allclose(PhasorArray(np.array([a, c], dtype=object)).complex, [1, 1j])
+
+    def test_numpyScalarOperands(self):
+        np.testing.assert_allclose((self.array * np.int64(2)).complex, 2 * self.values)
+        np.testing.assert_allclose((np.float32(0.5) * self.array).complex, 0.5 * self.values)
+        np.testing.assert_allclose((self.array / np.complex128(1j)).complex, self.values / 1j)
+
+    def test_zeroDimensional(self):
+        array = PhasorArray(PhasorPD(1, 30))
+        self.assertEqual(array.shape, ())
+        self.assertAlmostEqual(array[()].degree, 30)
+        with self.assertRaisesRegex(TypeError, "Unsupported operation"):
+            len(array)
+        with self.assertRaisesRegex(TypeError, "Unsupported operation"):
+            iter(array)
+
+    def test_viewsShareBuffer(self):
+        self.assertTrue(np.shares_memory(toRec(self.array).complex, self.array.complex))
+        self.assertEqual(toRad(self.array).form, "PR")
+        self.assertIsInstance(toRec(self.array)[0], PhasorRe)
+        self.assertIsInstance(self.array[1:], PhasorArray)
+        self.assertAlmostEqual(self.array[2].complex, 3-4j)
+
+    def test_pickle(self):
+        restored = pickle.loads(pickle.dumps(toRad(self.array)))
+        np.testing.assert_array_equal(restored.complex, self.array.complex)
+        self.assertEqual((restored.roundOff, restored.form), (self.array.roundOff, "PR"))
@@ -0,0 +1,177 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import asyncio
+import tempfile
+import time
+import numpy as np
+import plotly.graph_objects as go
+from unittest import TestCase, mock, skipUnless
+from Phasor.plot import *
+
+# Wall-clock budgets depend on the machine: default runs allow SLACK times the budget, the exact budgets run when asked for
+timed = skipUnless(os.environ.get("PHASOR_TIMING_TESTS"), "set PHASOR_TIMING_TESTS to check the exact time budgets")
+SLACK = 5
+
+class test_plot(TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(go.Figure, "show")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        rng = np.random.default_rng(4)
+        self.array = PhasorArray(rng.normal(size=100000) + 1j * rng.normal(size=100000))
+
+    def test_scalarPhasorsShareFigure(self):
+        plot = Plot(PhasorPD(1, 30), PhasorRe(1j))
+        self.assertEqual(len(plot.fig.data), 2)
+
+    def test_sequenceObjects(self):
+        a, b, c = PhasorPD(1, 0), PhasorPD(1, 100), PhasorPD(2, 200)
+        self.assertEqual(len(Plot(UtoSC(a, b, c)).fig.data), 9)
+        self.assertEqual(len(Plot(SCtoU(a, b, c)).fig.data), 3)
+
+    def test_arraySingleTrace(self):
+        start = time.perf_counter()
+        plot = Plot(self.array)
+        self.assertLess(time.perf_counter() - start, 1.0 * SLACK)
+        self.assertEqual(len(plot.fig.data), 1)
+        trace = plot.fig.data[0]
+        self.assertEqual(len(trace.r), 300000)
+        self.assertAlmostEqual(trace.r[1], self.array[0].modulus)
+        self.assertTrue(np.isnan(trace.r[2]))
+
+    @timed
+    def test_arrayTimeBudget(self):
+        start = time.perf_counter()
+        Plot(self.array)
+        self.assertLess(time.perf_counter() - start, 1.0)
+
+    def test_decimationAndWebgl(self):
+        plot = Plot(self.array, maxPoints=1000, webgl=True)
+        trace = plot.fig.data[0]
+        self.assertIsInstance(trace, go.Scatterpolargl)
+        self.assertEqual(len(trace.r), 3000)
+        self.assertEqual(len(Plot(self.array, maxPoints=np.int64(7)).fig.data[0].r), 3 * 7)
+        for maxPoints in (0, -5, 2.5, True):
+            with self.assertRaises(ValueError):
+                Plot(self.array, maxPoints=maxPoints)
+
+    def test_unsupportedType(self):
+        with self.assertRaises(TypeError):
+            Plot(1)
+
+
+class test_plotReuse(TestCase):
+    def test_deferredShow(self):
+        with mock.patch.object(go.Figure, "show") as show:
+            plot = Plot(PhasorPD(1, 30), show=False)
+            show.assert_not_called()
+            plot.show()
+            show.assert_called_once()
+
+    def test_updateInPlace(self):
+        a, b, c = PhasorPD(1, 0), PhasorPD(1, 100), PhasorPD(2, 200)
+        plot = Plot(UtoSC(a, b, c), show=False)
+        traces = list(plot.fig.data)
+        plot.update(UtoSC(c, b, a))
+        self.assertEqual([id(i) for i in plot.fig.data], [id(i) for i in traces])
+        expected = UtoSC(c, b, a).allComponents[1][0]
+        self.assertAlmostEqual(plot.fig.data[3].r[1], expected.modulus)
+        with self.assertRaises(ValueError):
+            plot.update(a)
+
+    def test_exportHTML(self):
+        plots = [Plot(PhasorPD(i, 10 * i), show=False) for i in range(1, 4)]
+        with tempfile.TemporaryDirectory() as directory:
+            paths = [os.path.join(directory, f"{i}.html") for i in range(3)]
+            for workers in (0, 2):
+                timings = exportHTML(plots, paths, workers=workers, includePlotlyJS="cdn")
+                self.assertEqual([i[0] for i in timings], paths)
+                self.assertTrue(all(os.path.getsize(i) > 0 for i in paths))
+
+
+class test_livePlot(TestCase):
+    def test_rendersInPlace(self):
+        live = LivePlot(maxRate=1e9)
+        traces = list(live.fig.data)
+        self.assertTrue(live.push(PhasorPD(230, 0), PhasorPD(230, -120), 230j))
+        self.assertEqual([id(i) for i in live.fig.data], [id(i) for i in traces])
+        self.assertAlmostEqual(live.fig.data[1].r[1], 230)
+        self.assertAlmostEqual(live.fig.data[2].theta[1], 90)
+        self.assertEqual((live.received, live.rendered, live.dropped), (1, 1, 0))
+
+    def test_coalescing(self):
+        live = LivePlot(sequence=True, maxRate=1e-9)
+        self.assertTrue(live.push([1, 1, 1]))
+        phases = PhasorArray.fromDegree(100, [[0, -120, 120]] * 5)
+        self.assertFalse(live.push(phases))
+        self.assertFalse(live.push(UtoSC(PhasorPD(1, 0), PhasorPD(1, -120), PhasorPD(1, 120))))
+        self.assertEqual((live.received, live.rendered, live.dropped), (7, 1, 5))
+        live.render()
+        self.assertEqual(len(live.fig.data), 9)
+        self.assertAlmostEqual(live.fig.data[3].r[1], 1)
+        self.assertAlmostEqual(live.fig.data[0].r[1], 0)
+        self.assertEqual(live.fig.data[4].name, "B1")
+
+    def test_heldBackFrameIsRendered(self):
+        live = LivePlot(maxRate=20)
+        live.push(1, 1, 1)
+        self.assertFalse(live.push(PhasorPD(5, 0), 2, 3))
+        deadline = time.perf_counter() + 2
+        while live.rendered < 2 and time.perf_counter() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(live.rendered, 2)
+        self.assertAlmostEqual(live.fig.data[0].r[1], 5)
+
+    async def pushFromLoop(self, live):
+        live.push(1, 1, 1)
+        live.push(7, 2, 3)
+        await asyncio.sleep(0.2)
+
+    def test_heldBackFrameOnEventLoop(self):
+        live = LivePlot(maxRate=20)
+        asyncio.run(self.pushFromLoop(live))
+        self.assertEqual(live.rendered, 2)
+        self.assertAlmostEqual(live.fig.data[0].r[1], 7)
+
+    def test_invalidFrame(self):
+        with self.assertRaises(ValueError):
+            LivePlot().push(1, 2)
+
+
+class test_animation(TestCase):
+    def setUp(self):
+        t = np.arange(3000)[:, None] * 0.01
+        self.phases = PhasorArray.fromRadian(100 + t, t + np.array([0, -2.0944, 2.0944]))
+
+    def test_subsampledFrames(self):
+        start = time.perf_counter()
+        plot = Plot(show=False).animate(self.phases, maxFrames=200)
+        self.assertLess(time.perf_counter() - start, 2.0 * SLACK)
+        self.assertEqual(len(plot.fig.frames), 200)
+        self.assertEqual(len(plot.fig.data), 3)
+        last = plot.fig.frames[-1].data[0]
+        self.assertAlmostEqual(last.r[1], self.phases[-1, 0].modulus)
+
+    @timed
+    def test_animationTimeBudget(self):
+        start = time.perf_counter()
+        Plot(show=False).animate(self.phases, maxFrames=200)
+        self.assertLess(time.perf_counter() - start, 2.0)
+
+    def test_sequenceFromUtoSC(self):
+        results = [UtoSC(*(PhasorRe(complex(i)) for i in row)) for row in self.phases.complex[:20]]
+        plot = Plot(show=False).animate(results, maxFrames=None)
+        self.assertEqual(len(plot.fig.frames), 20)
+        self.assertEqual(len(plot.fig.data), 9)
+        self.assertAlmostEqual(plot.fig.frames[5].data[3].r[1], results[5].allComponents[1][0].modulus)
+
+    def test_emptySeries(self):
+        for series in (np.empty((0, 3)), [], PhasorArray(np.empty(0)), PhasorPD(1, 30)):
+            with self.assertRaises(ValueError):
+                Plot(show=False).animate(series)
+
+    def test_framesAreLazy(self):
+        frames = animationFrames(np.ones((10**6, 3)), np.zeros((10**6, 3)))
+        self.assertEqual(next(frames)["data"][0]["r"], (0, 1.0))
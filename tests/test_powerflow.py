@@ -0,0 +1,77 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import numpy as np
+from Phasor.network import Network
+from Phasor.phasor import *
+from Phasor.powerflow import *
+from unittest import TestCase
+
+def meshedCase(buses, seed = 0):
+    """Return a network with a spanning tree plus some loops, and load and generation injections."""
+    rng = np.random.default_rng(seed)
+    network = Network(buses)
+    parents = rng.integers(0, np.arange(1, buses))
+    network.addBranches(np.arange(1, buses), parents, rng.uniform(0.002, 0.01, buses - 1) * (1+5j))
+    loops = buses // 5
+    network.addBranches(rng.integers(0, buses, loops), rng.integers(0, buses, loops), rng.uniform(0.01, 0.05, loops) * (1+5j))
+    network.addBranches(np.arange(buses), np.full(buses, -1), np.full(buses, -50j))
+    types = np.full(buses, PQ)
+    types[0] = SLACK
+    types[rng.choice(np.arange(1, buses), buses // 20, replace=False)] = PV
+    power = -(rng.uniform(0.0, 0.02, buses) + 1j * rng.uniform(0.0, 0.01, buses))
+    power[types == PV] += 0.05
+    return network, types, power
+
+class test_powerflow(TestCase):
+    def test_twoBus(self):
+        # Slack at 1 pu feeding a load through 0.1j pu: P = V2 sin(d) / X, Q = (V2 cos(d) - V2^2) / X
+        network = Network(2)
+        network.addBranch(0, 1, 0.1j)
+        solver = PowerFlow(network, [SLACK, PQ], voltage=[1, 1])
+        voltages = solver.solve([0, -(0.5+0.2j)])
+        self.assertIsInstance(voltages, PhasorArray)
+        v = voltages.complex[1]
+        self.assertAlmostEqual(abs(v) * np.sin(-np.angle(v)) / 0.1, 0.5)
+        self.assertAlmostEqual((abs(v) * np.cos(np.angle(v)) - abs(v) ** 2) / 0.1, 0.2)
+        self.assertLessEqual(solver.iterations, 6)
+
+    def test_meshed(self):
+        network, types, power = meshedCase(300)
+        setpoints = np.where(types == PQ, 1, 1.02)
+        solver = PowerFlow(network, types, voltage=setpoints, tolerance=1e-10)
+        voltages = solver.solve(power)
+        flat = solver.iterations
+        injected = solver.injections(voltages)
+        np.testing.assert_allclose(injected[types == PQ], power[types == PQ], atol=1e-9)
+        np.testing.assert_allclose(injected.real[types == PV], power.real[types == PV], atol=1e-9)
+        np.testing.assert_allclose(voltages.modulus[types != PQ], 1.02)
+        # A warm start from the solution of a nearby operating point needs fewer iterations
+        solver.solve(power * 1.01, start=voltages)
+        self.assertLess(solver.iterations, flat)
+
+    def test_batch(self):
+        network, types, power = meshedCase(100, 1)
+        solver = PowerFlow(network, types)
+        powers = power * np.linspace(0.8, 1.2, 6)[:, None]
+        voltages = solver.solveBatch(powers)
+        self.assertEqual(voltages.shape, (6, 100))
+        self.assertEqual(solver.iterations.shape, (6,))
+        for row, snapshot in zip(voltages.complex, powers):
+            np.testing.assert_allclose(solver.injections(row)[types == PQ], snapshot[types == PQ], atol=1e-7)
+        pooled = solver.solveBatch(powers, workers=2)
+        np.testing.assert_allclose(pooled.complex, voltages.complex, atol=1e-7)
+
+    def test_errors(self):
+        network = Network(2)
+        network.addBranch(0, 1, 0.1j)
+        with self.assertRaises(ValueError):
+            PowerFlow(network, [PQ, PQ])
+        with self.assertRaises(ValueError):
+            PowerFlow(network, [SLACK])
+        solver = PowerFlow(network, [SLACK, PQ], maxIterations=10)
+        with self.assertRaises(ValueError):
+            solver.solve([0, 0, 0])
+        with self.assertRaises(RuntimeError):
+            solver.solve([0, -20])
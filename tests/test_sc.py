@@ -0,0 +1,84 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import pickle
+import numpy as np
+from Phasor.sc import *
+from unittest import TestCase
+
+class test_utosc(TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.phases = rng.normal(size=(50, 3)) + 1j * rng.normal(size=(50, 3))
+
+    def test_batchMatchesUtoSC(self):
+        components = batchUtoSC(self.phases)
+        for sample, expected in zip(self.phases[:5], components[:5]):
+            single = UtoSC(*(PhasorRe(complex(i)) for i in sample))
+            np.testing.assert_allclose([i.complex for i in single.components], expected)
+
+    def test_balancedSystem(self):
+        phases = PhasorArray.fromDegree([100, 100, 100], [0, -120, 120])
+        components = batchUtoSC(phases)
+        np.testing.assert_allclose(components, [0, 100, 0], atol=1e-9)
+
+    def test_rotatedComponentsRebuildPhases(self):
+        components = batchUtoSC(self.phases)
+        rotated = rotatedComponents(components)
+        self.assertEqual(rotated.shape, (50, 3, 3))
+        np.testing.assert_allclose(rotated.sum(axis=1), self.phases)
+
+    def test_outBuffer(self):
+        out = np.empty((50, 3), dtype=np.complex128)
+        self.assertIs(batchUtoSC(self.phases, out=out), out)
+
+    def test_compactPickle(self):
+        single = UtoSC(PhasorPD(1, 0), PhasorPD(2, 130), PhasorRe(0.5+1j), 3)
+        restored = pickle.loads(pickle.dumps(single))
+        self.assertEqual(str(restored), str(single))
+        self.assertEqual([i.complex for i in restored.threePhasors], [i.complex for i in single.threePhasors])
+        single.toRadList()
+        restored = pickle.loads(pickle.dumps(single))
+        self.assertTrue(all(isinstance(i, PhasorPR) for i in restored.components))
+        self.assertEqual(restored.roundOff, 3)
+
+    def test_shapeError(self):
+        with self.assertRaises(ValueError):
+            batchUtoSC(np.zeros((4, 2)))
+
+    def test_unsupportedArgument(self):
+        with self.assertRaises(TypeError):
+            UtoSC(1, PhasorRe(1), PhasorRe(1))
+
+
+class test_sctou(TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.components = rng.normal(size=(50, 3)) + 1j * rng.normal(size=(50, 3))
+
+    def test_roundTrip(self):
+        np.testing.assert_allclose(batchUtoSC(batchSCtoU(self.components)), self.components)
+
+    def test_batchMatchesSCtoU(self):
+        phases = batchSCtoU(self.components)
+        for sample, expected in zip(self.components[:5], phases[:5]):
+            single = SCtoU(*(PhasorRe(complex(i)) for i in sample))
+            np.testing.assert_allclose([i.complex for i in single.unbalanced], expected)
+
+    def test_outBufferViews(self):
+        out = np.empty((50, 3), dtype=np.complex128)
+        self.assertIs(batchSCtoU(self.components, out=out), out)
+        self.assertTrue(np.shares_memory(toDeg(PhasorArray(out)).complex, out))
+
+    def test_toLists(self):
+        single = SCtoU(PhasorPD(1, 0), PhasorPD(2, 30), PhasorPD(3, 60))
+        single.toRecList()
+        self.assertTrue(all(isinstance(i, PhasorRe) for i in single.unbalanced))
+
+    def test_compactPickle(self):
+        single = SCtoU(PhasorPD(1, 0), PhasorPD(2, 30), PhasorPD(3, 60))
+        single.toRecList()
+        restored = pickle.loads(pickle.dumps(single))
+        self.assertTrue(all(isinstance(i, PhasorRe) for i in restored.unbalanced))
+        self.assertEqual([i.complex for i in restored.unbalanced], [i.complex for i in single.unbalanced])
@@ -0,0 +1,65 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import tempfile
+import numpy as np
+from Phasor.sc import batchUtoSC
+from Phasor.store import PhasorStore
+from unittest import TestCase
+
+class test_phasorStore(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "phasors.phs")
+        rng = np.random.default_rng(3)
+        self.times = np.arange(100) / 50
+        self.phasors = rng.normal(size=(100, 3)) + 1j * rng.normal(size=(100, 3))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_appendAndRead(self):
+        with PhasorStore(self.path) as store:
+            store.append(self.times[:60], self.phasors[:60])
+            store.append(self.times[60:], self.phasors[60:])
+        with PhasorStore(self.path, mode="r") as store:
+            self.assertEqual(len(store), 100)
+            times, phasors = store.read()
+            np.testing.assert_array_equal(times, self.times)
+            np.testing.assert_array_equal(phasors, self.phasors)
+            self.assertIsInstance(phasors.base, np.memmap)
+            np.testing.assert_allclose(batchUtoSC(phasors), batchUtoSC(self.phasors))
+
+    def test_timeRange(self):
+        with PhasorStore(self.path, mode="w") as store:
+            store.append(self.times, self.phasors)
+            times, phasors = store.read(0.5, 1.0)
+            np.testing.assert_array_equal(times, self.times[25:50])
+            np.testing.assert_array_equal(phasors, self.phasors[25:50])
+            self.assertEqual(store.indexRange(5.0), (100, 100))
+
+    def test_complex64(self):
+        with PhasorStore(self.path, channels=2, dtype=np.complex64) as store:
+            store.append([0.0, 1.0], [[1j, 2], [3, 4j]])
+        with PhasorStore(self.path, mode="r") as store:
+            self.assertEqual(store.channels, 2)
+            self.assertEqual(store.phasors.dtype, np.complex64)
+
+    def test_errors(self):
+        with PhasorStore(self.path) as store:
+            store.append(self.times[10:], self.phasors[10:])
+            with self.assertRaises(ValueError):
+                store.append(self.times[:10], self.phasors[:10])
+            with self.assertRaises(ValueError):
+                store.append(self.times, self.phasors[:, :2])
+        with PhasorStore(self.path, mode="r") as store:
+            with self.assertRaises(ValueError):
+                store.append(self.times, self.phasors)
+
+    def test_notAStore(self):
+        for content in (b"", b"PHASOR", b"x" * 100):
+            with open(self.path, "wb") as file:
+                file.write(content)
+            with self.assertRaises(ValueError):
+                PhasorStore(self.path, mode="r")
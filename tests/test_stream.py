@@ -0,0 +1,43 @@
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import numpy as np
+from Phasor.sc import batchUtoSC
+from Phasor.stream import SCStream
+from unittest import TestCase
+
+class test_scStream(TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(2)
+        self.phases = rng.normal(size=(1000, 3)) + 1j * rng.normal(size=(1000, 3))
+        self.sizes = [1, 7, 300, 64, 128, 500]
+
+    def chunks(self):
+        start = 0
+        for size in self.sizes:
+            yield self.phases[start:start + size]
+            start += size
+
+    def test_rechunksAndMatchesBatch(self):
+        stream = SCStream(self.chunks(), chunkSize=128)
+        result = list(stream)
+        self.assertEqual([len(i) for i in result], [128] * 7 + [104])
+        np.testing.assert_allclose(np.concatenate(result), batchUtoSC(self.phases))
+        self.assertEqual(stream.frames, 1000)
+        self.assertEqual(stream.batches, 8)
+        self.assertGreater(stream.throughput, 0)
+
+    def test_reuseBuffer(self):
+        stream = iter(SCStream(self.chunks(), chunkSize=256, reuseBuffer=True))
+        first = next(stream)
+        second = next(stream)
+        self.assertTrue(np.shares_memory(first, second))
+
+    def test_chunkSize(self):
+        for chunkSize in (0, -1, 2.5, "8"):
+            with self.assertRaises(ValueError):
+                SCStream(self.chunks(), chunkSize=chunkSize)
+        stream = SCStream(self.chunks(), chunkSize=np.int64(self.phases.shape[0] // 4))
+        self.assertEqual(stream.chunkSize, 250)
+        self.assertEqual([len(i) for i in stream], [250] * 4)